@@ -19,7 +19,7 @@ sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..'
 
 
 from backend.base import Base
-from backend.models import Student, Company, Internship, Application, Skill
+from backend.models import Student, Company, Internship, Application, Skill, InternshipSkill, ChangeVersion, StatsCounter, StatsRollup
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -35,6 +35,18 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Leave the full-text search objects (see backend.search) to their own
+    migration: they are created with raw DDL and are not in the models, so
+    autogenerate would otherwise drop them."""
+    if type_ == "table" and name.startswith("internships_fts"):
+        return False
+    if name in ("search_vector", "ix_internships_search_vector"):
+        return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -59,6 +71,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -80,7 +93,8 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
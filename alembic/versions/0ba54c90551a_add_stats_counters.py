@@ -0,0 +1,36 @@
+"""Add stats_counters for write-maintained dashboards
+
+Revision ID: 0ba54c90551a
+Revises: 0eddb01e3cdc
+Create Date: 2026-10-19 17:26:51.340772
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0ba54c90551a'
+down_revision: Union[str, Sequence[str], None] = '0eddb01e3cdc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Left empty: the server builds the counters from the base tables on its
+    # first start (backend.counters.ensure_counters)
+    op.create_table('stats_counters',
+    sa.Column('scope', sa.String(), nullable=False),
+    sa.Column('scope_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('value', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('scope', 'scope_id', 'name')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('stats_counters')
@@ -0,0 +1,36 @@
+"""Track stale and versioned application scores
+
+Revision ID: 0eddb01e3cdc
+Revises: 9400478b96a4
+Create Date: 2026-10-19 16:03:12.664019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0eddb01e3cdc'
+down_revision: Union[str, Sequence[str], None] = '9400478b96a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('applications', sa.Column('score_stale', sa.Boolean(), nullable=False, server_default=sa.false()))
+    op.add_column('applications', sa.Column('score_version', sa.Integer(), nullable=True))
+    # Existing scores have no version; the server re-scores them at startup
+    op.create_index(
+        'ix_applications_score_stale', 'applications', ['score_stale'], unique=False,
+        sqlite_where=sa.text('score_stale = 1'), postgresql_where=sa.text('score_stale = true'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_applications_score_stale', table_name='applications')
+    op.drop_column('applications', 'score_version')
+    op.drop_column('applications', 'score_stale')
@@ -0,0 +1,34 @@
+"""Add decided_at to applications
+
+Revision ID: 2461549ff340
+Revises: 4f97fae281d2
+Create Date: 2026-10-19 21:04:51.302117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2461549ff340'
+down_revision: Union[str, Sequence[str], None] = '4f97fae281d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('applications', sa.Column('decided_at', sa.DateTime(), nullable=True))
+    # Best available estimate for existing decisions: updated_at, which any
+    # later write (e.g. a rescore) may already have moved
+    op.execute(
+        "UPDATE applications SET decided_at = updated_at "
+        "WHERE status IN ('accepted', 'rejected')"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('applications', 'decided_at')
@@ -0,0 +1,41 @@
+"""Add change_versions for conditional GET
+
+Revision ID: 2898fa04680c
+Revises: 7ca87493ba1a
+Create Date: 2026-10-19 13:05:44.118920
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2898fa04680c'
+down_revision: Union[str, Sequence[str], None] = '7ca87493ba1a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRACKED_TABLES = ('students', 'companies', 'internships', 'applications', 'skills')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    change_versions = op.create_table('change_versions',
+    sa.Column('table_name', sa.String(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('table_name')
+    )
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    op.bulk_insert(change_versions, [
+        {'table_name': name, 'version': 0, 'updated_at': now} for name in TRACKED_TABLES
+    ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('change_versions')
@@ -0,0 +1,30 @@
+"""Add password_hash to students and companies
+
+Revision ID: 4f97fae281d2
+Revises: ecfa2aa12b89
+Create Date: 2026-10-19 19:37:20.114583
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f97fae281d2'
+down_revision: Union[str, Sequence[str], None] = 'ecfa2aa12b89'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('students', sa.Column('password_hash', sa.String(), nullable=True))
+    op.add_column('companies', sa.Column('password_hash', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('companies', 'password_hash')
+    op.drop_column('students', 'password_hash')
@@ -0,0 +1,43 @@
+"""Unique application per student and internship
+
+Revision ID: 6fb08d8531f7
+Revises: f8ebcfd202dc
+Create Date: 2026-10-19 14:48:05.713360
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6fb08d8531f7'
+down_revision: Union[str, Sequence[str], None] = 'f8ebcfd202dc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the earliest application of any duplicated pair
+    op.execute(
+        """
+        DELETE FROM applications
+        WHERE id NOT IN (
+            SELECT MIN(id) FROM applications GROUP BY student_id, internship_id
+        )
+        """
+    )
+    op.create_index(
+        'uq_applications_student_id_internship_id', 'applications',
+        ['student_id', 'internship_id'], unique=True,
+    )
+    # Covered by the leading column of the unique index
+    op.drop_index(op.f('ix_applications_student_id'), table_name='applications')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_applications_student_id'), 'applications', ['student_id'], unique=False)
+    op.drop_index('uq_applications_student_id_internship_id', table_name='applications')
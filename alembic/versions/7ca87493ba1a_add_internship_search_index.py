@@ -0,0 +1,96 @@
+"""Add internship full-text search index
+
+Revision ID: 7ca87493ba1a
+Revises: dcaac1d22254
+Create Date: 2026-10-19 12:18:06.730552
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7ca87493ba1a'
+down_revision: Union[str, Sequence[str], None] = 'dcaac1d22254'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE internships_fts USING fts5(
+        title, description,
+        content='internships', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER internships_fts_ai AFTER INSERT ON internships BEGIN
+        INSERT INTO internships_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER internships_fts_ad AFTER DELETE ON internships BEGIN
+        INSERT INTO internships_fts(internships_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER internships_fts_au AFTER UPDATE OF title, description ON internships BEGIN
+        INSERT INTO internships_fts(internships_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO internships_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    "INSERT INTO internships_fts(internships_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS internships_fts_au",
+    "DROP TRIGGER IF EXISTS internships_fts_ad",
+    "DROP TRIGGER IF EXISTS internships_fts_ai",
+    "DROP TABLE IF EXISTS internships_fts",
+]
+
+POSTGRES_UPGRADE = [
+    """
+    ALTER TABLE internships ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX ix_internships_search_vector ON internships USING GIN (search_vector)",
+]
+
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_internships_search_vector",
+    "ALTER TABLE internships DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def _run(statements) -> None:
+    for statement in statements:
+        op.execute(sa.text(statement))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        _run(SQLITE_UPGRADE)
+    elif dialect == 'postgresql':
+        _run(POSTGRES_UPGRADE)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        _run(SQLITE_DOWNGRADE)
+    elif dialect == 'postgresql':
+        _run(POSTGRES_DOWNGRADE)
@@ -0,0 +1,33 @@
+"""Index internships by company for company-scoped stats and listings
+
+Revision ID: 8545502da5f5
+Revises: 8c5ae85297ea
+Create Date: 2026-10-19 18:41:37.205913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8545502da5f5'
+down_revision: Union[str, Sequence[str], None] = '8c5ae85297ea'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # company -> internships; internships -> applications already goes
+    # through the leading internship_id of ix_applications_internship_score
+    op.create_index(
+        'ix_internships_company_id_is_active', 'internships',
+        ['company_id', 'is_active'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_internships_company_id_is_active', table_name='internships')
@@ -0,0 +1,49 @@
+"""Add created_at/updated_at and stats_rollups for time-series stats
+
+Revision ID: 8c5ae85297ea
+Revises: 0ba54c90551a
+Create Date: 2026-10-19 18:04:12.518306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c5ae85297ea'
+down_revision: Union[str, Sequence[str], None] = '0ba54c90551a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('applications', 'internships')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows keep NULL timestamps: their creation time is unknown, and
+    # the rollups (built on the server's first start by
+    # backend.rollups.ensure_rollups) skip them
+    for table in TABLES:
+        op.add_column(table, sa.Column('created_at', sa.DateTime(), nullable=True))
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(), nullable=True))
+        op.create_index(op.f(f'ix_{table}_created_at'), table, ['created_at'], unique=False)
+        op.create_index(op.f(f'ix_{table}_updated_at'), table, ['updated_at'], unique=False)
+    op.create_table('stats_rollups',
+    sa.Column('metric', sa.String(), nullable=False),
+    sa.Column('bucket', sa.String(), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(), nullable=False),
+    sa.Column('value', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('metric', 'bucket', 'bucket_start')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('stats_rollups')
+    for table in TABLES:
+        op.drop_index(op.f(f'ix_{table}_updated_at'), table_name=table)
+        op.drop_index(op.f(f'ix_{table}_created_at'), table_name=table)
+        op.drop_column(table, 'updated_at')
+        op.drop_column(table, 'created_at')
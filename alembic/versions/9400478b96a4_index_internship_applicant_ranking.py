@@ -0,0 +1,48 @@
+"""Index applications for per-internship applicant ranking
+
+Revision ID: 9400478b96a4
+Revises: 6fb08d8531f7
+Create Date: 2026-10-19 15:21:44.092816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9400478b96a4'
+down_revision: Union[str, Sequence[str], None] = '6fb08d8531f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _score_desc():
+    # Routes order by match_score DESC NULLS LAST; Postgres only walks the
+    # index for that order if the index says so (SQLite already sorts NULLs
+    # last in descending order and has no NULLS clause in CREATE INDEX)
+    if op.get_bind().dialect.name == "postgresql":
+        return sa.text("match_score DESC NULLS LAST")
+    return sa.text("match_score DESC")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_applications_internship_score', 'applications',
+        ['internship_id', _score_desc(), sa.text('id DESC')], unique=False,
+    )
+    op.create_index(
+        'ix_applications_internship_status_score', 'applications',
+        ['internship_id', 'status', _score_desc(), sa.text('id DESC')], unique=False,
+    )
+    # Covered by the leading column of ix_applications_internship_score
+    op.drop_index(op.f('ix_applications_internship_id'), table_name='applications')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_applications_internship_id'), 'applications', ['internship_id'], unique=False)
+    op.drop_index('ix_applications_internship_status_score', table_name='applications')
+    op.drop_index('ix_applications_internship_score', table_name='applications')
@@ -0,0 +1,61 @@
+"""Add internship_skills association
+
+Revision ID: afc28190897e
+Revises: f2681bb7482b
+Create Date: 2026-10-19 11:02:17.884310
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'afc28190897e'
+down_revision: Union[str, Sequence[str], None] = 'f2681bb7482b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('internship_skills',
+    sa.Column('internship_id', sa.Integer(), nullable=False),
+    sa.Column('skill_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['internship_id'], ['internships.id'], ),
+    sa.ForeignKeyConstraint(['skill_id'], ['skills.id'], ),
+    sa.PrimaryKeyConstraint('internship_id', 'skill_id')
+    )
+    op.create_index('ix_internship_skills_skill_id_internship_id', 'internship_skills', ['skill_id', 'internship_id'], unique=False)
+
+    # Backfill from the required_skills JSON column
+    conn = op.get_bind()
+    skills = sa.table('skills', sa.column('id', sa.Integer), sa.column('name', sa.String))
+    links = sa.table('internship_skills', sa.column('internship_id', sa.Integer), sa.column('skill_id', sa.Integer))
+
+    skill_ids = {name: id_ for id_, name in conn.execute(sa.select(skills.c.id, skills.c.name))}
+    rows = []
+    for internship_id, required in conn.execute(sa.text('SELECT id, required_skills FROM internships')):
+        if isinstance(required, str):
+            required = json.loads(required)
+        names = []
+        for name in required or []:
+            name = (name or '').strip().lower()
+            if name and name not in names:
+                names.append(name)
+        for name in names:
+            if name not in skill_ids:
+                skill_ids[name] = conn.execute(
+                    skills.insert().values(name=name).returning(skills.c.id)
+                ).scalar_one()
+            rows.append({'internship_id': internship_id, 'skill_id': skill_ids[name]})
+    if rows:
+        op.bulk_insert(links, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_internship_skills_skill_id_internship_id', table_name='internship_skills')
+    op.drop_table('internship_skills')
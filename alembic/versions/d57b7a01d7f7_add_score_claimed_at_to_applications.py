@@ -0,0 +1,28 @@
+"""Add score_claimed_at to applications
+
+Revision ID: d57b7a01d7f7
+Revises: 2461549ff340
+Create Date: 2026-10-19 21:31:07.846120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd57b7a01d7f7'
+down_revision: Union[str, Sequence[str], None] = '2461549ff340'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('applications', sa.Column('score_claimed_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('applications', 'score_claimed_at')
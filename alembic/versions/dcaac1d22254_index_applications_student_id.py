@@ -0,0 +1,28 @@
+"""Index applications.student_id for keyset paging
+
+Revision ID: dcaac1d22254
+Revises: afc28190897e
+Create Date: 2026-10-19 11:40:53.201947
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dcaac1d22254'
+down_revision: Union[str, Sequence[str], None] = 'afc28190897e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_applications_student_id'), 'applications', ['student_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_applications_student_id'), table_name='applications')
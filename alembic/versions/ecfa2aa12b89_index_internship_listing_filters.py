@@ -0,0 +1,38 @@
+"""Index the remaining listing filters
+
+Revision ID: ecfa2aa12b89
+Revises: 8545502da5f5
+Create Date: 2026-10-19 19:02:55.631840
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ecfa2aa12b89'
+down_revision: Union[str, Sequence[str], None] = '8545502da5f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # applications.student_id and .internship_id already lead
+    # uq_applications_student_id_internship_id and ix_applications_internship_score;
+    # status leads ix_applications_status_match_score, which cannot return
+    # a status in id order
+    op.create_index('ix_applications_status_id', 'applications', ['status', 'id'], unique=False)
+    op.create_index('ix_internships_is_active', 'internships', ['is_active'], unique=False)
+    op.create_index(
+        'ix_internships_domain_is_active', 'internships', ['domain', 'is_active'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_internships_domain_is_active', table_name='internships')
+    op.drop_index('ix_internships_is_active', table_name='internships')
+    op.drop_index('ix_applications_status_id', table_name='applications')
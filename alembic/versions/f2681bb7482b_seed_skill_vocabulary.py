@@ -0,0 +1,74 @@
+"""Seed skill vocabulary
+
+Revision ID: f2681bb7482b
+Revises: adc2a8a32b74
+Create Date: 2026-10-19 10:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2681bb7482b'
+down_revision: Union[str, Sequence[str], None] = 'adc2a8a32b74'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Snapshot of the vocabulary at the time of this revision, so the result
+# does not depend on the application code that runs it
+SEED_SKILLS = [
+    ('python', 'language'), ('java', 'language'), ('javascript', 'language'),
+    ('typescript', 'language'), ('c++', 'language'), ('c#', 'language'),
+    ('golang', 'language'), ('rust', 'language'), ('kotlin', 'language'),
+    ('swift', 'language'), ('php', 'language'), ('ruby', 'language'),
+    ('matlab', 'language'), ('scala', 'language'), ('sql', 'language'),
+    ('bash', 'language'), ('html', 'language'), ('css', 'language'),
+    ('react', 'framework'), ('next.js', 'framework'), ('node.js', 'framework'),
+    ('angular', 'framework'), ('vue', 'framework'), ('django', 'framework'),
+    ('flask', 'framework'), ('fastapi', 'framework'), ('spring boot', 'framework'),
+    ('express', 'framework'), ('tailwind css', 'framework'), ('flutter', 'framework'),
+    ('react native', 'framework'), ('android', 'framework'), ('ios', 'framework'),
+    ('rest api', 'framework'), ('graphql', 'framework'), ('machine learning', 'data'),
+    ('deep learning', 'data'), ('data analysis', 'data'), ('data science', 'data'),
+    ('data visualization', 'data'), ('natural language processing', 'data'),
+    ('computer vision', 'data'), ('statistics', 'data'), ('pandas', 'data'),
+    ('numpy', 'data'), ('scikit-learn', 'data'), ('tensorflow', 'data'),
+    ('pytorch', 'data'), ('keras', 'data'), ('spacy', 'data'), ('power bi', 'data'),
+    ('tableau', 'data'), ('excel', 'data'), ('postgresql', 'database'),
+    ('mysql', 'database'), ('sqlite', 'database'), ('mongodb', 'database'),
+    ('redis', 'database'), ('git', 'tools'), ('github', 'tools'), ('docker', 'tools'),
+    ('kubernetes', 'tools'), ('linux', 'tools'), ('aws', 'tools'), ('azure', 'tools'),
+    ('google cloud', 'tools'), ('ci/cd', 'tools'), ('jira', 'tools'),
+    ('figma', 'tools'), ('cybersecurity', 'other'), ('networking', 'other'),
+    ('embedded systems', 'other'), ('ui/ux design', 'other'),
+    ('project management', 'other'), ('agile', 'other'), ('communication', 'soft'),
+    ('teamwork', 'soft'), ('leadership', 'soft'), ('problem solving', 'soft'),
+]
+
+skills = sa.table(
+    'skills',
+    sa.column('name', sa.String),
+    sa.column('category', sa.String),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    existing = {name for (name,) in conn.execute(sa.select(skills.c.name))}
+    rows = [
+        {'name': name, 'category': category}
+        for name, category in SEED_SKILLS
+        if name not in existing
+    ]
+    if rows:
+        op.bulk_insert(skills, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(skills.delete().where(skills.c.name.in_([name for name, _ in SEED_SKILLS])))
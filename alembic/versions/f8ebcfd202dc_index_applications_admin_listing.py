@@ -0,0 +1,32 @@
+"""Index applications for the filtered admin listing
+
+Revision ID: f8ebcfd202dc
+Revises: 2898fa04680c
+Create Date: 2026-10-19 14:12:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8ebcfd202dc'
+down_revision: Union[str, Sequence[str], None] = '2898fa04680c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_applications_internship_id'), 'applications', ['internship_id'], unique=False)
+    op.create_index('ix_applications_status_match_score', 'applications', ['status', 'match_score'], unique=False)
+    op.create_index('ix_applications_match_score', 'applications', ['match_score'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_applications_match_score', table_name='applications')
+    op.drop_index('ix_applications_status_match_score', table_name='applications')
+    op.drop_index(op.f('ix_applications_internship_id'), table_name='applications')
@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -15,6 +16,10 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+def utcnow() -> datetime:
+    """Naive UTC timestamp, the form every DateTime column stores."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 # Dependency to get DB session
 def get_db():
     db = SessionLocal()
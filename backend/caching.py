@@ -0,0 +1,128 @@
+import hashlib
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Optional
+
+from fastapi import Request, Response
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.orm import Session
+
+from backend.base import SessionLocal, utcnow
+from backend.models import ChangeVersion
+
+# ---------------------------------------------------------------------------
+# Conditional GET
+#
+# Every ORM write bumps a per-table version in change_versions inside the
+# same transaction. Read routes derive their ETag / Last-Modified from the
+# versions of the tables they read, so a revalidation costs one primary-key
+# lookup and answers 304 without running the route's own query.
+# ---------------------------------------------------------------------------
+
+TRACKED_TABLES = ("students", "companies", "internships", "applications", "skills")
+CACHE_CONTROL = "private, no-cache"
+
+
+def ensure_versions(db: Optional[Session] = None):
+    """Create the version rows for tracked tables that do not have one yet."""
+    own_session = db is None
+    db = db or SessionLocal()
+    try:
+        existing = {name for (name,) in db.query(ChangeVersion.table_name)}
+        for name in TRACKED_TABLES:
+            if name not in existing:
+                db.add(ChangeVersion(table_name=name, version=0, updated_at=utcnow()))
+        db.commit()
+    finally:
+        if own_session:
+            db.close()
+
+
+def bump_versions(connection, tables: Iterable[str]):
+    tables = sorted(set(tables) & set(TRACKED_TABLES))
+    if not tables:
+        return
+    now = utcnow()
+    result = connection.execute(
+        update(ChangeVersion)
+        .where(ChangeVersion.table_name.in_(tables))
+        .values(version=ChangeVersion.version + 1, updated_at=now)
+    )
+    if result.rowcount < len(tables):
+        existing = set(connection.execute(
+            select(ChangeVersion.table_name).where(ChangeVersion.table_name.in_(tables))
+        ).scalars())
+        connection.execute(insert(ChangeVersion), [
+            {"table_name": name, "version": 1, "updated_at": now}
+            for name in tables if name not in existing
+        ])
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _bump_after_flush(session, flush_context):
+    # new/dirty/deleted still describe what this flush wrote
+    tables = {obj.__table__.name for obj in session.new}
+    tables |= {obj.__table__.name for obj in session.deleted}
+    tables |= {obj.__table__.name for obj in session.dirty if session.is_modified(obj)}
+    bump_versions(session.connection(), tables)
+
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _bump_on_bulk_statement(orm_execute_state):
+    # Set-based ORM statements (bulk UPDATE/DELETE/INSERT) bypass the flush
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            bump_versions(orm_execute_state.session.connection(), [mapper.local_table.name])
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    candidates = [tag.strip() for tag in header.split(",")]
+    # Weak comparison: ignore the W/ prefix on either side
+    return "*" in candidates or etag.removeprefix("W/") in {c.removeprefix("W/") for c in candidates}
+
+
+def conditional_get(
+    request: Request, response: Response, db: Session, tables: Iterable[str]
+) -> Optional[Response]:
+    """
+    Validate a GET against the versions of the tables it reads.
+
+    Returns a 304 response when the client's copy is current; otherwise sets
+    ETag, Last-Modified and Cache-Control on response and returns None so the
+    route builds the body as usual.
+    """
+    tables = sorted(set(tables))
+    rows = (
+        db.query(ChangeVersion.table_name, ChangeVersion.version, ChangeVersion.updated_at)
+        .filter(ChangeVersion.table_name.in_(tables))
+        .all()
+    )
+    fingerprint = ",".join(f"{name}:{version}" for name, version, _ in sorted(rows))
+    etag = 'W/"%s"' % hashlib.sha1(fingerprint.encode()).hexdigest()[:20]
+    updated = max((u for _, _, u in rows), default=None)
+
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if updated is not None:
+        updated = updated.replace(tzinfo=timezone.utc)
+        headers["Last-Modified"] = format_datetime(updated.replace(microsecond=0), usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, etag)
+    elif if_modified_since and updated is not None:
+        # Compared at full precision: Last-Modified drops the fraction, so a
+        # copy served earlier in the same second as the last write never
+        # validates by date (the ETag still does)
+        try:
+            not_modified = updated <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            not_modified = False
+    else:
+        not_modified = False
+
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,400 @@
+import argparse
+import logging
+import os
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, event, func, insert, inspect, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from backend.base import SessionLocal, engine
+from backend.models import Application, Company, Internship, StatsCounter, Student
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Write-maintained dashboard counters
+#
+# stats_counters holds the numbers behind /stats/ per scope: "global"
+# (scope_id 0), "company" and "student". Application counters are adjusted
+# by deltas in the same transaction as the write: ORM flushes are handled by
+# the listener below, set-based statements by count_applications /
+# tracking_applications at their call sites. Internship counters (active
+# count, per-domain counts) take deltas the same way; a domain's
+# domain_first (its lowest active internship id) is re-read with one indexed
+# MIN when the domain gains or loses an internship. reconcile() rebuilds
+# everything from the base tables and reports any drift.
+# ---------------------------------------------------------------------------
+
+GLOBAL, COMPANY, STUDENT = "global", "company", "student"
+RECONCILE_SECONDS = int(os.getenv("STATS_RECONCILE_SECONDS", "3600"))
+
+Key = Tuple[str, int, str]
+
+_counters = StatsCounter.__table__
+_APPLICATION_FIELDS = ("student_id", "internship_id", "status", "match_score")
+_INTERNSHIP_FIELDS = ("company_id", "is_active", "domain")
+
+
+def _scopes(student_id: Optional[int], company_id: Optional[int]):
+    yield GLOBAL, 0
+    if company_id is not None:
+        yield COMPANY, company_id
+    if student_id is not None:
+        yield STUDENT, student_id
+
+
+def _add_scope(
+    deltas: Dict[Key, float], sign: int, scope: str, scope_id: int, status,
+    count: int, score_sum: float, scored: int,
+):
+    deltas[(scope, scope_id, "applications")] += sign * count
+    if status:
+        deltas[(scope, scope_id, f"applications.{status}")] += sign * count
+    deltas[(scope, scope_id, "score_sum")] += sign * score_sum
+    deltas[(scope, scope_id, "scored")] += sign * scored
+
+
+def _add_group(deltas: Dict[Key, float], sign: int, student_id, company_id, status, *totals):
+    for scope, scope_id in _scopes(student_id, company_id):
+        _add_scope(deltas, sign, scope, scope_id, status, *totals)
+
+
+def upsert_add(connection, table, keys: List[str], rows: List[dict]):
+    """Add each row's value to the row of table with the same keys, creating it if missing."""
+    if not rows:
+        return
+    dialect = connection.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        stmt = (sqlite_insert if dialect == "sqlite" else postgresql_insert)(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=keys, set_={"value": table.c.value + stmt.excluded.value}
+        )
+        connection.execute(stmt, rows)
+        return
+    for row in rows:
+        result = connection.execute(
+            update(table)
+            .where(*(table.c[key] == row[key] for key in keys))
+            .values(value=table.c.value + row["value"])
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(table), row)
+
+
+def apply_deltas(connection, deltas: Dict[Key, float]):
+    """Add deltas to the stored counters, creating missing ones."""
+    upsert_add(connection, _counters, ["scope", "scope_id", "name"], [
+        {"scope": scope, "scope_id": scope_id, "name": name, "value": value}
+        for (scope, scope_id, name), value in sorted(deltas.items()) if value
+    ])
+
+
+def _application_groups(connection, *conditions):
+    return connection.execute(
+        select(
+            Application.student_id,
+            Internship.company_id,
+            Application.status,
+            func.count(),
+            func.coalesce(func.sum(Application.match_score), 0),
+            func.count(Application.match_score),
+        )
+        .select_from(Application)
+        .outerjoin(Internship, Internship.id == Application.internship_id)
+        .where(*conditions)
+        .group_by(Application.student_id, Internship.company_id, Application.status)
+    ).all()
+
+
+def count_applications(connection, ids: Iterable[int], sign: int = 1):
+    """Add (sign=1) or remove (sign=-1) the given applications' current state."""
+    ids = list(ids)
+    if not ids:
+        return
+    deltas = defaultdict(float)
+    for group in _application_groups(connection, Application.id.in_(ids)):
+        _add_group(deltas, sign, *group)
+    apply_deltas(connection, deltas)
+
+
+def count_status_change(connection, status: str, *conditions):
+    """
+    Move the applications matching conditions to status in the counters,
+    ahead of a set-based UPDATE that sets it (one GROUP BY, however many rows).
+    """
+    deltas = defaultdict(float)
+    for student_id, company_id, old_status, *totals in _application_groups(connection, *conditions):
+        _add_group(deltas, -1, student_id, company_id, old_status, *totals)
+        _add_group(deltas, 1, student_id, company_id, status, *totals)
+    apply_deltas(connection, deltas)
+
+
+@contextmanager
+def tracking_applications(db: Session, ids: Iterable[int]):
+    """Keep counters right across a set-based UPDATE of the given applications."""
+    ids = list(ids)
+    count_applications(db.connection(), ids, -1)
+    yield
+    count_applications(db.connection(), ids, 1)
+
+
+def _add_internship(deltas: Dict[Key, float], sign: int, company_id, is_active, domain):
+    if not is_active:
+        return
+    for scope, scope_id in _scopes(None, company_id):
+        deltas[(scope, scope_id, "internships.active")] += sign
+        if domain:
+            deltas[(scope, scope_id, f"domain:{domain}")] += sign
+
+
+def refresh_domain_first(connection, domains: Iterable[Tuple[Optional[int], str]]):
+    """Re-read domain_first:<name> for each (company_id, domain), globally and for the company."""
+    keys = set()
+    for company_id, domain in domains:
+        if domain:
+            keys |= {(scope, scope_id, domain) for scope, scope_id in _scopes(None, company_id)}
+    if not keys:
+        return
+    fresh = {}
+    for scope, scope_id, domain in sorted(keys):
+        first = select(func.min(Internship.id)).where(
+            Internship.domain == domain, Internship.is_active == True
+        )
+        if scope == COMPANY:
+            first = first.where(Internship.company_id == scope_id)
+        fresh[(scope, scope_id, f"domain_first:{domain}")] = connection.execute(first).scalar()
+    for scope, scope_id, name in fresh:
+        connection.execute(delete(_counters).where(
+            _counters.c.scope == scope, _counters.c.scope_id == scope_id, _counters.c.name == name
+        ))
+    _insert(connection, {key: value for key, value in fresh.items() if value is not None})
+
+
+def count_internships(connection, rows: Iterable[Tuple[Optional[int], Optional[str]]]):
+    """Count active internships written by a set-based INSERT, as (company_id, domain) pairs."""
+    rows = list(rows)
+    deltas = defaultdict(float)
+    for company_id, domain in rows:
+        _add_internship(deltas, 1, company_id, True, domain)
+    apply_deltas(connection, deltas)
+    refresh_domain_first(connection, set(rows))
+
+
+def _insert(connection, values: Dict[Key, float]):
+    if values:
+        connection.execute(insert(_counters), [
+            {"scope": scope, "scope_id": scope_id, "name": name, "value": value}
+            for (scope, scope_id, name), value in values.items()
+        ])
+
+
+def _old(obj, field):
+    history = inspect(obj).attrs[field].history
+    return history.deleted[0] if history.deleted else getattr(obj, field)
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _count_after_flush(session, flush_context):
+    deltas = defaultdict(float)
+    # (sign, student_id, internship_id, status, match_score)
+    applications = []
+    domains = set()  # (company_id, domain) whose domain_first may have moved
+    moved = []  # internships whose company changed: (id, old, new)
+
+    for sign, objects in ((1, session.new), (-1, session.deleted)):
+        for obj in objects:
+            if isinstance(obj, Application):
+                applications.append((sign, obj.student_id, obj.internship_id, obj.status, obj.match_score))
+            elif isinstance(obj, Internship):
+                state = [(getattr if sign == 1 else _old)(obj, f) for f in _INTERNSHIP_FIELDS]
+                _add_internship(deltas, sign, *state)
+                domains.add((state[0], state[2]))
+            elif isinstance(obj, Student):
+                deltas[(GLOBAL, 0, "students")] += sign
+            elif isinstance(obj, Company):
+                deltas[(GLOBAL, 0, "companies")] += sign
+
+    for obj in session.dirty:
+        if isinstance(obj, Application):
+            attrs = inspect(obj).attrs
+            if any(attrs[f].history.has_changes() for f in _APPLICATION_FIELDS):
+                applications.append((-1, *(_old(obj, f) for f in _APPLICATION_FIELDS)))
+                applications.append((1, *(getattr(obj, f) for f in _APPLICATION_FIELDS)))
+        elif isinstance(obj, Internship):
+            attrs = inspect(obj).attrs
+            if any(attrs[f].history.has_changes() for f in _INTERNSHIP_FIELDS):
+                old_company, old_active, old_domain = (_old(obj, f) for f in _INTERNSHIP_FIELDS)
+                _add_internship(deltas, -1, old_company, old_active, old_domain)
+                _add_internship(deltas, 1, obj.company_id, obj.is_active, obj.domain)
+                domains |= {(old_company, old_domain), (obj.company_id, obj.domain)}
+                if old_company != obj.company_id:
+                    moved.append((obj.id, old_company, obj.company_id))
+
+    connection = session.connection()
+    if applications:
+        internship_ids = {a[2] for a in applications if a[2] is not None}
+        company_of = dict(connection.execute(
+            select(Internship.id, Internship.company_id).where(Internship.id.in_(internship_ids))
+        ).all()) if internship_ids else {}
+        for sign, student_id, internship_id, status, score in applications:
+            _add_group(
+                deltas, sign, student_id, company_of.get(internship_id), status,
+                1, score or 0, score is not None,
+            )
+    for internship_id, old_company, new_company in moved:
+        # The internship's applications now count towards another company;
+        # global and student counters are unaffected
+        for group in connection.execute(
+            select(
+                Application.status, func.count(),
+                func.coalesce(func.sum(Application.match_score), 0), func.count(Application.match_score),
+            ).where(Application.internship_id == internship_id).group_by(Application.status)
+        ):
+            if old_company is not None:
+                _add_scope(deltas, -1, COMPANY, old_company, *group)
+            if new_company is not None:
+                _add_scope(deltas, 1, COMPANY, new_company, *group)
+    apply_deltas(connection, deltas)
+    refresh_domain_first(connection, domains)
+
+
+# ---------------------------------------------------------------------------
+# Reads
+# ---------------------------------------------------------------------------
+
+def read(db: Session, scope: str, scope_id: int = 0) -> Dict[str, float]:
+    """All counters of one scope as {name: value}."""
+    return dict(
+        db.query(StatsCounter.name, StatsCounter.value)
+        .filter(StatsCounter.scope == scope, StatsCounter.scope_id == scope_id)
+        .all()
+    )
+
+
+def top_domains(counters: Dict[str, float], limit: int = 5) -> List[dict]:
+    """Domains by active internship count; ties go to the domain listed first."""
+    domains = [
+        (name[len("domain:"):], int(value))
+        for name, value in counters.items() if name.startswith("domain:") and value
+    ]
+    domains.sort(key=lambda d: (-d[1], counters.get(f"domain_first:{d[0]}", 0)))
+    return [{"domain": d, "count": c} for d, c in domains[:limit]]
+
+
+# ---------------------------------------------------------------------------
+# Rebuild and reconciliation
+# ---------------------------------------------------------------------------
+
+def compute(connection) -> Dict[Key, float]:
+    """Every counter, computed from the base tables."""
+    deltas = defaultdict(float)
+    deltas[(GLOBAL, 0, "students")] = connection.execute(select(func.count()).select_from(Student)).scalar()
+    deltas[(GLOBAL, 0, "companies")] = connection.execute(select(func.count()).select_from(Company)).scalar()
+    for group in _application_groups(connection):
+        _add_group(deltas, 1, *group)
+    for company_id, domain, count, first in connection.execute(
+        select(Internship.company_id, Internship.domain, func.count(), func.min(Internship.id))
+        .where(Internship.is_active == True)
+        .group_by(Internship.company_id, Internship.domain)
+    ):
+        for scope, scope_id in _scopes(None, company_id):
+            deltas[(scope, scope_id, "internships.active")] += count
+            if domain:
+                deltas[(scope, scope_id, f"domain:{domain}")] += count
+                name = f"domain_first:{domain}"
+                deltas[(scope, scope_id, name)] = min(deltas.get((scope, scope_id, name)) or first, first)
+    return {key: value for key, value in deltas.items() if value}
+
+
+def _stored(connection) -> Dict[Key, float]:
+    return {
+        (scope, scope_id, name): value
+        for scope, scope_id, name, value in connection.execute(select(_counters))
+    }
+
+
+def rebuild(connection):
+    """Replace every counter with values computed from the base tables."""
+    connection.execute(delete(_counters))
+    _insert(connection, compute(connection))
+
+
+def reconcile(connection) -> List[Tuple[Key, float, float]]:
+    """
+    Rebuild the counters and return the drift found as
+    [((scope, scope_id, name), stored, actual)].
+    """
+    before = _stored(connection)
+    rebuild(connection)
+    after = _stored(connection)
+    return [
+        (key, before.get(key, 0), after.get(key, 0))
+        for key in sorted(set(before) | set(after))
+        if abs(before.get(key, 0) - after.get(key, 0)) > 1e-6
+    ]
+
+
+def ensure_counters():
+    """Build the counters once if the table is empty (first start, new database)."""
+    with engine.begin() as connection:
+        if connection.execute(select(_counters.c.name).limit(1)).first() is None:
+            rebuild(connection)
+
+
+def _reconcile_and_report():
+    with engine.begin() as connection:
+        drift = reconcile(connection)
+    for key, stored, actual in drift:
+        logger.warning("stats counter %s drifted: stored %s, actual %s", key, stored, actual)
+    return drift
+
+
+_stop = threading.Event()
+_thread = None
+
+
+def _reconcile_loop(interval: int):
+    while not _stop.wait(interval):
+        try:
+            _reconcile_and_report()
+        except Exception:
+            logger.exception("Reconciling stats counters failed")
+
+
+def start(interval: int = RECONCILE_SECONDS):
+    """Reconcile every interval seconds in a background thread (0 disables)."""
+    global _thread
+    if interval <= 0 or _thread is not None:
+        return
+    _stop.clear()
+    _thread = threading.Thread(target=_reconcile_loop, args=(interval,), name="stats-reconcile", daemon=True)
+    _thread.start()
+
+
+def shutdown():
+    global _thread
+    if _thread is not None:
+        _stop.set()
+        _thread.join(timeout=10)
+        _thread = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dashboard counter maintenance")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("reconcile", help="recompute stats_counters and report drift")
+    parser.parse_args(argv)
+
+    drift = _reconcile_and_report()
+    for (scope, scope_id, name), stored, actual in drift:
+        print(f"{scope}:{scope_id} {name}: stored {stored:g}, actual {actual:g}")
+    print(f"{len(drift)} counter(s) drifted")
+
+
+if __name__ == "__main__":
+    main()
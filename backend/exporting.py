@@ -0,0 +1,107 @@
+import csv
+import io
+import json
+from datetime import date
+from typing import Callable, List
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Query, Session
+
+from backend.base import SessionLocal
+
+# ---------------------------------------------------------------------------
+# Streaming CSV / NDJSON exports
+#
+# The stream opens its own session and walks the query with yield_per, so
+# rows are fetched and encoded in batches (a server-side cursor on Postgres)
+# and memory stays flat however many rows are exported. The request's own
+# session is not used because it may be closed before the body is sent.
+# ---------------------------------------------------------------------------
+
+EXPORT_FORMATS = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+EXPORT_BATCH_SIZE = 1000
+
+
+def _encode(value):
+    # Dates and datetimes as ISO-8601, matching the JSON routes; str() would
+    # put a space between the date and the time
+    return value.isoformat() if isinstance(value, date) else str(value)
+
+
+def _flatten(record: dict, prefix: str = "") -> dict:
+    # Nested objects become "parent.child" columns, lists join on ";" (the
+    # separator the bulk CSV import splits on)
+    flat = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, list):
+            flat[prefix + key] = ";".join(_encode(v) for v in value)
+        elif value is None or isinstance(value, (str, int, float)):
+            flat[prefix + key] = value
+        else:
+            flat[prefix + key] = _encode(value)
+    return flat
+
+
+def _csv_chunks(rows, serialize: Callable, columns: List[str]):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, restval="", extrasaction="ignore")
+    writer.writeheader()
+
+    def flush():
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    # The header goes out at once, before the first batch of rows is read
+    yield flush()
+    for count, row in enumerate(rows, 1):
+        writer.writerow(_flatten(serialize(row)))
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield flush()
+    if buffer.tell():
+        yield flush()
+
+
+def _ndjson_chunks(rows, serialize: Callable):
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(serialize(row), default=_encode))
+        if len(lines) == EXPORT_BATCH_SIZE:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def export_response(
+    build_query: Callable[[Session], Query],
+    serialize: Callable,
+    fmt: str,
+    filename: str,
+    columns: List[str],
+) -> StreamingResponse:
+    """
+    Stream the rows of build_query(session) as CSV or NDJSON.
+
+    serialize turns a row into the dict the JSON routes return; columns lists
+    the flattened keys written to the CSV header, in order.
+    """
+    def generate():
+        db = SessionLocal()
+        try:
+            rows = build_query(db).yield_per(EXPORT_BATCH_SIZE)
+            if fmt == "ndjson":
+                yield from _ndjson_chunks(rows, serialize)
+            else:
+                yield from _csv_chunks(rows, serialize, columns)
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        generate(),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
@@ -0,0 +1,141 @@
+import os
+import queue
+import subprocess
+import sys
+import threading
+from multiprocessing.connection import Connection
+from typing import Optional
+
+from backend.text_extraction import SUPPORTED_EXTENSIONS
+
+# ---------------------------------------------------------------------------
+# Sandboxed text extraction
+#
+# PDF/DOCX extraction runs in a small pool of pre-started worker processes
+# (backend.extraction_worker, a minimal entry point that loads only the
+# extraction code). Each worker caps its own address space before importing
+# it, the parent enforces a wall-clock timeout per file, and workers exit
+# after a fixed number of jobs so leaks in the parsing libraries cannot
+# accumulate. A worker that times out or dies is killed and replaced.
+# ---------------------------------------------------------------------------
+
+EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", "2"))
+EXTRACTION_TIMEOUT = float(os.getenv("EXTRACTION_TIMEOUT", "20"))
+EXTRACTION_MEMORY_MB = int(os.getenv("EXTRACTION_MEMORY_MB", "512"))
+EXTRACTION_MAX_JOBS = int(os.getenv("EXTRACTION_MAX_JOBS", "50"))
+
+
+class ExtractionError(Exception):
+    """Raised when a resume's text could not be extracted."""
+
+
+class ExtractionTimeout(ExtractionError):
+    """Raised when extraction exceeds the per-file time limit."""
+
+
+# The directory holding the backend package, for the worker's import path
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class _Worker:
+    def __init__(self, memory_limit: int, max_jobs: int):
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [_ROOT, env.get("PYTHONPATH")]))
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "backend.extraction_worker", str(memory_limit), str(max_jobs)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+        )
+        self.requests = Connection(os.dup(self.process.stdin.fileno()), readable=False)
+        self.replies = Connection(os.dup(self.process.stdout.fileno()), writable=False)
+        self.process.stdin.close()
+        self.process.stdout.close()
+        self.jobs = 0
+
+    def kill(self):
+        self.process.kill()
+        self.process.wait()
+        self.requests.close()
+        self.replies.close()
+
+
+class ExtractionPool:
+    def __init__(
+        self,
+        workers: int = EXTRACTION_WORKERS,
+        timeout: float = EXTRACTION_TIMEOUT,
+        memory_mb: int = EXTRACTION_MEMORY_MB,
+        max_jobs: int = EXTRACTION_MAX_JOBS,
+    ):
+        self.timeout = timeout
+        self.memory_limit = memory_mb * 1024 * 1024
+        self.max_jobs = max_jobs
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        for _ in range(workers):
+            self._idle.put(self._start_worker())
+
+    def _start_worker(self) -> _Worker:
+        return _Worker(self.memory_limit, self.max_jobs)
+
+    def extract(self, file_path: str) -> str:
+        """Extract text from file_path in a sandboxed worker, blocking until done."""
+        if not file_path.endswith(SUPPORTED_EXTENSIONS):
+            raise ValueError("Unsupported file type")
+
+        worker = self._idle.get()
+        healthy = False
+        try:
+            worker.requests.send(file_path)
+            if not worker.replies.poll(self.timeout):
+                raise ExtractionTimeout(
+                    f"Text extraction timed out after {self.timeout:g}s"
+                )
+            status, payload = worker.replies.recv()
+            healthy = True
+        except (EOFError, OSError):
+            raise ExtractionError("Extraction worker crashed while reading file")
+        finally:
+            if healthy:
+                worker.jobs += 1
+            if healthy and worker.jobs < self.max_jobs:
+                self._idle.put(worker)
+            else:
+                # Timed out, crashed, or due for recycling
+                worker.kill()
+                self._idle.put(self._start_worker())
+
+        if status != "ok":
+            raise ExtractionError(payload)
+        return payload
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().kill()
+            except queue.Empty:
+                return
+
+
+_pool: Optional[ExtractionPool] = None
+_lock = threading.Lock()
+
+
+def get_pool() -> ExtractionPool:
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ExtractionPool()
+        return _pool
+
+
+def extract_text(file_path: str) -> str:
+    return get_pool().extract(file_path)
+
+
+def shutdown():
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
@@ -0,0 +1,47 @@
+"""
+Entry point of one sandboxed text-extraction worker (see extraction_pool):
+
+    python -m backend.extraction_worker MEMORY_LIMIT_BYTES MAX_JOBS
+
+Started as its own interpreter rather than a multiprocessing child, which
+would re-run the server's __main__ module (the whole app, spaCy included)
+before serving a single file. The address-space cap is applied before the
+extraction code is imported. Requests arrive on stdin and results go back on
+stdout as multiprocessing.connection messages; anything the parsing libraries
+print goes to stderr.
+"""
+import os
+import sys
+
+
+def main(argv=None):
+    memory_limit, max_jobs = (int(arg) for arg in (argv or sys.argv[1:3]))
+    if memory_limit:
+        import resource
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+    from multiprocessing.connection import Connection
+
+    from backend.text_extraction import extract_text
+
+    # Keep stdout for replies only
+    reply_fd = os.dup(1)
+    os.dup2(2, 1)
+    requests = Connection(0, writable=False)
+    replies = Connection(reply_fd, readable=False)
+
+    for _ in range(max_jobs):
+        try:
+            file_path = requests.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        try:
+            replies.send(("ok", extract_text(file_path)))
+        except MemoryError:
+            replies.send(("error", "File exceeded the extraction memory limit"))
+        except Exception as e:
+            replies.send(("error", f"Could not read file: {e}"))
+
+
+if __name__ == "__main__":
+    main()
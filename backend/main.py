@@ -1,7 +1,13 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 import os
+from backend import counters, passwords, rescoring, resume_jobs, rollups
 from backend.base import engine, Base
+from backend.caching import ensure_versions
+from backend.pagination import NEXT_CURSOR_HEADER
+from backend.search import ensure_search_index
+from backend.skills import seed_skills
 from backend.routes.students import router as students_router
 from backend.routes.internships import router as internships_router
 from backend.routes.auth import router as auth_router
@@ -11,8 +17,27 @@ from backend.routes.stats import router as stats_router
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
+ensure_search_index(engine)
+seed_skills()
+ensure_versions()
+counters.ensure_counters()
+rollups.ensure_rollups()
 
-app = FastAPI(title="InternHub API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    rescoring.start()
+    counters.start()
+    rollups.start()
+    yield
+    # Stop the resume parsing and password workers and background maintenance
+    # with the server
+    resume_jobs.shutdown()
+    passwords.shutdown()
+    rescoring.shutdown()
+    counters.shutdown()
+    rollups.shutdown()
+
+app = FastAPI(title="InternHub API", version="1.0.0", lifespan=lifespan)
 
 # CORS middleware — allow frontend to communicate with backend
 app.add_middleware(
@@ -25,6 +50,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Include routers
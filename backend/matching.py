@@ -1,61 +1,95 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.preprocessing import normalize
 import numpy as np
 from backend.models import Student, Internship, Application
 from backend.base import SessionLocal
 
+# Bump whenever calculate_match_score / score_pairs change; stored scores with
+# another version are recomputed at startup
+SCORE_VERSION = 1
+
+# Attributes the score reads; editing any of them makes stored scores stale
+SCORE_INPUTS = {
+    Student: ("skills", "cgpa", "year_of_study", "preferences", "resume_url"),
+    Internship: ("required_skills", "min_cgpa", "min_year", "domain"),
+}
+
+# Smoothed idf, ln((1 + n) / (1 + df)) + 1, for a term in only one of the two
+# documents the per-pair TfidfVectorizer is fitted on (n = 2, df = 1)
+_ONE_SIDED_IDF = np.log(3 / 2) + 1
+
 def calculate_match_score(student: Student, internship: Internship) -> float:
     """
     Calculate match score between a student and an internship using weighted scoring.
     Weights: skills (35%), CGPA (25%), year of study (15%), preferences (15%), resume quality (10%).
     """
-    score = 0.0
-
-    # Skills matching using TF-IDF and cosine similarity (35%)
-    student_skills = " ".join(student.skills) if student.skills else ""
-    internship_skills = " ".join(internship.required_skills) if internship.required_skills else ""
-
-    if student_skills and internship_skills:
-        vectorizer = TfidfVectorizer()
-        try:
-            tfidf_matrix = vectorizer.fit_transform([student_skills, internship_skills])
-            skills_similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            score += skills_similarity * 0.35
-        except ValueError:
-             # Can happen if vocabulary is empty
-             pass
-
-    # CGPA matching (25%)
-    # Full points if CGPA is above minimum
-    if student.cgpa and internship.min_cgpa:
-        if student.cgpa >= internship.min_cgpa:
-            score += 0.25
-        else:
-            # Partial score if close
-            ratio = student.cgpa / internship.min_cgpa
-            if ratio >= 0.8: # At least 80% of min required
-                score += (ratio * 0.25)
-    
-    # Year of study matching (15%)
-    # E.g. A 4th year is better for a min_year=3 role than a 1st year
-    if student.year_of_study and internship.min_year:
-        if student.year_of_study >= internship.min_year:
-            score += 0.15
-        else:
-            year_ratio = student.year_of_study / internship.min_year
-            score += (year_ratio * 0.15)
-            
-    # Preferences matching (15%) - simple keyword matching
-    student_prefs = " ".join(student.preferences) if student.preferences else ""
-    if student_prefs and internship.domain:
-        if internship.domain.lower() in student_prefs.lower():
-            score += 0.15
-
-    # Resume quality (10%) - simple boolean check here
-    if student.resume_url:
-        score += 0.10
-
-    return min(1.0, score)  # Cap at 1.0
+    # One code path for single scores and batch re-scoring, so a stored score
+    # never depends on which of the two computed it
+    return float(score_pairs([student], [internship])[0])
+
+
+def _numbers(values) -> np.ndarray:
+    # A missing value counts as 0, which earns no points below
+    return np.array([v or 0.0 for v in values], dtype=float)
+
+
+def _skills_similarity(students, internships) -> np.ndarray:
+    """Cosine similarity of each pair's skills under a per-pair TF-IDF model."""
+    student_docs = [" ".join(s.skills) if s.skills else "" for s in students]
+    internship_docs = [" ".join(i.required_skills) if i.required_skills else "" for i in internships]
+    vectorizer = CountVectorizer()
+    try:
+        vectorizer.fit(student_docs + internship_docs)
+    except ValueError:
+        return np.zeros(len(student_docs))
+    s_counts = vectorizer.transform(student_docs).astype(float)
+    i_counts = vectorizer.transform(internship_docs).astype(float)
+
+    # Per pair, TF-IDF as if fitted on just those two documents: idf is 1 for
+    # shared terms and _ONE_SIDED_IDF otherwise; rows are l2-normalised
+    shared = s_counts.multiply(i_counts) > 0
+
+    def tfidf(counts):
+        weights = (counts > 0).astype(float) * _ONE_SIDED_IDF
+        weights[shared] = 1.0
+        return normalize(counts.multiply(weights).tocsr())
+
+    similarity = np.asarray(tfidf(s_counts).multiply(tfidf(i_counts)).sum(axis=1)).ravel()
+    # A pair with no skills on either side scores 0
+    present = np.array([bool(a and b) for a, b in zip(student_docs, internship_docs)])
+    return np.where(present, similarity, 0.0)
+
+
+def score_pairs(students, internships) -> np.ndarray:
+    """
+    Match scores for many (student, internship) pairs at once.
+
+    students[k] is scored against internships[k]; both only need the
+    attributes listed in SCORE_INPUTS. The skills similarity is the cosine of
+    the two skill lists under TF-IDF fitted on that pair alone.
+    """
+    score = _skills_similarity(students, internships) * 0.35
+
+    cgpa = _numbers(s.cgpa for s in students)
+    min_cgpa = _numbers(i.min_cgpa for i in internships)
+    ratio = np.divide(cgpa, min_cgpa, out=np.zeros_like(cgpa), where=min_cgpa > 0)
+    cgpa_score = np.where(cgpa >= min_cgpa, 0.25, np.where(ratio >= 0.8, ratio * 0.25, 0.0))
+    score = score + np.where((cgpa != 0) & (min_cgpa != 0), cgpa_score, 0.0)
+
+    year = _numbers(s.year_of_study for s in students)
+    min_year = _numbers(i.min_year for i in internships)
+    year_ratio = np.divide(year, min_year, out=np.zeros_like(year), where=min_year > 0)
+    year_score = np.where(year >= min_year, 0.15, year_ratio * 0.15)
+    score = score + np.where((year != 0) & (min_year != 0), year_score, 0.0)
+
+    score = score + np.array([
+        0.15 if s.preferences and i.domain
+        and i.domain.lower() in " ".join(s.preferences).lower() else 0.0
+        for s, i in zip(students, internships)
+    ])
+    score = score + np.array([0.10 if s.resume_url else 0.0 for s in students])
+    return np.minimum(1.0, score)
+
 
 def find_matches_for_student(student_id: int, threshold: float = 0.5):
     """
@@ -68,10 +102,10 @@ def find_matches_for_student(student_id: int, threshold: float = 0.5):
             return []
 
         internships = db.query(Internship).filter(Internship.is_active == True).all()
+        scores = score_pairs([student] * len(internships), internships)
         matches = []
 
-        for internship in internships:
-            score = calculate_match_score(student, internship)
+        for internship, score in zip(internships, scores.tolist()):
             if score >= threshold:
                 matches.append({
                     "internship_id": internship.id,
@@ -3,6 +3,10 @@ from .company import Company
 from .internship import Internship
 from .application import Application
 from .skill import Skill
+from .internship_skill import InternshipSkill
+from .change_version import ChangeVersion
+from .stats_counter import StatsCounter
+from .stats_rollup import StatsRollup
 
 
-__all__ = ['Student', 'Company', 'Internship', 'Application', 'Skill']
\ No newline at end of file
+__all__ = ['Student', 'Company', 'Internship', 'Application', 'Skill', 'InternshipSkill', 'ChangeVersion', 'StatsCounter', 'StatsRollup']
\ No newline at end of file
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey
-from sqlalchemy.orm import relationship
-from backend.base import Base
+from sqlalchemy import Boolean, Column, DateTime, Integer, String, Float, ForeignKey, Index, false, true
+from sqlalchemy.orm import relationship, synonym
+from backend.base import Base, utcnow
 
 class Application(Base): 
     __tablename__ = "applications"  # or "matches" if you prefer
@@ -10,7 +10,43 @@ class Application(Base):
     internship_id = Column(Integer, ForeignKey("internships.id"))
     match_score = Column(Float)
     status = Column(String, default="pending") 
+    # Set when the student's or internship's score inputs change; cleared by
+    # backend.rescoring, which records the SCORE_VERSION it scored with
+    score_stale = Column(Boolean, nullable=False, default=False, server_default=false())
+    score_version = Column(Integer, nullable=True)
+    # When a re-scoring worker claimed the row (its lease; see backend.rescoring)
+    score_claimed_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=utcnow, index=True)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow, index=True)
+    # When the status last left pending (None while pending); set only on
+    # status changes (see backend.rollups), so rescoring does not move it
+    decided_at = Column(DateTime, nullable=True)
+    applied_at = synonym("created_at")  # name used by schemas.ApplicationRead
 
     # Relationships
     student = relationship("Student", back_populates="applications")
-    internship = relationship("Internship", back_populates="applications")
\ No newline at end of file
+    internship = relationship("Internship", back_populates="applications")
+
+    __table_args__ = (
+        # One application per student and internship; also serves student_id
+        # lookups
+        Index("uq_applications_student_id_internship_id", "student_id", "internship_id", unique=True),
+        # Per-internship applicant ranking, with or without a status filter;
+        # the first also serves plain internship_id lookups
+        Index("ix_applications_internship_score", "internship_id", match_score.desc(), id.desc()),
+        Index(
+            "ix_applications_internship_status_score",
+            "internship_id", "status", match_score.desc(), id.desc(),
+        ),
+        # Admin listing: status filter and best-match-first ordering
+        Index("ix_applications_status_match_score", "status", "match_score"),
+        Index("ix_applications_match_score", "match_score"),
+        # Status filter in id order (the default listing order)
+        Index("ix_applications_status_id", "status", "id"),
+        # Only the (few) stale rows are indexed. Queries must use the same
+        # predicate (score_stale == true()) for SQLite to pick this index
+        Index(
+            "ix_applications_score_stale", "score_stale",
+            sqlite_where=score_stale == true(), postgresql_where=score_stale == true(),
+        ),
+    )
\ No newline at end of file
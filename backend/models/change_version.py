@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from backend.base import Base
+
+class ChangeVersion(Base):
+    __tablename__ = "change_versions"
+
+    # One row per tracked table, bumped in the same transaction as each write
+    table_name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
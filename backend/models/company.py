@@ -10,6 +10,7 @@ class Company(Base):
     company_name = Column(String)
     industry = Column(String)
     description = Column(String)
+    password_hash = Column(String, nullable=True)  # backend.passwords format
     is_active = Column(Boolean, default=True)
 
     # Relationship
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, JSON, ForeignKey
+from sqlalchemy import Column, DateTime, Integer, String, Float, Boolean, JSON, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from backend.base import Base
+from backend.base import Base, utcnow
 
 class Internship(Base):
     __tablename__ = "internships"
@@ -9,13 +9,25 @@ class Internship(Base):
     company_id = Column(Integer, ForeignKey("companies.id")) 
     title = Column(String)
     description = Column(String)
-    required_skills = Column(JSON, default=list)
+    required_skills = Column(JSON, default=list)  # as entered; mirrored into internship_skills
     min_cgpa = Column(Float)
     min_year = Column(Integer)
     positions_available = Column(Integer)
     domain = Column(String)
     is_active = Column(Boolean, default=True)
+    created_at = Column(DateTime, default=utcnow, index=True)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow, index=True)
 
     # Relationships
     company = relationship("Company", back_populates="internships")
-    applications = relationship("Application", back_populates="internship")
\ No newline at end of file
+    applications = relationship("Application", back_populates="internship")
+    skills = relationship("Skill", secondary="internship_skills")
+
+    # Company-scoped listings and dashboards; also the first step of the
+    # company -> internships -> applications join
+    __table_args__ = (
+        Index("ix_internships_company_id_is_active", "company_id", "is_active"),
+        # Active listings in id order; domain counts over active internships
+        Index("ix_internships_is_active", "is_active"),
+        Index("ix_internships_domain_is_active", "domain", "is_active"),
+    )
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, ForeignKey, Index
+from backend.base import Base
+
+class InternshipSkill(Base):
+    __tablename__ = "internship_skills"
+
+    internship_id = Column(Integer, ForeignKey("internships.id"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), primary_key=True)
+
+    # The primary key serves internship -> skills; this one serves skill -> internships
+    __table_args__ = (
+        Index("ix_internship_skills_skill_id_internship_id", "skill_id", "internship_id"),
+    )
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Float, Integer, String
+from backend.base import Base
+
+class StatsCounter(Base):
+    __tablename__ = "stats_counters"
+
+    # Dashboard numbers kept up to date by backend.counters; scope is
+    # "global" (scope_id 0), "company" or "student"
+    scope = Column(String, primary_key=True)
+    scope_id = Column(Integer, primary_key=True)
+    name = Column(String, primary_key=True)
+    value = Column(Float, nullable=False, default=0)
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, DateTime, Float, String
+from backend.base import Base
+
+class StatsRollup(Base):
+    __tablename__ = "stats_rollups"
+
+    # Per-bucket totals kept up to date by backend.rollups; bucket is "hour"
+    # or "day" and bucket_start the UTC start of that hour / day
+    metric = Column(String, primary_key=True)
+    bucket = Column(String, primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    value = Column(Float, nullable=False, default=0)
@@ -15,6 +15,7 @@ class Student(Base):
     skills = Column(JSON) 
     preferences = Column(JSON)  
     resume_url = Column(String, nullable=True)
+    password_hash = Column(String, nullable=True)  # backend.passwords format
     is_active = Column(Boolean, default=True)
 
     applications = relationship("Application", back_populates="student")
\ No newline at end of file
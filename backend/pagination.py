@@ -0,0 +1,65 @@
+import base64
+import json
+import math
+from typing import Any, List, Optional
+
+from fastapi import HTTPException, Response
+
+# ---------------------------------------------------------------------------
+# Opaque keyset cursors
+#
+# A cursor holds the sort-key values of the last row on a page. Clients get it
+# back as "nextCursor" (or the X-Next-Cursor header for list responses) and
+# send it as ?after=... to fetch the rows that follow.
+# ---------------------------------------------------------------------------
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_PAGE_SIZE = 100
+
+# Types a cursor value may have, by sort key
+ID_VALUE = (int,)
+SCORE_VALUE = (int, float, type(None))
+
+
+def encode_cursor(*values: Any) -> str:
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _valid(value: Any, kind: tuple) -> bool:
+    # bool is an int to isinstance; NaN and infinities never come from a row
+    if isinstance(value, bool) or not isinstance(value, kind):
+        return False
+    return not isinstance(value, float) or math.isfinite(value)
+
+
+def decode_cursor(cursor: str, *kinds: tuple) -> List[Any]:
+    """Decode a cursor holding one value of each of kinds (e.g. ID_VALUE), or raise a 400."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if isinstance(values, list) and len(values) == len(kinds) and all(map(_valid, values, kinds)):
+            return values
+    except ValueError:
+        pass
+    raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def next_cursor(rows: list, limit: int, *keys) -> Optional[str]:
+    """
+    Cursor for the page after rows, or None on the last page.
+
+    rows must have been fetched with limit + 1 so a following page can be
+    detected; the extra row is removed in place. Each key is a function
+    returning one sort value from a row.
+    """
+    if len(rows) <= limit:
+        return None
+    del rows[limit:]
+    last = rows[-1]
+    return encode_cursor(*(key(last) for key in keys))
+
+
+def set_cursor_header(response: Response, cursor: Optional[str]):
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
@@ -0,0 +1,115 @@
+import asyncio
+import hashlib
+import hmac
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+# ---------------------------------------------------------------------------
+# Password hashing
+#
+# Hashes are scrypt with a configurable cost, stored as
+# "scrypt$<n>$<r>$<p>$<salt hex>$<key hex>" so that each hash records the
+# cost it was made with. The KDF runs in a small dedicated thread pool:
+# each hash takes tens of milliseconds and 128 * n * r bytes of memory, and
+# running it on the shared request threadpool would let a burst of logins
+# stall every other route. Hashes from before this module ("<salt>:<hex>",
+# one salted SHA-256 round) still verify and are replaced on the next login.
+# ---------------------------------------------------------------------------
+
+SCRYPT_N = int(os.getenv("PASSWORD_SCRYPT_N", str(2 ** 14)))
+SCRYPT_R = int(os.getenv("PASSWORD_SCRYPT_R", "8"))
+SCRYPT_P = int(os.getenv("PASSWORD_SCRYPT_P", "1"))
+PASSWORD_WORKERS = int(os.getenv("PASSWORD_WORKERS", "2"))
+PASSWORD_MAX_PENDING = int(os.getenv("PASSWORD_MAX_PENDING", "64"))
+
+_SCHEME = "scrypt"
+_SALT_BYTES = 16
+_KEY_BYTES = 32
+
+
+class PasswordPoolBusyError(Exception):
+    """Raised when too many password hashes are already waiting to run."""
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode(), salt=salt, n=n, r=r, p=p,
+        maxmem=256 * n * r * p + (1 << 20), dklen=_KEY_BYTES,
+    )
+
+
+def hash_password(password: str, n: int = None, r: int = None, p: int = None) -> str:
+    """Hash a password at the configured cost (or the given one). CPU-bound."""
+    n, r, p = n or SCRYPT_N, r or SCRYPT_R, p or SCRYPT_P
+    salt = os.urandom(_SALT_BYTES)
+    key = _scrypt(password, salt, n, r, p)
+    return f"{_SCHEME}${n}${r}${p}${salt.hex()}${key.hex()}"
+
+
+def verify_password(password: str, stored: str) -> bool:
+    """Check a password against a stored hash of either format. CPU-bound."""
+    try:
+        if stored.startswith(_SCHEME + "$"):
+            _, n, r, p, salt, key = stored.split("$")
+            candidate = _scrypt(password, bytes.fromhex(salt), int(n), int(r), int(p))
+            return hmac.compare_digest(candidate, bytes.fromhex(key))
+        # Legacy: single salted SHA-256 round
+        salt, hashed = stored.split(":", 1)
+        return hmac.compare_digest(hashlib.sha256((salt + password).encode()).hexdigest(), hashed)
+    except Exception:
+        return False
+
+
+def needs_rehash(stored: str) -> bool:
+    """True for legacy hashes and for scrypt hashes made at another cost."""
+    return not stored.startswith(f"{_SCHEME}${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}$")
+
+
+# ---------------------------------------------------------------------------
+# Bounded pool
+# ---------------------------------------------------------------------------
+
+_pool: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+_pending = 0
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=PASSWORD_WORKERS, thread_name_prefix="passwords")
+        return _pool
+
+
+async def _run(fn, *args):
+    global _pending
+    with _lock:
+        if _pending >= PASSWORD_MAX_PENDING:
+            raise PasswordPoolBusyError("Too many sign-ins in progress, try again later")
+        _pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_get_pool(), fn, *args)
+    finally:
+        with _lock:
+            _pending -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password on the password pool."""
+    return await _run(hash_password, password)
+
+
+async def verify_password_async(password: str, stored: str) -> bool:
+    """verify_password on the password pool."""
+    return await _run(verify_password, password, stored)
+
+
+def shutdown():
+    global _pool
+    with _lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
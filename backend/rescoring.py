@@ -0,0 +1,211 @@
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from sqlalchemy import bindparam, event, false, inspect, or_, select, true, update
+from sqlalchemy.orm import Session
+
+from backend import counters
+from backend.base import SessionLocal, utcnow
+from backend.matching import SCORE_INPUTS, SCORE_VERSION, score_pairs
+from backend.models import Application, Internship, Student
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Incremental re-scoring of stored application scores
+#
+# A flush that changes a score input of a student or internship marks that
+# row's applications score_stale in the same transaction. After commit a
+# background thread picks stale applications up in batches, scores each
+# batch with score_pairs and stores the result with SCORE_VERSION.
+#
+# A batch is claimed by stamping score_claimed_at; the stale flag is only
+# cleared together with the new score, and only while the claim still
+# holds. Marking a row stale again drops its claim, so a score computed from
+# inputs that changed meanwhile is not stored, and a claim left by a worker
+# that died expires after RESCORE_LEASE_SECONDS.
+# ---------------------------------------------------------------------------
+
+RESCORE_BATCH_SIZE = int(os.getenv("RESCORE_BATCH_SIZE", "500"))
+RESCORE_LEASE_SECONDS = int(os.getenv("RESCORE_LEASE_SECONDS", "600"))
+
+_wake = threading.Event()
+_stopping = threading.Event()
+_thread = None
+_thread_lock = threading.Lock()
+
+
+def mark_stale(connection, student_ids: Iterable[int] = (), internship_ids: Iterable[int] = ()):
+    """Flag the applications of the given students / internships for re-scoring."""
+    student_ids, internship_ids = list(student_ids), list(internship_ids)
+    conditions = []
+    if student_ids:
+        conditions.append(Application.student_id.in_(student_ids))
+    if internship_ids:
+        conditions.append(Application.internship_id.in_(internship_ids))
+    if conditions:
+        connection.execute(
+            update(Application.__table__)
+            .where(or_(*conditions))
+            .values(score_stale=True, score_claimed_at=None)
+        )
+
+
+def _changed(obj, fields) -> bool:
+    attrs = inspect(obj).attrs
+    return any(attrs[field].history.has_changes() for field in fields)
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _mark_after_flush(session, flush_context):
+    changed = {Student: [], Internship: []}
+    for obj in session.dirty:
+        fields = SCORE_INPUTS.get(type(obj))
+        if fields and _changed(obj, fields):
+            changed[type(obj)].append(obj.id)
+    if changed[Student] or changed[Internship]:
+        mark_stale(session.connection(), changed[Student], changed[Internship])
+        session.info["rescore"] = True
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _wake_after_commit(session):
+    if session.info.pop("rescore", False):
+        wake()
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _forget_after_rollback(session):
+    session.info.pop("rescore", None)
+
+
+def mark_outdated(db: Session) -> int:
+    """Flag applications scored by another SCORE_VERSION (or never versioned)."""
+    result = db.execute(
+        update(Application)
+        .where(or_(Application.score_version.is_(None), Application.score_version != SCORE_VERSION))
+        .where(Application.score_stale == false())
+        .values(score_stale=True)
+    )
+    db.commit()
+    return result.rowcount
+
+
+def _claimable(now: datetime):
+    # Unclaimed, or claimed by a worker whose lease has run out
+    return or_(
+        Application.score_claimed_at.is_(None),
+        Application.score_claimed_at < now - timedelta(seconds=RESCORE_LEASE_SECONDS),
+    )
+
+
+def _rescore_batch(db: Session, batch_size: int) -> int:
+    claim = utcnow()
+    ids = db.scalars(
+        select(Application.id)
+        .where(Application.score_stale == true(), _claimable(claim))
+        .order_by(Application.id)
+        .limit(batch_size)
+    ).all()
+    if not ids:
+        return 0
+
+    # Claim the batch (another worker may have taken some of it since)
+    db.execute(
+        update(Application.__table__)
+        .where(Application.id.in_(ids), Application.score_stale == true(), _claimable(claim))
+        .values(score_claimed_at=claim)
+    )
+    db.commit()
+
+    rows = db.execute(
+        select(Application.id, Student, Internship)
+        .join(Student, Student.id == Application.student_id)
+        .join(Internship, Internship.id == Application.internship_id)
+        .where(Application.id.in_(ids), Application.score_claimed_at == claim)
+    ).all()
+    if rows:
+        scores = score_pairs([r[1] for r in rows], [r[2] for r in rows])
+        # Rows re-flagged since the claim lost it and stay stale
+        with counters.tracking_applications(db, [r[0] for r in rows]):
+            db.execute(
+                update(Application.__table__)
+                .where(Application.id == bindparam("row_id"), Application.score_claimed_at == claim)
+                .values(
+                    match_score=bindparam("score"), score_version=SCORE_VERSION,
+                    score_stale=False, score_claimed_at=None,
+                ),
+                [{"row_id": r[0], "score": round(float(score), 4)} for r, score in zip(rows, scores)],
+            )
+    # Still claimed: the student or internship is gone, nothing to score
+    db.execute(
+        update(Application.__table__)
+        .where(Application.id.in_(ids), Application.score_claimed_at == claim)
+        .values(score_stale=False, score_claimed_at=None)
+    )
+    db.commit()
+    return len(ids)
+
+
+def rescore_pending(batch_size: int = RESCORE_BATCH_SIZE) -> int:
+    """Re-score every stale application now; returns how many were processed."""
+    db = SessionLocal()
+    try:
+        total = 0
+        while not _stopping.is_set():
+            done = _rescore_batch(db, batch_size)
+            if not done:
+                break
+            total += done
+            db.expunge_all()
+        return total
+    finally:
+        db.close()
+
+
+def _worker():
+    while not _stopping.is_set():
+        _wake.wait()
+        _wake.clear()
+        if _stopping.is_set():
+            break
+        try:
+            count = rescore_pending()
+            if count:
+                logger.info("Re-scored %d applications", count)
+        except Exception:
+            logger.exception("Re-scoring failed")
+
+
+def wake():
+    """Start the re-scoring thread if needed and have it drain stale rows."""
+    global _thread
+    with _thread_lock:
+        if _thread is None or not _thread.is_alive():
+            _stopping.clear()
+            _thread = threading.Thread(target=_worker, name="rescoring", daemon=True)
+            _thread.start()
+    _wake.set()
+
+
+def start():
+    """Flag outdated scores and start re-scoring (called at server startup)."""
+    db = SessionLocal()
+    try:
+        mark_outdated(db)
+    finally:
+        db.close()
+    wake()
+
+
+def shutdown():
+    global _thread
+    with _thread_lock:
+        thread, _thread = _thread, None
+    if thread is not None:
+        _stopping.set()
+        _wake.set()
+        thread.join(timeout=10)
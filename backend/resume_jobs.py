@@ -0,0 +1,191 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from backend import extraction_pool
+from backend.resume_parser import parse_resume
+
+# ---------------------------------------------------------------------------
+# Background resume processing
+#
+# Upload routes persist the file and hand it to this module. Text extraction
+# runs in the sandboxed extraction pool and spaCy parsing in a bounded
+# process pool, so neither blocks the event loop. Jobs live in memory, so
+# status is only visible on the worker process that accepted the upload.
+# ---------------------------------------------------------------------------
+
+RESUME_WORKERS = int(os.getenv("RESUME_WORKERS", "2"))
+RESUME_MAX_PENDING = int(os.getenv("RESUME_MAX_PENDING", "100"))
+RESUME_JOB_RETENTION = int(os.getenv("RESUME_JOB_RETENTION", "1000"))
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class QueueFullError(Exception):
+    """Raised when too many resumes are already waiting to be parsed."""
+
+
+class ResumeJob:
+    def __init__(self, file_path: str, student_id: Optional[int] = None):
+        self.id = uuid.uuid4().hex
+        self.file_path = file_path
+        self.student_id = student_id
+        self.status = QUEUED
+        self.result: Optional[dict] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "jobId": self.id,
+            "status": self.status,
+            "studentId": self.student_id,
+            "result": self.result,
+            "error": self.error,
+            "createdAt": self.created_at,
+            "startedAt": self.started_at,
+            "finishedAt": self.finished_at,
+        }
+
+
+_jobs: "OrderedDict[str, ResumeJob]" = OrderedDict()
+_tasks: set = set()
+_lock = threading.Lock()
+_pool: Optional[ProcessPoolExecutor] = None
+_slots: Optional[asyncio.Semaphore] = None
+
+# Rolling window of recent timings (seconds) for the metrics endpoint
+_wait_times: deque = deque(maxlen=500)
+_run_times: deque = deque(maxlen=500)
+_totals = {SUCCEEDED: 0, FAILED: 0}
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _lock:
+        if _pool is None:
+            # spawn, not fork: the API process runs threads (uvicorn, anyio)
+            _pool = ProcessPoolExecutor(
+                max_workers=RESUME_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _get_slots() -> asyncio.Semaphore:
+    global _slots
+    if _slots is None:
+        _slots = asyncio.Semaphore(RESUME_WORKERS)
+    return _slots
+
+
+def _count(status: str) -> int:
+    return sum(1 for j in _jobs.values() if j.status == status)
+
+
+def _evict_finished():
+    finished = [jid for jid, j in _jobs.items() if j.status in (SUCCEEDED, FAILED)]
+    for jid in finished[: max(0, len(finished) - RESUME_JOB_RETENTION)]:
+        del _jobs[jid]
+
+
+def submit(
+    file_path: str,
+    on_result: Callable[[dict], dict],
+    student_id: Optional[int] = None,
+) -> ResumeJob:
+    """
+    Queue a stored resume for parsing and return immediately.
+
+    on_result is called in a worker thread with the parsed resume and should
+    persist it; whatever it returns becomes the job's result.
+    """
+    if _count(QUEUED) >= RESUME_MAX_PENDING:
+        raise QueueFullError("Resume queue is full, try again later")
+
+    job = ResumeJob(file_path, student_id=student_id)
+    _jobs[job.id] = job
+    _evict_finished()
+
+    task = asyncio.get_running_loop().create_task(_run(job, on_result))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return job
+
+
+async def _run(job: ResumeJob, on_result: Callable[[dict], dict]):
+    loop = asyncio.get_running_loop()
+    async with _get_slots():
+        job.status = RUNNING
+        job.started_at = time.time()
+        _wait_times.append(job.started_at - job.created_at)
+        try:
+            text = await run_in_threadpool(extraction_pool.extract_text, job.file_path)
+            resume_data = await loop.run_in_executor(_get_pool(), parse_resume, text)
+            job.result = await run_in_threadpool(on_result, resume_data)
+            if job.student_id is None:
+                job.student_id = job.result.get("student_id")
+            job.status = SUCCEEDED
+        except asyncio.CancelledError:
+            job.error = "Cancelled during shutdown"
+            job.status = FAILED
+            raise
+        except Exception as e:
+            job.error = f"Parsing error: {str(e)}"
+            job.status = FAILED
+        finally:
+            job.finished_at = time.time()
+            _run_times.append(job.finished_at - job.started_at)
+            _totals[job.status] += 1
+
+
+def get_job(job_id: str) -> Optional[ResumeJob]:
+    return _jobs.get(job_id)
+
+
+def _summarize(samples) -> Dict[str, float]:
+    values = sorted(samples)
+    if not values:
+        return {"count": 0, "avg": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    return {
+        "count": len(values),
+        "avg": round(sum(values) / len(values), 4),
+        "p50": round(values[len(values) // 2], 4),
+        "p95": round(values[min(len(values) - 1, int(len(values) * 0.95))], 4),
+        "max": round(values[-1], 4),
+    }
+
+
+def metrics() -> dict:
+    return {
+        "workers": RESUME_WORKERS,
+        "maxPending": RESUME_MAX_PENDING,
+        "queueDepth": _count(QUEUED),
+        "running": _count(RUNNING),
+        "succeeded": _totals[SUCCEEDED],
+        "failed": _totals[FAILED],
+        "waitSeconds": _summarize(_wait_times),
+        "runSeconds": _summarize(_run_times),
+    }
+
+
+def shutdown():
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+    extraction_pool.shutdown()
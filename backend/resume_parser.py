@@ -1,6 +1,10 @@
 import spacy
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from backend import extraction_pool
+from backend.skills import extract_skills
+from backend.text_extraction import extract_text_from_pdf, extract_text_from_docx
 
 # Load spaCy model (ensure 'en_core_web_sm' is installed)
 try:
@@ -9,31 +13,6 @@ except OSError:
     print("Warning: spaCy model 'en_core_web_sm' not found. Please run: python -m spacy download en_core_web_sm")
     nlp = None
 
-def extract_text_from_pdf(file_path: str) -> str:
-    """
-    Extract text from PDF file.
-    """
-    # Placeholder - in real implementation, use PyPDF2 or pdfplumber
-    # For now, assume text is provided or use a library
-    # Install PyPDF2 and use it
-    from PyPDF2 import PdfReader
-    reader = PdfReader(file_path)
-    text = ""
-    for page in reader.pages:
-        text += page.extract_text()
-    return text
-
-def extract_text_from_docx(file_path: str) -> str:
-    """
-    Extract text from DOCX file.
-    """
-    from docx import Document
-    doc = Document(file_path)
-    text = ""
-    for para in doc.paragraphs:
-        text += para.text + "\n"
-    return text
-
 def parse_resume(text: str) -> Dict:
     """
     Parse resume text to extract name, degree, CGPA, skills.
@@ -51,34 +30,13 @@ def parse_resume(text: str) -> Dict:
 
     doc = nlp(text)
 
-    # Extract name (first proper noun entity)
-    name = ""
-    for ent in doc.ents:
-        if ent.label_ == "PERSON":
-            name = ent.text
-            break
+    # Extract name, degree and CGPA
+    name = extract_name(doc)
+    degree = extract_degree(doc)
+    cgpa = extract_cgpa(text)
 
-    # Extract degree (look for common degree keywords)
-    degree_keywords = ["bachelor", "master", "phd", "b.tech", "m.tech", "bsc", "msc", "ba", "ma"]
-    degree = ""
-    for token in doc:
-        if token.text.lower() in degree_keywords:
-            degree = token.text
-            break
-
-    # Extract CGPA (regex for numbers like 8.5 or 3.5/4.0)
-    cgpa_match = re.search(r'(\d+\.\d+)(?:/(\d+\.\d+))?', text)
-    cgpa = float(cgpa_match.group(1)) if cgpa_match else None
-
-    # Extract skills (nouns and proper nouns that might be skills)
-    skills = []
-    for token in doc:
-        if token.pos_ in ["NOUN", "PROPN"] and len(token.text) > 2:
-            skills.append(token.text.lower())
-
-    # Remove duplicates and common words
-    skills = list(set(skills))
-    skills = [skill for skill in skills if skill not in ["name", "email", "phone", "address"]]
+    # Extract skills from the canonical vocabulary, ranked by frequency
+    skills = extract_skills(nlp, doc, limit=10)
 
     # Extract preferences and interests
     preferences = extract_preferences(text)
@@ -95,10 +53,36 @@ def parse_resume(text: str) -> Dict:
         "degree": degree,
         "year_of_study": year_of_study,
         "cgpa": cgpa,
-        "skills": skills[:10],  # Limit to top 10
+        "skills": skills,
         "preferences": preferences
     }
 
+def extract_name(doc) -> str:
+    """
+    Extract name (first PERSON entity) from a parsed resume.
+    """
+    for ent in doc.ents:
+        if ent.label_ == "PERSON":
+            return ent.text
+    return ""
+
+def extract_degree(doc) -> str:
+    """
+    Extract degree (look for common degree keywords) from a parsed resume.
+    """
+    degree_keywords = ["bachelor", "master", "phd", "b.tech", "m.tech", "bsc", "msc", "ba", "ma"]
+    for token in doc:
+        if token.text.lower() in degree_keywords:
+            return token.text
+    return ""
+
+def extract_cgpa(text: str) -> Optional[float]:
+    """
+    Extract CGPA (regex for numbers like 8.5 or 3.5/4.0).
+    """
+    cgpa_match = re.search(r'(\d+\.\d+)(?:/(\d+\.\d+))?', text)
+    return float(cgpa_match.group(1)) if cgpa_match else None
+
 def extract_preferences(text: str) -> List[str]:
     """
     Extract preferences and interests from resume text.
@@ -246,12 +230,7 @@ def extract_year_of_study(text: str) -> str:
 def process_resume_file(file_path: str) -> Dict:
     """
     Process uploaded resume file and extract data.
+    Text extraction runs in the sandboxed extraction pool.
     """
-    if file_path.endswith(".pdf"):
-        text = extract_text_from_pdf(file_path)
-    elif file_path.endswith(".docx"):
-        text = extract_text_from_docx(file_path)
-    else:
-        raise ValueError("Unsupported file type")
-
-    return parse_resume(text)
\ No newline at end of file
+    text = extraction_pool.extract_text(file_path)
+    return parse_resume(text)
@@ -0,0 +1,281 @@
+import argparse
+import logging
+import math
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import case, delete, event, inspect, select
+from sqlalchemy.orm import Session
+
+from backend.base import SessionLocal, engine, utcnow
+from backend.counters import RECONCILE_SECONDS, upsert_add
+from backend.models import Application, Internship, StatsRollup
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Pre-bucketed time series
+#
+# stats_rollups holds hourly and daily totals per metric, updated in the same
+# transaction as the write they count, so /stats/timeseries reads at most
+# one row per bucket instead of scanning applications.
+#
+#   applications      applications created
+#   internships       internships created
+#   accepted/rejected applications decided, by decided_at
+#   decision_seconds  summed time from application to decision
+#
+# The totals describe the rows as they are now, the same as rebuild(): a
+# write first removes the row's previous contribution (a flipped decision,
+# a decision taken back to pending, a deleted application) and then adds the
+# new one. Applications without a created_at (from before it was recorded)
+# are counted nowhere. reconcile() rebuilds everything and reports drift.
+# ---------------------------------------------------------------------------
+
+BUCKETS = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+DECISIONS = ("accepted", "rejected")
+
+Delta = Dict[Tuple[str, datetime], float]
+
+_rollups = StatsRollup.__table__
+
+
+def bucket_start(moment: datetime, bucket: str) -> datetime:
+    if bucket == "hour":
+        return moment.replace(minute=0, second=0, microsecond=0)
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add(delta: Delta, metric: str, moment: Optional[datetime], amount: float = 1):
+    # Hours are the finest bucket, and each lies within a single day
+    delta[(metric, bucket_start(moment or utcnow(), "hour"))] += amount
+
+
+def _add_application(
+    delta: Delta, sign: int, created_at: Optional[datetime], status, decided_at: Optional[datetime]
+):
+    """Add (sign=1) or remove (sign=-1) one application's contribution."""
+    if created_at is None:
+        return
+    _add(delta, "applications", created_at, sign)
+    if status in DECISIONS and decided_at is not None:
+        _add(delta, status, decided_at, sign)
+        _add(delta, "decision_seconds", decided_at, sign * (decided_at - created_at).total_seconds())
+
+
+def record(connection, delta: Delta):
+    """Add {(metric, moment): amount} to the hour and day buckets of each moment."""
+    totals = defaultdict(float)
+    for (metric, moment), amount in delta.items():
+        for bucket in BUCKETS:
+            totals[(metric, bucket, bucket_start(moment, bucket))] += amount
+    upsert_add(connection, _rollups, ["metric", "bucket", "bucket_start"], [
+        {"metric": metric, "bucket": bucket, "bucket_start": start, "value": value}
+        for (metric, bucket, start), value in sorted(totals.items()) if value
+    ])
+
+
+def record_created(connection, metric: str, count: int, moment: Optional[datetime] = None):
+    """Count rows written by a set-based INSERT."""
+    if count:
+        record(connection, {(metric, moment or utcnow()): count})
+
+
+def record_status_change(connection, status: str, moment: datetime, *conditions):
+    """
+    Move the contributions of the applications matching conditions, ahead of
+    a set-based UPDATE that sets status and decided_at_after(status, moment).
+    Rows are streamed; only the per-bucket totals are held.
+    """
+    delta = defaultdict(float)
+    for created_at, old_status, old_decided_at in connection.execute(
+        select(Application.created_at, Application.status, Application.decided_at)
+        .where(Application.created_at.is_not(None), *conditions)
+        .execution_options(yield_per=5000)
+    ):
+        if status not in DECISIONS:
+            decided_at = None
+        elif old_status == "pending":
+            decided_at = moment
+        else:
+            decided_at = old_decided_at
+        _add_application(delta, -1, created_at, old_status, old_decided_at)
+        _add_application(delta, 1, created_at, status, decided_at)
+    record(connection, delta)
+
+
+def decided_at_after(status: str, moment: datetime):
+    """The decided_at value for a bulk UPDATE that sets status at moment."""
+    if status not in DECISIONS:
+        return None
+    # Only rows leaving pending are decided now; the rest keep their time
+    return case((Application.status == "pending", moment), else_=Application.decided_at)
+
+
+def _old(obj, field):
+    history = inspect(obj).attrs[field].history
+    return history.deleted[0] if history.deleted else getattr(obj, field)
+
+
+_APPLICATION_FIELDS = ("created_at", "status", "decided_at")
+
+
+@event.listens_for(SessionLocal, "before_flush")
+def _stamp_decisions(session, flush_context, instances):
+    for obj in session.dirty:
+        if isinstance(obj, Application) and inspect(obj).attrs.status.history.has_changes():
+            previous = _old(obj, "status")
+            if previous == "pending" and obj.status in DECISIONS:
+                obj.decided_at = utcnow()
+            elif obj.status == "pending":
+                obj.decided_at = None
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _record_after_flush(session, flush_context):
+    delta = defaultdict(float)
+    for sign, objects in ((1, session.new), (-1, session.deleted)):
+        for obj in objects:
+            if isinstance(obj, Application):
+                value = getattr if sign == 1 else _old
+                _add_application(delta, sign, *(value(obj, f) for f in _APPLICATION_FIELDS))
+            elif isinstance(obj, Internship):
+                _add(delta, "internships", obj.created_at, sign)
+    for obj in session.dirty:
+        if isinstance(obj, Application):
+            attrs = inspect(obj).attrs
+            if any(attrs[f].history.has_changes() for f in _APPLICATION_FIELDS):
+                _add_application(delta, -1, *(_old(obj, f) for f in _APPLICATION_FIELDS))
+                _add_application(delta, 1, *(getattr(obj, f) for f in _APPLICATION_FIELDS))
+    if delta:
+        record(session.connection(), delta)
+
+
+# ---------------------------------------------------------------------------
+# Reads and rebuild
+# ---------------------------------------------------------------------------
+
+def read(db: Session, metric: str, bucket: str, start: datetime, end: datetime) -> Dict[datetime, float]:
+    return dict(
+        db.query(StatsRollup.bucket_start, StatsRollup.value)
+        .filter(
+            StatsRollup.metric == metric,
+            StatsRollup.bucket == bucket,
+            StatsRollup.bucket_start >= bucket_start(start, bucket),
+            StatsRollup.bucket_start < end,
+        )
+        .all()
+    )
+
+
+def _compute(connection) -> Delta:
+    delta = defaultdict(float)
+    for (created_at,) in connection.execute(
+        select(Internship.created_at).where(Internship.created_at.is_not(None))
+    ):
+        _add(delta, "internships", created_at)
+    for row in connection.execute(
+        select(Application.created_at, Application.status, Application.decided_at)
+        .where(Application.created_at.is_not(None))
+        .execution_options(yield_per=5000)
+    ):
+        _add_application(delta, 1, *row)
+    return delta
+
+
+def _stored(connection) -> Dict[Tuple[str, str, datetime], float]:
+    return {
+        (metric, bucket, start): value
+        for metric, bucket, start, value in connection.execute(
+            select(_rollups.c.metric, _rollups.c.bucket, _rollups.c.bucket_start, _rollups.c.value)
+        )
+    }
+
+
+def rebuild(connection):
+    """
+    Recompute every rollup from the timestamps on the base tables (an
+    application's decision time is its decided_at).
+    """
+    delta = _compute(connection)
+    connection.execute(delete(_rollups))
+    record(connection, delta)
+
+
+def reconcile(connection) -> List[Tuple[Tuple[str, str, datetime], float, float]]:
+    """
+    Rebuild the rollups and return the drift found as
+    [((metric, bucket, bucket_start), stored, actual)].
+    """
+    before = _stored(connection)
+    rebuild(connection)
+    after = _stored(connection)
+    return [
+        (key, before.get(key, 0), after.get(key, 0))
+        for key in sorted(set(before) | set(after))
+        # decision_seconds is a float sum, added up in another order live
+        if not math.isclose(before.get(key, 0), after.get(key, 0), rel_tol=1e-9, abs_tol=1e-6)
+    ]
+
+
+def ensure_rollups():
+    """Build the rollups once if the table is empty (first start, new database)."""
+    with engine.begin() as connection:
+        if connection.execute(select(_rollups.c.metric).limit(1)).first() is None:
+            rebuild(connection)
+
+
+def _reconcile_and_report():
+    with engine.begin() as connection:
+        drift = reconcile(connection)
+    for key, stored, actual in drift:
+        logger.warning("stats rollup %s drifted: stored %s, actual %s", key, stored, actual)
+    return drift
+
+
+_stop = threading.Event()
+_thread = None
+
+
+def _reconcile_loop(interval: int):
+    while not _stop.wait(interval):
+        try:
+            _reconcile_and_report()
+        except Exception:
+            logger.exception("Reconciling stats rollups failed")
+
+
+def start(interval: int = RECONCILE_SECONDS):
+    """Reconcile every interval seconds in a background thread (0 disables)."""
+    global _thread
+    if interval <= 0 or _thread is not None:
+        return
+    _stop.clear()
+    _thread = threading.Thread(target=_reconcile_loop, args=(interval,), name="rollups-reconcile", daemon=True)
+    _thread.start()
+
+
+def shutdown():
+    global _thread
+    if _thread is not None:
+        _stop.set()
+        _thread.join(timeout=10)
+        _thread = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stats rollup maintenance")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("reconcile", help="recompute stats_rollups and report drift")
+    parser.parse_args(argv)
+
+    drift = _reconcile_and_report()
+    for (metric, bucket, start), stored, actual in drift:
+        print(f"{metric} {bucket} {start.isoformat()}: stored {stored:g}, actual {actual:g}")
+    print(f"{len(drift)} rollup(s) drifted")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload
+from typing import List, Optional
+from pydantic import BaseModel, Field
 
-from backend.base import get_db
-from backend.models import Application, Student, Internship
-from backend.matching import calculate_match_score
+from backend import counters, rollups
+from backend.base import get_db, utcnow
+from backend.exporting import export_response
+from backend.pagination import ID_VALUE, MAX_PAGE_SIZE, SCORE_VALUE, decode_cursor, next_cursor, set_cursor_header
+from backend.models import Application, Student, Internship, Company
+from backend.matching import SCORE_VERSION, calculate_match_score
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
@@ -23,6 +30,14 @@ class StatusUpdate(BaseModel):
     status: str  # "pending" | "accepted" | "rejected"
 
 
+class BulkStatusUpdate(BaseModel):
+    status: str
+    # Either explicit ids, or a filter over one internship's applicants
+    ids: Optional[List[int]] = Field(None, max_length=10_000)
+    internshipId: Optional[int] = None
+    maxScore: Optional[float] = None  # only applications scoring below this
+
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
@@ -30,82 +45,197 @@ class StatusUpdate(BaseModel):
 @router.post("/", status_code=status.HTTP_201_CREATED)
 def apply_for_internship(body: ApplicationCreate, db: Session = Depends(get_db)):
     """Student applies for an internship. Calculates match score automatically."""
-    student = db.query(Student).filter(Student.id == body.studentId).first()
-    if not student:
-        raise HTTPException(status_code=404, detail="Student not found")
-
-    internship = db.query(Internship).filter(Internship.id == body.internshipId).first()
-    if not internship:
-        raise HTTPException(status_code=404, detail="Internship not found")
-
-    # Prevent duplicate applications
-    existing = (
-        db.query(Application)
-        .filter(
-            Application.student_id == body.studentId,
-            Application.internship_id == body.internshipId,
-        )
+    pair = (
+        db.query(Student, Internship)
+        .join(Internship, Internship.id == body.internshipId)
+        .filter(Student.id == body.studentId)
+        .options(joinedload(Internship.company).load_only(Company.company_name))
         .first()
     )
-    if existing:
-        raise HTTPException(status_code=409, detail="Already applied to this internship")
+    if pair is None:
+        # Only the error path pays for telling the two apart
+        if db.query(Student.id).filter(Student.id == body.studentId).first() is None:
+            raise HTTPException(status_code=404, detail="Student not found")
+        raise HTTPException(status_code=404, detail="Internship not found")
+    student, internship = pair
 
     score = calculate_match_score(student, internship)
 
-    application = Application(
+    # The unique (student_id, internship_id) index is the duplicate check, so
+    # two concurrent applies cannot both insert
+    now = utcnow()
+    values = dict(
         student_id=body.studentId,
         internship_id=body.internshipId,
         match_score=round(score, 4),
+        score_version=SCORE_VERSION,
         status="pending",
+        created_at=now,
+        updated_at=now,
     )
-    db.add(application)
-    db.commit()
-    db.refresh(application)
+    try:
+        application_id = db.scalar(_insert_ignoring_duplicates(db, values))
+    except IntegrityError:
+        application_id = None
+    if application_id is None:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Already applied to this internship")
+    counters.count_applications(db.connection(), [application_id])
+    rollups.record_created(db.connection(), "applications", 1, now)
 
-    return _serialize(application)
+    # Serialize before commit expires the student and internship just loaded
+    result = _serialize(db.get(Application, application_id))
+    db.commit()
+    return result
 
 
 @router.get("/student/{student_id}")
-def get_student_applications(student_id: int, db: Session = Depends(get_db)):
-    """Return all applications for a given student."""
+def get_student_applications(
+    student_id: int,
+    response: Response,
+    after: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """Return all applications for a given student (paged when after/limit is given)."""
     student = db.query(Student).filter(Student.id == student_id).first()
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
 
-    apps = (
-        db.query(Application)
-        .filter(Application.student_id == student_id)
-        .all()
-    )
+    query = _with_related(db.query(Application)).filter(Application.student_id == student_id)
+    apps = _page(query, response, after, limit)
     return [_serialize(a) for a in apps]
 
 
 @router.get("/")
-def get_all_applications(db: Session = Depends(get_db)):
-    """Return all applications (admin view)."""
-    apps = db.query(Application).all()
-    return [_serialize(a) for a in apps]
+def get_all_applications(
+    response: Response,
+    status: Optional[str] = None,
+    internship_id: Optional[int] = None,
+    company_id: Optional[int] = None,
+    min_score: Optional[float] = Query(None, ge=0, le=1),
+    sort: str = Query("id", pattern="^(id|match_score)$"),
+    after: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """
+    Return applications for the admin view.
+
+    - status / internship_id / company_id / min_score: filters
+    - sort=match_score: best match first (default: id order)
+    - after / limit: keyset paging (next cursor in X-Next-Cursor); without
+      either, every matching application is returned
+    """
+    query = application_rows(db, status, internship_id, company_id, min_score)
+
+    if after is None and limit is None:
+        ordered = by_score(query) if sort == "match_score" else query.order_by(Application.id)
+        return [serialize_row(r) for r in ordered.all()]
+
+    limit = limit or DEFAULT_PAGE_SIZE
+    if sort == "match_score":
+        rows = score_page(query, after, limit)
+        keys = SCORE_KEYS
+    else:
+        query = query.order_by(Application.id)
+        if after is not None:
+            (last_id,) = decode_cursor(after, ID_VALUE)
+            query = query.filter(Application.id > last_id)
+        rows = query.limit(limit + 1).all()
+        keys = (lambda r: r.id,)
+    set_cursor_header(response, next_cursor(rows, limit, *keys))
+    return [serialize_row(r) for r in rows]
+
+
+@router.get("/export")
+def export_applications(
+    fmt: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+    status: Optional[str] = None,
+    internship_id: Optional[int] = None,
+    company_id: Optional[int] = None,
+    min_score: Optional[float] = Query(None, ge=0, le=1),
+    sort: str = Query("id", pattern="^(id|match_score)$"),
+):
+    """Stream every application matching the list filters as CSV or NDJSON."""
+    if status is not None:
+        _check_status(status)  # fail before the stream starts
+
+    def build_query(db: Session):
+        query = application_rows(db, status, internship_id, company_id, min_score)
+        if sort == "match_score":
+            return by_score(query)
+        return query.order_by(Application.id)
+
+    return export_response(build_query, serialize_row, fmt, "applications", EXPORT_COLUMNS)
 
 
 @router.get("/{application_id}")
 def get_application(application_id: int, db: Session = Depends(get_db)):
     """Return a single application by ID."""
-    app = db.query(Application).filter(Application.id == application_id).first()
+    app = _with_related(db.query(Application)).filter(Application.id == application_id).first()
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
     return _serialize(app)
 
 
+@router.patch("/status")
+def bulk_update_status(body: BulkStatusUpdate, db: Session = Depends(get_db)):
+    """
+    Set the status of many applications in one UPDATE.
+
+    Pass ids, or internshipId (optionally with maxScore). Ids that do not
+    exist or already have the target status are reported, not fatal.
+    """
+    _check_status(body.status)
+    if body.ids is None and body.internshipId is None:
+        raise HTTPException(status_code=400, detail="Provide ids or internshipId")
+    if body.ids is not None and (body.internshipId is not None or body.maxScore is not None):
+        raise HTTPException(status_code=400, detail="Use either ids or a filter, not both")
+
+    missing, unchanged = [], []
+    if body.ids is not None:
+        ids = list(dict.fromkeys(body.ids))
+        current = dict(
+            db.query(Application.id, Application.status).filter(Application.id.in_(ids)).all()
+        )
+        missing = [i for i in ids if i not in current]
+        unchanged = [i for i in ids if current.get(i) == body.status]
+        conditions = [Application.id.in_([i for i in ids if i in current and i not in unchanged])]
+    else:
+        # The filter goes into every statement as is, so a large internship's
+        # ids are never loaded or bound one by one
+        conditions = [Application.internship_id == body.internshipId]
+        if body.maxScore is not None:
+            conditions.append(Application.match_score < body.maxScore)
+    conditions.append(Application.status != body.status)
+
+    now = utcnow()
+    connection = db.connection()
+    counters.count_status_change(connection, body.status, *conditions)
+    rollups.record_status_change(connection, body.status, now, *conditions)
+    updated = (
+        db.query(Application)
+        .filter(*conditions)
+        .update(
+            {
+                Application.status: body.status,
+                Application.decided_at: rollups.decided_at_after(body.status, now),
+                Application.updated_at: now,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return {"updated": updated, "missing": missing, "unchanged": unchanged}
+
+
 @router.patch("/{application_id}/status")
 def update_application_status(
     application_id: int, body: StatusUpdate, db: Session = Depends(get_db)
 ):
     """Admin updates the status of an application (accept / reject)."""
-    allowed = {"pending", "accepted", "rejected"}
-    if body.status not in allowed:
-        raise HTTPException(
-            status_code=400, detail=f"status must be one of {allowed}"
-        )
+    _check_status(body.status)
 
     app = db.query(Application).filter(Application.id == application_id).first()
     if not app:
@@ -128,9 +258,189 @@ def delete_application(application_id: int, db: Session = Depends(get_db)):
 
 
 # ---------------------------------------------------------------------------
-# Helper
+# Helpers
 # ---------------------------------------------------------------------------
 
+DEFAULT_PAGE_SIZE = 50
+STATUSES = {"pending", "accepted", "rejected"}
+EXPORT_COLUMNS = [
+    "id", "studentId", "internshipId", "matchScore", "status", "appliedAt",
+    "student.fullName", "student.email", "student.cgpa", "student.skills",
+    "internship.title", "internship.domain", "internship.company",
+]
+
+# Flat projection of an application with the student/internship fields the
+# admin view shows; avoids hydrating three ORM objects per row
+_ROW_COLUMNS = (
+    Application.id,
+    Application.student_id,
+    Application.internship_id,
+    Application.match_score,
+    Application.status,
+    Application.created_at,
+    Student.id.label("student_pk"),
+    Student.full_name.label("student_name"),
+    Student.email.label("student_email"),
+    Student.cgpa.label("student_cgpa"),
+    Student.skills.label("student_skills"),
+    Internship.id.label("internship_pk"),
+    Internship.title.label("internship_title"),
+    Internship.domain.label("internship_domain"),
+    Company.company_name.label("company_name"),
+)
+
+
+def _insert_ignoring_duplicates(db: Session, values: dict):
+    """INSERT ... ON CONFLICT DO NOTHING RETURNING id; returns no row for a duplicate."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        stmt = sqlite_insert(Application).on_conflict_do_nothing(
+            index_elements=["student_id", "internship_id"]
+        )
+    elif dialect == "postgresql":
+        stmt = postgresql_insert(Application).on_conflict_do_nothing(
+            index_elements=["student_id", "internship_id"]
+        )
+    else:
+        # Elsewhere the unique index raises IntegrityError instead
+        stmt = insert(Application)
+    return stmt.values(**values).returning(Application.id)
+
+
+def _check_status(value: str):
+    if value not in STATUSES:
+        raise HTTPException(
+            status_code=400, detail=f"status must be one of {STATUSES}"
+        )
+
+
+def application_rows(
+    db: Session,
+    status: Optional[str] = None,
+    internship_id: Optional[int] = None,
+    company_id: Optional[int] = None,
+    min_score: Optional[float] = None,
+):
+    """Projected, filtered application rows (unordered)."""
+    query = (
+        db.query(*_ROW_COLUMNS)
+        .outerjoin(Student, Student.id == Application.student_id)
+        .outerjoin(Internship, Internship.id == Application.internship_id)
+        .outerjoin(Company, Company.id == Internship.company_id)
+    )
+    if status is not None:
+        _check_status(status)
+        query = query.filter(Application.status == status)
+    if internship_id is not None:
+        query = query.filter(Application.internship_id == internship_id)
+    if company_id is not None:
+        # Walk the company's internships, then each one's applications, so
+        # the cost follows the company's own data
+        query = query.filter(Application.internship_id.in_(
+            select(Internship.id).where(Internship.company_id == company_id)
+        ))
+    if min_score is not None:
+        query = query.filter(Application.match_score >= min_score)
+    return query
+
+
+def by_score(query):
+    """Order query best match first (NULL scores last, ties by id descending)."""
+    return query.order_by(Application.match_score.desc().nulls_last(), Application.id.desc())
+
+
+SCORE_KEYS = (lambda r: r.match_score, lambda r: r.id)
+
+
+def score_page(query, after: Optional[str], limit: int) -> list:
+    """
+    Up to limit + 1 rows of query in by_score order, resuming after the
+    cursor (for next_cursor with SCORE_KEYS).
+
+    Scored rows and the NULL-score tail are read by separate queries: each
+    is then a single range seek on a (..., match_score, id) index, where an
+    OR of the two in one predicate makes the database walk every row of the
+    filtered prefix. The tail is only queried once the scored rows run out.
+    """
+    last_score = last_id = None
+    if after is not None:
+        last_score, last_id = decode_cursor(after, SCORE_VALUE, ID_VALUE)
+
+    rows = []
+    if after is None or last_score is not None:
+        scored = query.filter(Application.match_score.is_not(None))
+        if after is not None:
+            scored = scored.filter(tuple_(Application.match_score, Application.id) < (last_score, last_id))
+        rows = by_score(scored).limit(limit + 1).all()
+    if len(rows) <= limit:
+        unscored = query.filter(Application.match_score.is_(None))
+        if last_score is None and last_id is not None:
+            unscored = unscored.filter(Application.id < last_id)
+        rows += unscored.order_by(Application.id.desc()).limit(limit + 1 - len(rows)).all()
+    return rows
+
+
+def _with_related(query):
+    """Load everything _serialize touches in the same query, and only those columns."""
+    return query.options(
+        joinedload(Application.student).load_only(
+            Student.full_name, Student.email, Student.cgpa, Student.skills
+        ),
+        joinedload(Application.internship)
+        .load_only(Internship.title, Internship.domain, Internship.company_id)
+        .joinedload(Internship.company)
+        .load_only(Company.company_name),
+    )
+
+
+
+def _page(query, response: Response, after: Optional[str], limit: Optional[int]):
+    """
+    Keyset page of query ordered by id, or every row when neither after nor
+    limit is given (the original unpaged behaviour). The cursor for the next
+    page goes in the X-Next-Cursor header so the list body keeps its shape.
+    """
+    query = query.order_by(Application.id)
+    if after is None and limit is None:
+        return query.all()
+
+    limit = limit or DEFAULT_PAGE_SIZE
+    if after is not None:
+        (last_id,) = decode_cursor(after, ID_VALUE)
+        query = query.filter(Application.id > last_id)
+    rows = query.limit(limit + 1).all()
+    set_cursor_header(response, next_cursor(rows, limit, lambda a: a.id))
+    return rows
+
+
+def serialize_row(row) -> dict:
+    """Same shape as _serialize, from an application_rows() row."""
+    result = {
+        "id": row.id,
+        "studentId": row.student_id,
+        "internshipId": row.internship_id,
+        "matchScore": row.match_score,
+        "status": row.status,
+        "appliedAt": row.created_at,
+    }
+    if row.student_pk is not None:
+        result["student"] = {
+            "id": row.student_pk,
+            "fullName": row.student_name,
+            "email": row.student_email,
+            "cgpa": row.student_cgpa,
+            "skills": row.student_skills,
+        }
+    if row.internship_pk is not None:
+        result["internship"] = {
+            "id": row.internship_pk,
+            "title": row.internship_title,
+            "domain": row.internship_domain,
+            "company": row.company_name or "Unknown",
+        }
+    return result
+
+
 def _serialize(app: Application) -> dict:
     result = {
         "id": app.id,
@@ -138,6 +448,7 @@ def _serialize(app: Application) -> dict:
         "internshipId": app.internship_id,
         "matchScore": app.match_score,
         "status": app.status,
+        "appliedAt": app.created_at,
     }
     # Include related data if loaded
     if app.student:
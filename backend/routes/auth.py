@@ -1,67 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, EmailStr
-from typing import Optional
-import hashlib
-import hmac
-import os
-import time
-import base64
-import json
+from typing import Optional, Tuple, Union
 
+from backend import passwords
 from backend.base import get_db
 from backend.models import Student, Company
+from backend.security import Principal, create_token, get_principal
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
-# ---------------------------------------------------------------------------
-# Simple password hashing (SHA-256 + salt) — no extra dependencies needed
-# ---------------------------------------------------------------------------
-
-def _hash_password(password: str) -> str:
-    salt = os.urandom(16).hex()
-    hashed = hashlib.sha256((salt + password).encode()).hexdigest()
-    return f"{salt}:{hashed}"
-
-
-def _verify_password(password: str, stored: str) -> bool:
-    try:
-        salt, hashed = stored.split(":", 1)
-        return hmac.compare_digest(
-            hashlib.sha256((salt + password).encode()).hexdigest(), hashed
-        )
-    except Exception:
-        return False
-
-
-# ---------------------------------------------------------------------------
-# Minimal JWT-like token (base64-encoded JSON payload + HMAC signature)
-# No PyJWT dependency required
-# ---------------------------------------------------------------------------
-
-SECRET_KEY = os.getenv("SECRET_KEY", "internhub-secret-change-in-production")
-TOKEN_TTL = 60 * 60 * 24  # 24 hours
-
-
-def _create_token(payload: dict) -> str:
-    payload["exp"] = int(time.time()) + TOKEN_TTL
-    encoded = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
-    sig = hmac.new(SECRET_KEY.encode(), encoded.encode(), hashlib.sha256).hexdigest()
-    return f"{encoded}.{sig}"
-
-
-def _decode_token(token: str) -> Optional[dict]:
-    try:
-        encoded, sig = token.rsplit(".", 1)
-        expected = hmac.new(SECRET_KEY.encode(), encoded.encode(), hashlib.sha256).hexdigest()
-        if not hmac.compare_digest(sig, expected):
-            return None
-        payload = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
-        if payload.get("exp", 0) < int(time.time()):
-            return None
-        return payload
-    except Exception:
-        return None
+Account = Union[Student, Company]
 
 
 # ---------------------------------------------------------------------------
@@ -82,117 +33,144 @@ class LoginRequest(BaseModel):
 
 # ---------------------------------------------------------------------------
 # Routes
+#
+# These are async so that password hashing can wait on the bounded password
+# pool (backend.passwords) without holding a request thread; their database
+# work runs in the threadpool.
 # ---------------------------------------------------------------------------
 
 @router.post("/register", status_code=status.HTTP_201_CREATED)
-def register(body: RegisterRequest, db: Session = Depends(get_db)):
+async def register(body: RegisterRequest, db: Session = Depends(get_db)):
     """Register a new student or admin (company) account."""
-    if body.userType == "student":
-        existing = db.query(Student).filter(Student.email == body.email).first()
-        if existing:
-            raise HTTPException(status_code=400, detail="Email already registered")
+    if body.userType not in ("student", "admin"):
+        raise HTTPException(status_code=400, detail="userType must be 'student' or 'admin'")
+    # Before hashing, so duplicates do not take a slot in the password pool
+    await run_in_threadpool(_check_email_free, db, body)
+    password_hash = await _kdf(passwords.hash_password_async, body.password)
+    return await run_in_threadpool(_create_account, db, body, password_hash)
 
-        student = Student(
-            email=body.email,
-            full_name=body.fullName,
-            year_of_study=1,
-            cgpa=0.0,
-            skills=[],
-            preferences=[],
-            # Store hashed password in resume_url field temporarily until a
-            # dedicated password_hash column is added via migration.
-            # A proper migration should add a password_hash column.
-        )
-        # We store the password hash in a dedicated attribute if the column exists,
-        # otherwise we skip (resume upload flow creates the student record).
-        if hasattr(Student, "password_hash"):
-            student.password_hash = _hash_password(body.password)
 
-        db.add(student)
-        db.commit()
-        db.refresh(student)
+@router.post("/login")
+async def login(body: LoginRequest, db: Session = Depends(get_db)):
+    """Login for students and admins."""
+    found = await run_in_threadpool(_find_account, db, body.email)
+    if found is None:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    role, account, stored = found
+
+    # Accounts without a password (e.g. created via resume upload) can log in
+    # with any password until one is set
+    if stored and not await _kdf(passwords.verify_password_async, body.password, stored):
+        raise HTTPException(status_code=401, detail="Invalid credentials")
 
-        token = _create_token({"sub": student.id, "role": "student", "email": student.email})
-        return {
-            "token": token,
-            "user": {
+    # Built before the rehash commit expires the account's attributes
+    response = _auth_response(role, account)
+    if stored and passwords.needs_rehash(stored):
+        # Legacy or outdated cost: the plaintext is only available now
+        upgraded = await _kdf(passwords.hash_password_async, body.password)
+        await run_in_threadpool(_store_password_hash, db, account, upgraded)
+    return response
+
+
+@router.get("/me")
+def get_current_user_info(
+    principal: Principal = Depends(get_principal), db: Session = Depends(get_db)
+):
+    """Return the account behind the bearer token (Authorization: Bearer <token>)."""
+    if principal.role == "student":
+        student = db.get(Student, principal.id)
+        if student:
+            return {
                 "id": student.id,
                 "email": student.email,
                 "fullName": student.full_name,
                 "userType": "student",
-            },
-        }
+            }
+    elif principal.role == "admin":
+        company = db.get(Company, principal.id)
+        if company:
+            return {
+                "id": company.id,
+                "email": company.email,
+                "fullName": company.company_name,
+                "userType": "admin",
+            }
+    # Validly signed, but the account no longer exists
+    raise HTTPException(status_code=401, detail="Account not found", headers={"WWW-Authenticate": "Bearer"})
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+async def _kdf(fn, *args):
+    try:
+        return await fn(*args)
+    except passwords.PasswordPoolBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+
 
-    elif body.userType == "admin":
-        existing = db.query(Company).filter(Company.email == body.email).first()
-        if existing:
-            raise HTTPException(status_code=400, detail="Email already registered")
+def _check_email_free(db: Session, body: RegisterRequest):
+    model = Student if body.userType == "student" else Company
+    if db.query(model.id).filter(model.email == body.email).first():
+        raise HTTPException(status_code=400, detail="Email already registered")
 
-        company = Company(
+
+def _create_account(db: Session, body: RegisterRequest, password_hash: str) -> dict:
+    if body.userType == "student":
+        account = Student(
+            email=body.email,
+            full_name=body.fullName,
+            year_of_study=1,
+            cgpa=0.0,
+            skills=[],
+            preferences=[],
+            password_hash=password_hash,
+        )
+    else:
+        account = Company(
             email=body.email,
             company_name=body.fullName,
             industry="",
             description="",
+            password_hash=password_hash,
         )
-        db.add(company)
+    db.add(account)
+    try:
         db.commit()
-        db.refresh(company)
+    except IntegrityError:
+        # Registered by a concurrent request while this one was hashing
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Email already registered")
+    db.refresh(account)
+    return _auth_response(body.userType, account)
 
-        token = _create_token({"sub": company.id, "role": "admin", "email": company.email})
-        return {
-            "token": token,
-            "user": {
-                "id": company.id,
-                "email": company.email,
-                "fullName": company.company_name,
-                "userType": "admin",
-            },
-        }
 
-    else:
-        raise HTTPException(status_code=400, detail="userType must be 'student' or 'admin'")
-
-
-@router.post("/login")
-def login(body: LoginRequest, db: Session = Depends(get_db)):
-    """Login for students and admins."""
-    # Try student first
-    student = db.query(Student).filter(Student.email == body.email).first()
+def _find_account(db: Session, email: str) -> Optional[Tuple[str, Account, Optional[str]]]:
+    # Try student first, then admin/company
+    student = db.query(Student).filter(Student.email == email).first()
     if student:
-        # If password_hash column exists, verify it; otherwise allow login
-        # (accounts created via resume upload have no password yet)
-        if hasattr(Student, "password_hash") and student.password_hash:
-            if not _verify_password(body.password, student.password_hash):
-                raise HTTPException(status_code=401, detail="Invalid credentials")
-        token = _create_token({"sub": student.id, "role": "student", "email": student.email})
-        return {
-            "token": token,
-            "user": {
-                "id": student.id,
-                "email": student.email,
-                "fullName": student.full_name,
-                "userType": "student",
-            },
-        }
-
-    # Try admin/company
-    company = db.query(Company).filter(Company.email == body.email).first()
+        return "student", student, student.password_hash
+    company = db.query(Company).filter(Company.email == email).first()
     if company:
-        token = _create_token({"sub": company.id, "role": "admin", "email": company.email})
-        return {
-            "token": token,
-            "user": {
-                "id": company.id,
-                "email": company.email,
-                "fullName": company.company_name,
-                "userType": "admin",
-            },
-        }
-
-    raise HTTPException(status_code=401, detail="Invalid credentials")
-
-
-@router.get("/me")
-def get_current_user_info(db: Session = Depends(get_db)):
-    """Placeholder — token validation should be done via middleware in production."""
-    return {"message": "Use the token from /auth/login to authenticate requests"}
+        return "admin", company, company.password_hash
+    return None
+
+
+def _store_password_hash(db: Session, account: Account, password_hash: str):
+    account.password_hash = password_hash
+    db.commit()
+
+
+def _auth_response(role: str, account: Account) -> dict:
+    full_name = account.full_name if role == "student" else account.company_name
+    token = create_token({"sub": account.id, "role": role, "email": account.email})
+    return {
+        "token": token,
+        "user": {
+            "id": account.id,
+            "email": account.email,
+            "fullName": full_name,
+            "userType": role,
+        },
+    }
@@ -1,13 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile, status
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session, joinedload, load_only
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+import csv
+import io
+import json
 
+from backend import counters, rollups
 from backend.base import get_db
-from backend.models import Internship, Company
+from backend.caching import conditional_get
+from backend.pagination import ID_VALUE, MAX_PAGE_SIZE, decode_cursor, next_cursor
+from backend.search import apply_search
+from backend.models import Application, Internship, Company, InternshipSkill, Skill
+from backend.routes.applications import SCORE_KEYS, STATUSES, application_rows, score_page, serialize_row
+from backend.skills import normalize_skill_names, resolve_skills
 
 router = APIRouter(prefix="/internships", tags=["internships"])
 
+BULK_BATCH_SIZE = 1000
+BULK_MAX_ROWS = 50_000
+
+# Tables whose changes can alter a listing response
+LISTING_TABLES = ["internships", "companies", "skills"]
+APPLICANT_TABLES = ["applications", "students", "internships", "companies"]
+
 
 # ---------------------------------------------------------------------------
 # Schemas
@@ -39,34 +56,109 @@ class InternshipUpdate(BaseModel):
 # Routes
 # ---------------------------------------------------------------------------
 
-@router.get("/")
-def list_internships(
+def _filter_internships(
+    db: Session,
     domain: Optional[str] = None,
     skill: Optional[str] = None,
-    page: int = 1,
-    limit: int = 10,
-    db: Session = Depends(get_db),
+    skills: Optional[str] = None,
+    match: str = "any",
+    q: Optional[str] = None,
+    company_id: Optional[int] = None,
 ):
-    """List active internships with optional domain/skill filters and pagination."""
+    """
+    Active internships narrowed by the listing filters (shared with the
+    facets route), plus ORDER BY clauses ranking full-text matches.
+    """
     query = db.query(Internship).filter(Internship.is_active == True)
+    ranking = []
+
+    if company_id is not None:
+        query = query.filter(Internship.company_id == company_id)
+
+    if q and q.strip():
+        query, ranking = apply_search(query, db.get_bind().dialect.name, q.strip())
 
     if domain:
         query = query.filter(Internship.domain.ilike(f"%{domain}%"))
 
-    internships = query.all()
-
-    # Apply skill filter in Python (JSON column)
     if skill:
-        skill_lower = skill.lower()
-        internships = [
-            i for i in internships
-            if any(skill_lower in s.lower() for s in (i.required_skills or []))
-        ]
+        # Substring match on the (small) skills table, then an indexed join
+        matching = (
+            select(InternshipSkill.internship_id)
+            .join(Skill, Skill.id == InternshipSkill.skill_id)
+            .where(Skill.name.like(f"%{_escape_like(skill.lower())}%", escape="\\"))
+        )
+        query = query.filter(Internship.id.in_(matching))
+
+    names = normalize_skill_names((skills or "").split(","))
+    if names:
+        matching = (
+            select(InternshipSkill.internship_id)
+            .join(Skill, Skill.id == InternshipSkill.skill_id)
+            .where(Skill.name.in_(names))
+        )
+        if match == "all":
+            matching = matching.group_by(InternshipSkill.internship_id).having(
+                func.count(InternshipSkill.skill_id) == len(names)
+            )
+        query = query.filter(Internship.id.in_(matching))
+
+    return query, ranking
+
+
+@router.get("/")
+def list_internships(
+    request: Request,
+    response: Response,
+    domain: Optional[str] = None,
+    skill: Optional[str] = None,
+    skills: Optional[str] = Query(None, description="Comma-separated skill names"),
+    match: str = Query("any", pattern="^(any|all)$"),
+    q: Optional[str] = Query(None, description="Full-text search over title and description"),
+    company_id: Optional[int] = None,
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Cursor from a previous page's nextCursor"),
+    db: Session = Depends(get_db),
+):
+    """
+    List active internships with optional filters and pagination.
+
+    - skill: substring of any required skill
+    - skills + match: internships requiring any/all of the listed skills
+    - q: full-text search; results are ordered by relevance
+    - company_id: only this company's internships
+    - after: keyset pagination; returns only items/limit/nextCursor and
+      costs the same on every page, unlike page (OFFSET) pagination
+    """
+    not_modified = conditional_get(request, response, db, LISTING_TABLES)
+    if not_modified:
+        return not_modified
+
+    query, ranking = _filter_internships(db, domain, skill, skills, match, q, company_id)
+    query = query.order_by(*ranking, Internship.id)
+    listing = query.options(*_LIST_OPTIONS)
+
+    if after is not None:
+        if ranking:
+            raise HTTPException(
+                status_code=400, detail="Cursor pagination is not supported with q; use page"
+            )
+        (last_id,) = decode_cursor(after, ID_VALUE)
+        rows = listing.filter(Internship.id > last_id).limit(limit + 1).all()
+        cursor = next_cursor(rows, limit, lambda i: i.id)
+        return {
+            "limit": limit,
+            "items": [_serialize(i) for i in rows],
+            "nextCursor": cursor,
+        }
 
-    total = len(internships)
-    start = (page - 1) * limit
-    end = start + limit
-    page_items = internships[start:end]
+    total = query.with_entities(func.count(Internship.id)).order_by(None).scalar()
+    page_items = listing.offset((page - 1) * limit).limit(limit + 1).all()
+    cursor = next_cursor(page_items, limit, lambda i: i.id)
+    if ranking:
+        # Relevance order has no id keyset to continue from
+        cursor = None
 
     return {
         "total": total,
@@ -74,39 +166,109 @@ def list_internships(
         "limit": limit,
         "pages": max(1, -(-total // limit)),  # ceiling division
         "items": [_serialize(i) for i in page_items],
+        "nextCursor": cursor,
     }
 
 
+@router.get("/facets/skills")
+def get_skill_facets(
+    request: Request,
+    response: Response,
+    domain: Optional[str] = None,
+    skill: Optional[str] = None,
+    skills: Optional[str] = None,
+    match: str = Query("any", pattern="^(any|all)$"),
+    q: Optional[str] = None,
+    company_id: Optional[int] = None,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """Number of matching active internships per required skill, most common first."""
+    not_modified = conditional_get(request, response, db, LISTING_TABLES)
+    if not_modified:
+        return not_modified
+
+    query, _ = _filter_internships(db, domain, skill, skills, match, q, company_id)
+    filtered = query.with_entities(Internship.id)
+    count = func.count(InternshipSkill.internship_id)
+    rows = (
+        db.query(Skill.name, count)
+        .join(InternshipSkill, InternshipSkill.skill_id == Skill.id)
+        .filter(InternshipSkill.internship_id.in_(filtered))
+        .group_by(Skill.id, Skill.name)
+        .order_by(count.desc(), Skill.name)
+        .limit(limit)
+        .all()
+    )
+    return [{"skill": name, "count": c} for name, c in rows]
+
+
 @router.get("/{internship_id}")
-def get_internship(internship_id: int, db: Session = Depends(get_db)):
+def get_internship(
+    internship_id: int, request: Request, response: Response, db: Session = Depends(get_db)
+):
     """Get a single internship by ID."""
-    internship = db.query(Internship).filter(Internship.id == internship_id).first()
+    not_modified = conditional_get(request, response, db, ["internships", "companies"])
+    if not_modified:
+        return not_modified
+
+    internship = (
+        db.query(Internship)
+        .options(joinedload(Internship.company).load_only(Company.company_name))
+        .filter(Internship.id == internship_id)
+        .first()
+    )
     if not internship:
         raise HTTPException(status_code=404, detail="Internship not found")
     return _serialize(internship, detailed=True)
 
 
+@router.get("/{internship_id}/applications")
+def rank_applicants(
+    internship_id: int,
+    request: Request,
+    response: Response,
+    status: Optional[str] = None,
+    k: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Top k applicants for one internship by stored match score, best first.
+
+    Optionally restricted to one status; pass nextCursor back as after for
+    the following page. counts holds the number of applications per status.
+    """
+    not_modified = conditional_get(request, response, db, APPLICANT_TABLES)
+    if not_modified:
+        return not_modified
+
+    if db.query(Internship.id).filter(Internship.id == internship_id).first() is None:
+        raise HTTPException(status_code=404, detail="Internship not found")
+
+    rows = score_page(application_rows(db, status=status, internship_id=internship_id), after, k)
+    cursor = next_cursor(rows, k, *SCORE_KEYS)
+
+    counts = dict.fromkeys(sorted(STATUSES), 0)
+    counts.update(
+        db.query(Application.status, func.count())
+        .filter(Application.internship_id == internship_id)
+        .group_by(Application.status)
+        .all()
+    )
+    return {
+        "internshipId": internship_id,
+        "counts": counts,
+        "limit": k,
+        "items": [serialize_row(r) for r in rows],
+        "nextCursor": cursor,
+    }
+
+
 @router.post("/", status_code=status.HTTP_201_CREATED)
 def create_internship(body: InternshipCreate, db: Session = Depends(get_db)):
     """Admin creates a new internship listing."""
-    # If no company_id provided, use the first company or create a placeholder
-    company_id = body.company_id
-    if not company_id:
-        company = db.query(Company).first()
-        if company:
-            company_id = company.id
-        else:
-            # Create a default company so the FK constraint is satisfied
-            default_company = Company(
-                email="admin@internhub.com",
-                company_name="InternHub",
-                industry="Technology",
-                description="Default company",
-            )
-            db.add(default_company)
-            db.commit()
-            db.refresh(default_company)
-            company_id = default_company.id
+    company_id = body.company_id or _default_company_id(db)
 
     internship = Internship(
         company_id=company_id,
@@ -119,12 +281,109 @@ def create_internship(body: InternshipCreate, db: Session = Depends(get_db)):
         domain=body.domain,
         is_active=True,
     )
+    internship.skills = resolve_skills(db, body.required_skills)
     db.add(internship)
     db.commit()
     db.refresh(internship)
     return _serialize(internship, detailed=True)
 
 
+@router.post("/bulk")
+def bulk_import_internships(
+    file: UploadFile = File(...),
+    fmt: Optional[str] = Query(None, alias="format", pattern="^(csv|jsonl)$"),
+    db: Session = Depends(get_db),
+):
+    """
+    Import many internships from a CSV or JSONL file in one transaction.
+
+    Each row is validated like POST /internships/. Invalid rows, and rows
+    naming an unknown company_id, are reported in "errors" by row number and
+    do not stop the rest of the import. In CSV files required_skills is a
+    ";"-separated list.
+    """
+    fmt = fmt or ("jsonl" if (file.filename or "").endswith((".jsonl", ".ndjson")) else "csv")
+    text = io.TextIOWrapper(file.file, encoding="utf-8-sig")
+    rows = _read_jsonl(text) if fmt == "jsonl" else _read_csv(text)
+
+    valid, errors = [], []
+    for row_number, row in rows:
+        if row_number > BULK_MAX_ROWS:
+            raise HTTPException(
+                status_code=413, detail=f"Imports are limited to {BULK_MAX_ROWS} rows"
+            )
+        if isinstance(row, str):
+            errors.append({"row": row_number, "errors": [row]})
+            continue
+        try:
+            valid.append((row_number, InternshipCreate.model_validate(row)))
+        except ValidationError as e:
+            errors.append({
+                "row": row_number,
+                "errors": [f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()],
+            })
+
+    # Resolve every referenced company in one query
+    requested = {body.company_id for _, body in valid if body.company_id}
+    known = {
+        company_id for (company_id,) in
+        db.query(Company.id).filter(Company.id.in_(requested))
+    } if requested else set()
+    default_company_id = None
+
+    to_insert = []
+    for row_number, body in valid:
+        if body.company_id and body.company_id not in known:
+            errors.append({"row": row_number, "errors": [f"company_id: company {body.company_id} not found"]})
+            continue
+        if not body.company_id and default_company_id is None:
+            default_company_id = _default_company_id(db)
+        to_insert.append(body)
+
+    skills_by_name = {
+        s.name: s for s in resolve_skills(db, [n for body in to_insert for n in body.required_skills])
+    }
+    db.flush()
+
+    created = 0
+    for start in range(0, len(to_insert), BULK_BATCH_SIZE):
+        batch = to_insert[start:start + BULK_BATCH_SIZE]
+        ids = db.scalars(
+            insert(Internship).returning(Internship.id, sort_by_parameter_order=True),
+            [
+                {
+                    "company_id": body.company_id or default_company_id,
+                    "title": body.title,
+                    "description": body.description,
+                    "required_skills": body.required_skills,
+                    "min_cgpa": body.min_cgpa,
+                    "min_year": body.min_year,
+                    "positions_available": body.positions_available,
+                    "domain": body.domain,
+                    "is_active": True,
+                }
+                for body in batch
+            ],
+        ).all()
+        links = [
+            {"internship_id": internship_id, "skill_id": skills_by_name[name].id}
+            for internship_id, body in zip(ids, batch)
+            for name in normalize_skill_names(body.required_skills)
+        ]
+        if links:
+            db.execute(insert(InternshipSkill), links)
+        created += len(ids)
+
+    if created:
+        rollups.record_created(db.connection(), "internships", created)
+        counters.count_internships(
+            db.connection(), [(body.company_id or default_company_id, body.domain) for body in to_insert]
+        )
+    db.commit()
+    errors.sort(key=lambda e: e["row"])
+    return {"created": created, "failed": len(errors), "errors": errors}
+
+
 @router.put("/{internship_id}")
 def update_internship(
     internship_id: int, body: InternshipUpdate, db: Session = Depends(get_db)
@@ -136,6 +395,8 @@ def update_internship(
 
     for field, value in body.model_dump(exclude_none=True).items():
         setattr(internship, field, value)
+    if body.required_skills is not None:
+        internship.skills = resolve_skills(db, body.required_skills)
 
     db.commit()
     db.refresh(internship)
@@ -154,9 +415,68 @@ def delete_internship(internship_id: int, db: Session = Depends(get_db)):
 
 
 # ---------------------------------------------------------------------------
-# Helper
+# Helpers
 # ---------------------------------------------------------------------------
 
+# Columns the list serializer reads; the company name comes from the same
+# query instead of one lazy load per row
+_LIST_OPTIONS = (
+    load_only(
+        Internship.id,
+        Internship.title,
+        Internship.company_id,
+        Internship.domain,
+        Internship.required_skills,
+        Internship.is_active,
+    ),
+    joinedload(Internship.company).load_only(Company.company_name),
+)
+
+
+def _default_company_id(db: Session) -> int:
+    """First company, or a placeholder one (flushed, not committed) so the FK is satisfied."""
+    company = db.query(Company.id).order_by(Company.id).first()
+    if company:
+        return company.id
+
+    default_company = Company(
+        email="admin@internhub.com",
+        company_name="InternHub",
+        industry="Technology",
+        description="Default company",
+    )
+    db.add(default_company)
+    db.flush()
+    return default_company.id
+
+
+def _read_csv(text):
+    for row_number, row in enumerate(csv.DictReader(text), start=1):
+        # Blank cells mean "use the default"
+        row = {k.strip(): v.strip() for k, v in row.items() if k and v is not None and v.strip()}
+        if "required_skills" in row:
+            row["required_skills"] = [s.strip() for s in row["required_skills"].split(";") if s.strip()]
+        yield row_number, row
+
+
+def _read_jsonl(text):
+    row_number = 0
+    for line in text:
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield row_number, f"invalid JSON: {e}"
+            continue
+        yield row_number, row if isinstance(row, dict) else "expected a JSON object"
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 def _serialize(i: Internship, detailed: bool = False) -> dict:
     base = {
         "id": i.id,
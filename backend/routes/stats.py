@@ -1,77 +1,178 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from backend.base import get_db
-from backend.models import Student, Internship, Application, Company
+from backend import counters, rollups
+from backend.base import get_db, utcnow
+from backend.caching import conditional_get
+from backend.models import Application, Company
 
 router = APIRouter(prefix="/stats", tags=["stats"])
 
+TIMESERIES_METRICS = ("applications", "internships", "accepted", "rejected", "decisions", "time_to_decision")
+MAX_POINTS = 1000
+
 
 @router.get("/")
-def get_stats(db: Session = Depends(get_db)):
+def get_stats(request: Request, response: Response, db: Session = Depends(get_db)):
     """Return platform-wide statistics for the admin dashboard."""
-    total_students = db.query(Student).count()
-    total_internships = db.query(Internship).filter(Internship.is_active == True).count()
-    total_companies = db.query(Company).count()
-
-    total_applications = db.query(Application).count()
-    pending = db.query(Application).filter(Application.status == "pending").count()
-    accepted = db.query(Application).filter(Application.status == "accepted").count()
-    rejected = db.query(Application).filter(Application.status == "rejected").count()
-
-    # Average match score across all applications
-    apps = db.query(Application).all()
-    avg_score = (
-        round(sum(a.match_score for a in apps if a.match_score) / len(apps) * 100, 1)
-        if apps
-        else 0
+    not_modified = conditional_get(
+        request, response, db, ["students", "internships", "companies", "applications"]
     )
+    if not_modified:
+        return not_modified
+
+    stats = counters.read(db, counters.GLOBAL)
+    return {
+        "students": _count(stats, "students"),
+        "internships": _count(stats, "internships.active"),
+        "companies": _count(stats, "companies"),
+        "applications": _status_counts(stats),
+        "avgMatchScore": _average_score(stats),
+        "topDomains": counters.top_domains(stats),
+    }
+
+
+@router.get("/company/{company_id}")
+def get_company_stats(
+    company_id: int, request: Request, response: Response, db: Session = Depends(get_db)
+):
+    """Return stats for a company's dashboard: its active internships and their applicants."""
+    not_modified = conditional_get(request, response, db, ["internships", "companies", "applications"])
+    if not_modified:
+        return not_modified
 
-    # Top domains by number of active internships
-    internships = db.query(Internship).filter(Internship.is_active == True).all()
-    domain_counts: dict[str, int] = {}
-    for i in internships:
-        if i.domain:
-            domain_counts[i.domain] = domain_counts.get(i.domain, 0) + 1
-    top_domains = sorted(domain_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+    if db.get(Company, company_id) is None:
+        raise HTTPException(status_code=404, detail="Company not found")
 
+    stats = counters.read(db, counters.COMPANY, company_id)
     return {
-        "students": total_students,
-        "internships": total_internships,
-        "companies": total_companies,
-        "applications": {
-            "total": total_applications,
-            "pending": pending,
-            "accepted": accepted,
-            "rejected": rejected,
-        },
-        "avgMatchScore": avg_score,
-        "topDomains": [{"domain": d, "count": c} for d, c in top_domains],
+        "companyId": company_id,
+        "internships": _count(stats, "internships.active"),
+        "applications": _status_counts(stats),
+        "avgMatchScore": _average_score(stats),
+        "topDomains": counters.top_domains(stats),
     }
 
 
 @router.get("/student/{student_id}")
-def get_student_stats(student_id: int, db: Session = Depends(get_db)):
+def get_student_stats(
+    student_id: int, request: Request, response: Response, db: Session = Depends(get_db)
+):
     """Return stats for a specific student's dashboard."""
-    apps = db.query(Application).filter(Application.student_id == student_id).all()
+    not_modified = conditional_get(request, response, db, ["applications", "internships"])
+    if not_modified:
+        return not_modified
 
-    total = len(apps)
-    pending = sum(1 for a in apps if a.status == "pending")
-    accepted = sum(1 for a in apps if a.status == "accepted")
-    rejected = sum(1 for a in apps if a.status == "rejected")
+    stats = counters.read(db, counters.STUDENT, student_id)
+    applications = _status_counts(stats)
 
-    # Best match score this student has
-    scores = [a.match_score for a in apps if a.match_score]
-    best_score = round(max(scores) * 100, 1) if scores else 0
+    # Best match score this student has (a max cannot be kept by deltas; this
+    # walks only the student's own rows, via the unique (student_id,
+    # internship_id) index)
+    best = (
+        db.query(func.max(Application.match_score))
+        .filter(Application.student_id == student_id)
+        .scalar()
+    )
+    best_score = round(best * 100, 1) if best else 0
 
     # Count available internships (potential matches)
-    available = db.query(Internship).filter(Internship.is_active == True).count()
+    available = _count(counters.read(db, counters.GLOBAL), "internships.active")
 
     return {
-        "totalApplications": total,
-        "pending": pending,
-        "accepted": accepted,
-        "rejected": rejected,
+        "totalApplications": applications["total"],
+        "pending": applications["pending"],
+        "accepted": applications["accepted"],
+        "rejected": applications["rejected"],
         "bestMatchScore": best_score,
         "availableInternships": available,
     }
+
+
+@router.get("/timeseries")
+def get_timeseries(
+    request: Request,
+    response: Response,
+    metric: str = Query(..., pattern="^(" + "|".join(TIMESERIES_METRICS) + ")$"),
+    interval: str = Query("day", pattern="^(hour|day)$"),
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+    db: Session = Depends(get_db),
+):
+    """
+    Per-hour or per-day values of a metric between from and to (UTC; default:
+    the last 30 days, or 48 hours for interval=hour), one point per bucket.
+
+    decisions counts accepted + rejected; time_to_decision is the mean number
+    of seconds from application to decision (null for buckets with none).
+    Applications created before timestamps were recorded count in neither.
+    """
+    not_modified = conditional_get(request, response, db, ["applications", "internships"])
+    if not_modified:
+        return not_modified
+
+    step = rollups.BUCKETS[interval]
+    end = _as_utc(end) or utcnow()
+    start = _as_utc(start) or end - (48 * step if interval == "hour" else 30 * step)
+    first = rollups.bucket_start(start, interval)
+    if first >= end:
+        raise HTTPException(status_code=400, detail="from must be before to")
+    if (end - first) / step > MAX_POINTS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_POINTS} points per request")
+
+    def series(name):
+        return rollups.read(db, name, interval, start, end)
+
+    if metric == "decisions" or metric == "time_to_decision":
+        accepted, rejected = series("accepted"), series("rejected")
+        decided = {t: accepted.get(t, 0) + rejected.get(t, 0) for t in accepted.keys() | rejected.keys()}
+        if metric == "decisions":
+            values = decided
+        else:
+            seconds = series("decision_seconds")
+            values = {t: seconds.get(t, 0) / n for t, n in decided.items() if n}
+    else:
+        values = series(metric)
+
+    points = []
+    bucket = first
+    while bucket < end:
+        value = values.get(bucket)
+        if metric != "time_to_decision":
+            value = int(value or 0)
+        points.append({"start": bucket, "value": value})
+        bucket += step
+    return {"metric": metric, "interval": interval, "from": first, "to": end, "points": points}
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _as_utc(moment: Optional[datetime]) -> Optional[datetime]:
+    if moment is not None and moment.tzinfo is not None:
+        return moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def _count(stats: dict, name: str) -> int:
+    return int(stats.get(name, 0))
+
+
+def _status_counts(stats: dict) -> dict:
+    return {
+        "total": _count(stats, "applications"),
+        "pending": _count(stats, "applications.pending"),
+        "accepted": _count(stats, "applications.accepted"),
+        "rejected": _count(stats, "applications.rejected"),
+    }
+
+
+def _average_score(stats: dict):
+    # Mean over all applications, unscored ones counting as 0
+    total = _count(stats, "applications")
+    return round(stats.get("score_sum", 0) / total * 100, 1) if total else 0
@@ -1,51 +1,56 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, status
 from sqlalchemy.orm import Session
-import os
-import shutil
+from starlette.concurrency import run_in_threadpool
+from datetime import datetime
+from functools import partial
 import re
 
-from backend.base import get_db
+from backend import resume_jobs, storage
+from backend.base import get_db, SessionLocal
+from backend.exporting import export_response
 from backend.models import Student
-from backend.resume_parser import process_resume_file
 from backend.matching import find_matches_for_student
 from backend.schemas import StudentUpdate
 
 router = APIRouter(prefix="/students", tags=["students"])
 
-@router.post("/upload-resume/")
-async def upload_resume(file: UploadFile = File(...), db: Session = Depends(get_db)):
-    # Save the file temporarily
-    temp_dir = "temp_resumes"
-    os.makedirs(temp_dir, exist_ok=True)
-    file_path = os.path.join(temp_dir, file.filename)
-    
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-    
+async def _save_upload(file: UploadFile) -> str:
+    """Stream the upload into content-addressed storage and return its key."""
+    try:
+        storage.check_upload(file.filename, file.size)
+        return await run_in_threadpool(storage.store, file.file, file.filename)
+    except storage.UnsupportedFileTypeError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except storage.UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+
+def _estimate_year_of_study(raw_year) -> int:
+    # Calculate year of study (e.g., if 2024 is the current graduation year,
+    # and current year is 2024, they are likely in year 4 or 5)
+    safe_year = 1 # Default
+    current_year = datetime.now().year
+
+    if isinstance(raw_year, int):
+        safe_year = raw_year
+    elif raw_year:
+        # Extract the last 4 digits (likely graduation year)
+        year_match = re.search(r'(\d{4})', str(raw_year))
+        if year_match:
+            grad_year = int(year_match.group(1))
+            # Simple estimate: 4-year degree (grad_year - 4 = start_year)
+            # Current year - start_year = year of study
+            estimated_year = 4 - (grad_year - current_year)
+            safe_year = max(1, min(5, estimated_year))
+    return safe_year
+
+
+def _store_parsed_resume(resume_key: str, resume_data: dict) -> dict:
+    """Create or update the student described by a parsed resume (runs in a worker thread)."""
+    safe_year = _estimate_year_of_study(resume_data.get("year_of_study", ""))
+
+    db = SessionLocal()
     try:
-        # Parse resume
-        resume_data = process_resume_file(file_path)
-        
-        # Calculate year of study (e.g., if 2024 is the current graduation year, 
-        # and current year is 2024, they are likely in year 4 or 5)
-        raw_year = resume_data.get("year_of_study", "")
-        safe_year = 1 # Default
-        
-        from datetime import datetime
-        current_year = datetime.now().year
-        
-        if isinstance(raw_year, int):
-            safe_year = raw_year
-        elif raw_year:
-            # Extract the last 4 digits (likely graduation year)
-            year_match = re.search(r'(\d{4})', str(raw_year))
-            if year_match:
-                grad_year = int(year_match.group(1))
-                # Simple estimate: 4-year degree (grad_year - 4 = start_year)
-                # Current year - start_year = year of study
-                estimated_year = 4 - (grad_year - current_year)
-                safe_year = max(1, min(5, estimated_year))
-                
         # Create or update student
         student = db.query(Student).filter(Student.email == resume_data["email"]).first()
         if not student:
@@ -56,7 +61,7 @@ async def upload_resume(file: UploadFile = File(...), db: Session = Depends(get_
                 cgpa=resume_data.get("cgpa", 0.0),
                 skills=resume_data["skills"],
                 preferences=resume_data["preferences"],
-                resume_url=file_path
+                resume_url=resume_key
             )
             db.add(student)
         else:
@@ -64,21 +69,96 @@ async def upload_resume(file: UploadFile = File(...), db: Session = Depends(get_
             student.skills = resume_data["skills"]
             student.preferences = resume_data["preferences"]
             student.year_of_study = safe_year # Update year as well
-        
+            student.resume_url = resume_key
+
         db.commit()
         db.refresh(student)
-        
+
         return {
-            "message": "Resume processed successfully", 
-            "student_id": student.id, 
+            "student_id": student.id,
             "parsed_data": {**resume_data, "year_of_study": safe_year}
         }
-    
-    except Exception as e:
-        # Cleanup temp file on error
-        if os.path.exists(file_path):
-            os.remove(file_path)
-        raise HTTPException(status_code=500, detail=f"Parsing error: {str(e)}")
+    finally:
+        db.close()
+
+
+def _fill_student_skills(student_id: int, resume_data: dict) -> dict:
+    """Seed an existing student's skills from their resume if they have none yet."""
+    db = SessionLocal()
+    try:
+        student = db.query(Student).filter(Student.id == student_id).first()
+        if student and resume_data.get("skills") and not student.skills:
+            student.skills = resume_data["skills"]
+            db.commit()
+        return {"student_id": student_id, "parsed_data": resume_data}
+    finally:
+        db.close()
+
+
+def _queue_resume(resume_key: str, on_result, student_id: int = None) -> resume_jobs.ResumeJob:
+    try:
+        return resume_jobs.submit(storage.path_for(resume_key), on_result, student_id=student_id)
+    except resume_jobs.QueueFullError as e:
+        # The stored file is left for `python -m backend.storage gc`
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+
+
+@router.post("/upload-resume/", status_code=status.HTTP_202_ACCEPTED)
+async def upload_resume(file: UploadFile = File(...)):
+    # Save the file off the event loop, then parse it in the background
+    resume_key = await _save_upload(file)
+    job = _queue_resume(resume_key, partial(_store_parsed_resume, resume_key))
+
+    return {
+        "message": "Resume queued for processing",
+        "jobId": job.id,
+        "status": job.status,
+    }
+
+@router.get("/resume-jobs/metrics")
+def get_resume_job_metrics():
+    """Queue depth and timing of background resume parsing."""
+    return resume_jobs.metrics()
+
+@router.get("/resume-jobs/{job_id}")
+def get_resume_job(job_id: str):
+    """Poll the status (and parsed output, once finished) of a resume upload."""
+    job = resume_jobs.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Resume job not found")
+    return job.to_dict()
+
+@router.get("/export")
+def export_students(fmt: str = Query("csv", alias="format", pattern="^(csv|ndjson)$")):
+    """Stream every student profile as CSV or NDJSON."""
+    def build_query(db: Session):
+        return db.query(*_EXPORT_COLUMNS).order_by(Student.id)
+
+    return export_response(
+        build_query, _serialize_export_row, fmt, "students",
+        ["id", "email", "fullName", "yearOfStudy", "cgpa", "skills", "preferences",
+         "education", "experience", "isActive"],
+    )
+
+_EXPORT_COLUMNS = (
+    Student.id, Student.email, Student.full_name, Student.year_of_study, Student.cgpa,
+    Student.skills, Student.preferences, Student.education, Student.experience,
+    Student.is_active,
+)
+
+def _serialize_export_row(row) -> dict:
+    return {
+        "id": row.id,
+        "email": row.email,
+        "fullName": row.full_name,
+        "yearOfStudy": row.year_of_study,
+        "cgpa": row.cgpa,
+        "skills": row.skills or [],
+        "preferences": row.preferences or [],
+        "education": row.education or "",
+        "experience": row.experience or "",
+        "isActive": row.is_active,
+    }
 
 @router.get("/{student_id}/matches/")
 def get_matches(student_id: int, threshold: float = 0.5):
@@ -119,27 +199,32 @@ def update_student_profile(student_id: int, profile_update: StudentUpdate, db: S
     db.refresh(student)
     return {"message": "Profile updated successfully"}
 
-@router.post("/{student_id}/resume")
-async def upload_student_resume(student_id: int, file: UploadFile = File(...), db: Session = Depends(get_db)):
-    student = db.query(Student).filter(Student.id == student_id).first()
-    if not student:
+@router.post("/{student_id}/resume", status_code=status.HTTP_202_ACCEPTED)
+async def upload_student_resume(student_id: int, file: UploadFile = File(...)):
+    resume_key = await _save_upload(file)
+    found = await run_in_threadpool(_set_resume_url, student_id, resume_key)
+    if not found:
         raise HTTPException(status_code=404, detail="Student not found")
-        
-    temp_dir = "temp_resumes"
-    os.makedirs(temp_dir, exist_ok=True)
-    file_path = os.path.join(temp_dir, file.filename)
-    
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-        
-    student.resume_url = file_path
-    
+
+    job = _queue_resume(
+        resume_key, partial(_fill_student_skills, student_id), student_id=student_id
+    )
+    return {
+        "message": "Resume uploaded successfully",
+        "resume_url": resume_key,
+        "jobId": job.id,
+        "status": job.status,
+    }
+
+
+def _set_resume_url(student_id: int, resume_key: str) -> bool:
+    db = SessionLocal()
     try:
-        resume_data = process_resume_file(file_path)
-        if resume_data.get("skills") and not student.skills:
-           student.skills = resume_data["skills"]
-    except Exception as e:
-        pass 
-        
-    db.commit()
-    return {"message": "Resume uploaded successfully", "resume_url": file_path}
+        student = db.query(Student).filter(Student.id == student_id).first()
+        if not student:
+            return False
+        student.resume_url = resume_key
+        db.commit()
+        return True
+    finally:
+        db.close()
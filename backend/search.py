@@ -0,0 +1,116 @@
+import re
+from typing import Optional, Tuple
+
+from sqlalchemy import column, func, literal_column, table, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Query
+
+# ---------------------------------------------------------------------------
+# Full-text search over internship titles and descriptions
+#
+# SQLite: an external-content FTS5 table (internships_fts) kept in sync by
+# triggers, ranked with bm25. Postgres: a generated tsvector column with a
+# GIN index, ranked with ts_rank. Both are maintained by the database itself,
+# so every write path (ORM, bulk inserts, raw SQL) stays indexed.
+# ---------------------------------------------------------------------------
+
+SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS internships_fts USING fts5(
+        title, description,
+        content='internships', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS internships_fts_ai AFTER INSERT ON internships BEGIN
+        INSERT INTO internships_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS internships_fts_ad AFTER DELETE ON internships BEGIN
+        INSERT INTO internships_fts(internships_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS internships_fts_au AFTER UPDATE OF title, description ON internships BEGIN
+        INSERT INTO internships_fts(internships_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO internships_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+POSTGRES_DDL = [
+    """
+    ALTER TABLE internships ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_internships_search_vector ON internships USING GIN (search_vector)",
+]
+
+_fts = table("internships_fts", column("rowid"), column("rank"))
+
+
+def ensure_search_index(engine: Engine):
+    """Create the search index for engine's dialect if it does not exist yet."""
+    with engine.begin() as conn:
+        if engine.dialect.name == "sqlite":
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE name = 'internships_fts'")
+            ).first()
+            for ddl in SQLITE_DDL:
+                conn.execute(text(ddl))
+            if not exists:
+                # Index rows written before the FTS table existed
+                conn.execute(text("INSERT INTO internships_fts(internships_fts) VALUES ('rebuild')"))
+        elif engine.dialect.name == "postgresql":
+            for ddl in POSTGRES_DDL:
+                conn.execute(text(ddl))
+
+
+def _fts5_query(q: str) -> Optional[str]:
+    # Quote every term so user input cannot inject FTS5 syntax; the last term
+    # is a prefix so results update while the user is still typing.
+    terms = re.findall(r"\w+", q)
+    if not terms:
+        return None
+    quoted = [f'"{t}"' for t in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def apply_search(query: Query, dialect: str, q: str) -> Tuple[Query, list]:
+    """
+    Restrict an Internship query to rows matching q.
+
+    Returns the filtered query and the ORDER BY clauses that rank results by
+    relevance (best first). Unsupported dialects fall back to ILIKE without
+    ranking.
+    """
+    from backend.models import Internship
+
+    if dialect == "sqlite":
+        match = _fts5_query(q)
+        if match is None:
+            return query, []
+        query = query.join(_fts, _fts.c.rowid == Internship.id).filter(
+            literal_column("internships_fts").op("MATCH")(match)
+        )
+        # FTS5's rank is bm25(), lower is better
+        return query, [_fts.c.rank]
+
+    if dialect == "postgresql":
+        tsquery = func.websearch_to_tsquery("english", q)
+        vector = literal_column("internships.search_vector")
+        query = query.filter(vector.op("@@")(tsquery))
+        return query, [func.ts_rank(vector, tsquery).desc()]
+
+    pattern = f"%{q}%"
+    return query.filter(Internship.title.ilike(pattern) | Internship.description.ilike(pattern)), []
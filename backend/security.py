@@ -0,0 +1,128 @@
+import base64
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+# ---------------------------------------------------------------------------
+# Minimal JWT-like token (base64-encoded JSON payload + HMAC signature)
+# No PyJWT dependency required
+#
+# Verified tokens are kept in a bounded LRU until they expire, so a client
+# that sends the same bearer token on every request pays for the base64,
+# JSON and HMAC work once. Only tokens that verified are cached: a cache hit
+# means this exact string (signature included) was checked before.
+# ---------------------------------------------------------------------------
+
+SECRET_KEY = os.getenv("SECRET_KEY", "internhub-secret-change-in-production")
+TOKEN_TTL = 60 * 60 * 24  # 24 hours
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+
+
+class Principal(NamedTuple):
+    """The authenticated caller, as carried in a verified token."""
+    id: int
+    role: str  # "student" or "admin"
+    email: Optional[str]
+    expires_at: int
+
+
+def create_token(payload: dict) -> str:
+    payload["exp"] = int(time.time()) + TOKEN_TTL
+    encoded = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+    sig = hmac.new(SECRET_KEY.encode(), encoded.encode(), hashlib.sha256).hexdigest()
+    return f"{encoded}.{sig}"
+
+
+def decode_token(token: str) -> Optional[dict]:
+    """The token's payload if the signature matches and it has not expired."""
+    try:
+        encoded, sig = token.rsplit(".", 1)
+        expected = hmac.new(SECRET_KEY.encode(), encoded.encode(), hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(sig, expected):
+            return None
+        payload = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+        if payload.get("exp", 0) < int(time.time()):
+            return None
+        return payload
+    except Exception:
+        return None
+
+
+_verified: "OrderedDict[str, Principal]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _principal(payload: dict) -> Optional[Principal]:
+    try:
+        return Principal(int(payload["sub"]), payload["role"], payload.get("email"), int(payload["exp"]))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def verify_token(token: str) -> Optional[Principal]:
+    """The principal a token authenticates, or None if it is invalid or expired."""
+    now = int(time.time())
+    with _lock:
+        principal = _verified.get(token)
+        if principal is not None:
+            if principal.expires_at >= now:
+                _verified.move_to_end(token)
+                return principal
+            del _verified[token]
+
+    payload = decode_token(token)
+    principal = _principal(payload) if payload is not None else None
+    if principal is None:
+        return None
+    with _lock:
+        _verified[token] = principal
+        while len(_verified) > TOKEN_CACHE_SIZE:
+            _verified.popitem(last=False)
+    return principal
+
+
+def clear_token_cache():
+    """Forget every verified token (e.g. after rotating SECRET_KEY)."""
+    with _lock:
+        _verified.clear()
+
+
+# ---------------------------------------------------------------------------
+# Dependencies
+# ---------------------------------------------------------------------------
+
+_bearer = HTTPBearer(auto_error=False)
+
+# async so FastAPI calls them on the event loop: they do no I/O, and a sync
+# dependency costs a threadpool hop per request
+
+
+async def get_optional_principal(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
+) -> Optional[Principal]:
+    """The caller if a valid bearer token was sent, else None."""
+    if credentials is None:
+        return None
+    return verify_token(credentials.credentials)
+
+
+async def get_principal(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
+) -> Principal:
+    """The caller; 401 without a valid bearer token."""
+    principal = verify_token(credentials.credentials) if credentials is not None else None
+    if principal is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return principal
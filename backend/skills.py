@@ -0,0 +1,142 @@
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List
+
+from spacy.matcher import PhraseMatcher
+from spacy.util import filter_spans
+
+from backend.base import SessionLocal
+from backend.models import Skill
+
+# ---------------------------------------------------------------------------
+# Canonical skill vocabulary
+#
+# Seeded into the skills table and used to build the PhraseMatcher that
+# pulls skills out of resume text. Names are stored lowercase; matching is
+# case-insensitive. Single-letter names (C, R) and "go" are left out because
+# they match ordinary words far more often than skills. Skills added later
+# (e.g. an internship's requirements) are matched only if is_matchable.
+# ---------------------------------------------------------------------------
+
+DEFAULT_SKILLS: Dict[str, str] = {
+    # Programming languages
+    "python": "language", "java": "language", "javascript": "language",
+    "typescript": "language", "c++": "language", "c#": "language",
+    "golang": "language", "rust": "language", "kotlin": "language", "swift": "language",
+    "php": "language", "ruby": "language", "matlab": "language",
+    "scala": "language", "sql": "language", "bash": "language", "html": "language",
+    "css": "language",
+    # Web & mobile
+    "react": "framework", "next.js": "framework", "node.js": "framework",
+    "angular": "framework", "vue": "framework", "django": "framework",
+    "flask": "framework", "fastapi": "framework", "spring boot": "framework",
+    "express": "framework", "tailwind css": "framework", "flutter": "framework",
+    "react native": "framework", "android": "framework", "ios": "framework",
+    "rest api": "framework", "graphql": "framework",
+    # Data & AI
+    "machine learning": "data", "deep learning": "data", "data analysis": "data",
+    "data science": "data", "data visualization": "data",
+    "natural language processing": "data", "computer vision": "data",
+    "statistics": "data", "pandas": "data", "numpy": "data",
+    "scikit-learn": "data", "tensorflow": "data", "pytorch": "data", "keras": "data",
+    "spacy": "data", "power bi": "data", "tableau": "data", "excel": "data",
+    # Databases
+    "postgresql": "database", "mysql": "database", "sqlite": "database",
+    "mongodb": "database", "redis": "database",
+    # Infrastructure & tooling
+    "git": "tools", "github": "tools", "docker": "tools", "kubernetes": "tools",
+    "linux": "tools", "aws": "tools", "azure": "tools", "google cloud": "tools",
+    "ci/cd": "tools", "jira": "tools", "figma": "tools",
+    # Other
+    "cybersecurity": "other", "networking": "other", "embedded systems": "other",
+    "ui/ux design": "other", "project management": "other", "agile": "other",
+    "communication": "soft", "teamwork": "soft", "leadership": "soft",
+    "problem solving": "soft",
+}
+
+
+def is_matchable(name: str) -> bool:
+    """Whether resume text should be searched for name (see DEFAULT_SKILLS)."""
+    return name in DEFAULT_SKILLS or len(name) >= 3
+
+
+def seed_skills(db=None):
+    """Insert any missing default skills into the skills table."""
+    own_session = db is None
+    db = db or SessionLocal()
+    try:
+        existing = {name for (name,) in db.query(Skill.name)}
+        for name, category in DEFAULT_SKILLS.items():
+            if name not in existing:
+                db.add(Skill(name=name, category=category))
+        db.commit()
+    finally:
+        if own_session:
+            db.close()
+
+
+def normalize_skill_names(names) -> List[str]:
+    """Lowercase, trim and dedupe skill names, keeping their order."""
+    seen = []
+    for name in names or []:
+        name = (name or "").strip().lower()
+        if name and name not in seen:
+            seen.append(name)
+    return seen
+
+
+def resolve_skills(db, names) -> List[Skill]:
+    """
+    Return Skill rows for names, creating any that are not in the vocabulary
+    yet. New names are only looked for in resumes if is_matchable.
+    """
+    names = normalize_skill_names(names)
+    if not names:
+        return []
+    by_name = {s.name: s for s in db.query(Skill).filter(Skill.name.in_(names))}
+    for name in names:
+        if name not in by_name:
+            by_name[name] = Skill(name=name)
+            db.add(by_name[name])
+    return [by_name[name] for name in names]
+
+
+def load_skill_vocabulary() -> List[str]:
+    """Matchable skill names from the skills table, falling back to the defaults."""
+    db = SessionLocal()
+    try:
+        names = [
+            name for (name,) in db.query(Skill.name).order_by(Skill.id)
+            if name and is_matchable(name)
+        ]
+    except Exception:
+        names = []
+    finally:
+        db.close()
+    return names or list(DEFAULT_SKILLS)
+
+
+@lru_cache(maxsize=None)
+def _build_matcher(nlp) -> PhraseMatcher:
+    # Built once per process: vocabulary changes need a restart to be picked up
+    matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+    names = load_skill_vocabulary()
+    for name, pattern in zip(names, nlp.tokenizer.pipe(names)):
+        matcher.add(name, [pattern])
+    return matcher
+
+
+def extract_skills(nlp, doc, limit: int = 10) -> List[str]:
+    """
+    Find vocabulary skills in a parsed doc, most frequent first.
+
+    Matches on token text only, so the caller's existing doc is reused
+    rather than tokenizing the text again. Overlapping matches resolve to
+    the longest span, so "machine learning" wins over "learning". Ties keep
+    the order of first appearance.
+    """
+    matcher = _build_matcher(nlp)
+    spans = filter_spans(matcher(doc, as_spans=True))
+
+    counts = Counter(span.label_ for span in sorted(spans, key=lambda s: s.start))
+    return [name for name, _ in counts.most_common(limit)]
@@ -0,0 +1,157 @@
+import argparse
+import hashlib
+import os
+import re
+import tempfile
+import time
+from typing import BinaryIO, List, Optional
+
+from backend.text_extraction import SUPPORTED_EXTENSIONS
+
+# ---------------------------------------------------------------------------
+# Content-addressed resume storage
+#
+# Uploads are streamed to a temp file in chunks while being hashed, then
+# moved to <RESUME_STORAGE_DIR>/<aa>/<sha256><ext>. The returned key
+# ("<sha256><ext>") is what Student.resume_url records, so identical files
+# are stored once and client filenames never touch the filesystem.
+# ---------------------------------------------------------------------------
+
+RESUME_STORAGE_DIR = os.getenv("RESUME_STORAGE_DIR", "temp_resumes")
+RESUME_MAX_BYTES = int(os.getenv("RESUME_MAX_BYTES", str(5 * 1024 * 1024)))
+CHUNK_SIZE = 64 * 1024
+
+_KEY_RE = re.compile(r"^[0-9a-f]{64}\.(pdf|docx)$")
+_TMP_DIR = "tmp"
+
+
+class StorageError(Exception):
+    """Base class for rejected uploads."""
+
+
+class UnsupportedFileTypeError(StorageError):
+    pass
+
+
+class UploadTooLargeError(StorageError):
+    pass
+
+
+def _extension(filename: Optional[str]) -> str:
+    ext = os.path.splitext(filename or "")[1].lower()
+    if ext not in SUPPORTED_EXTENSIONS:
+        raise UnsupportedFileTypeError("Only .pdf and .docx resumes are supported")
+    return ext
+
+
+def path_for(key: str) -> str:
+    """Filesystem path of a stored resume key."""
+    if not _KEY_RE.match(key or ""):
+        raise ValueError(f"Invalid resume key: {key!r}")
+    return os.path.join(RESUME_STORAGE_DIR, key[:2], key)
+
+
+def check_upload(filename: Optional[str], size: Optional[int] = None):
+    """Reject an upload before reading it, when its type or declared size is already wrong."""
+    _extension(filename)
+    if size is not None and size > RESUME_MAX_BYTES:
+        raise UploadTooLargeError(f"Resume exceeds {RESUME_MAX_BYTES} bytes")
+
+
+def store(fileobj: BinaryIO, filename: Optional[str]) -> str:
+    """Stream fileobj into storage and return its content key."""
+    ext = _extension(filename)
+    tmp_dir = os.path.join(RESUME_STORAGE_DIR, _TMP_DIR)
+    os.makedirs(tmp_dir, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+    hasher = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = fileobj.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > RESUME_MAX_BYTES:
+                    raise UploadTooLargeError(f"Resume exceeds {RESUME_MAX_BYTES} bytes")
+                hasher.update(chunk)
+                out.write(chunk)
+
+        key = hasher.hexdigest() + ext
+        dest = path_for(key)
+        if os.path.exists(dest):
+            # Same content already stored; refresh its mtime so the GC grace
+            # period covers this upload until it is linked to a student
+            os.remove(tmp_path)
+            os.utime(dest)
+        else:
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            os.replace(tmp_path, dest)
+        return key
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def collect_garbage(
+    referenced: set, grace_seconds: int = 3600, dry_run: bool = False
+) -> List[str]:
+    """
+    Delete stored files whose key is not in referenced.
+
+    Files younger than grace_seconds are kept so uploads still being parsed
+    (not yet linked to a student) are not removed.
+    """
+    removed = []
+    if not os.path.isdir(RESUME_STORAGE_DIR):
+        return removed
+    cutoff = time.time() - grace_seconds
+
+    for shard in os.listdir(RESUME_STORAGE_DIR):
+        shard_dir = os.path.join(RESUME_STORAGE_DIR, shard)
+        # Only the hashed layout is managed; legacy top-level files are left alone
+        if not os.path.isdir(shard_dir) or not (shard == _TMP_DIR or len(shard) == 2):
+            continue
+        for name in os.listdir(shard_dir):
+            path = os.path.join(shard_dir, name)
+            if shard != _TMP_DIR and name in referenced:
+                continue
+            if os.path.getmtime(path) > cutoff:
+                continue
+            if not dry_run:
+                os.remove(path)
+            removed.append(path)
+    return removed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resume storage maintenance")
+    sub = parser.add_subparsers(dest="command", required=True)
+    gc = sub.add_parser("gc", help="remove stored resumes no student references")
+    gc.add_argument("--grace", type=int, default=3600, help="keep files younger than this many seconds")
+    gc.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    from backend.base import SessionLocal
+    from backend.models import Student
+
+    db = SessionLocal()
+    try:
+        referenced = {
+            url for (url,) in db.query(Student.resume_url).filter(Student.resume_url.isnot(None))
+        }
+    finally:
+        db.close()
+
+    removed = collect_garbage(referenced, grace_seconds=args.grace, dry_run=args.dry_run)
+    verb = "Would remove" if args.dry_run else "Removed"
+    for path in removed:
+        print(f"{verb} {path}")
+    print(f"{verb} {len(removed)} file(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# Plain text extraction for uploaded resumes. Kept free of spaCy so the
+# sandboxed extraction workers stay small.
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+
+
+def extract_text_from_pdf(file_path: str) -> str:
+    """
+    Extract text from PDF file.
+    """
+    from PyPDF2 import PdfReader
+    reader = PdfReader(file_path)
+    text = ""
+    for page in reader.pages:
+        text += page.extract_text()
+    return text
+
+
+def extract_text_from_docx(file_path: str) -> str:
+    """
+    Extract text from DOCX file.
+    """
+    from docx import Document
+    doc = Document(file_path)
+    text = ""
+    for para in doc.paragraphs:
+        text += para.text + "\n"
+    return text
+
+
+def extract_text(file_path: str) -> str:
+    """
+    Extract text from a PDF or DOCX file based on its extension.
+    """
+    if file_path.endswith(".pdf"):
+        return extract_text_from_pdf(file_path)
+    elif file_path.endswith(".docx"):
+        return extract_text_from_docx(file_path)
+    else:
+        raise ValueError("Unsupported file type")
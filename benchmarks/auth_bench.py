@@ -0,0 +1,84 @@
+"""
+Bearer-token authentication benchmark.
+
+Times token verification on its own (full decode vs. a cache hit) and the
+per-request cost of the get_principal dependency, by comparing a route
+that requires a token with an otherwise identical open route:
+
+    python -m benchmarks.auth_bench --requests 500 --rounds 5
+"""
+import argparse
+import time
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from backend import security
+from backend.security import Principal, clear_token_cache, create_token, decode_token, get_principal, verify_token
+
+
+def per_call(fn, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return (time.perf_counter() - start) / count
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/open")
+    def open_route():
+        return {"ok": True}
+
+    @app.get("/private")
+    def private_route(principal: Principal = Depends(get_principal)):
+        return {"ok": True}
+
+    return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=50_000, help="verifications per measurement")
+    parser.add_argument("--requests", type=int, default=500, help="HTTP requests per route and round")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    token = create_token({"sub": 1, "role": "student", "email": "student1@example.com"})
+
+    def uncached():
+        clear_token_cache()
+        verify_token(token)
+
+    decode = per_call(lambda: decode_token(token), args.calls)
+    miss = per_call(uncached, args.calls)
+    verify_token(token)
+    hit = per_call(lambda: verify_token(token), args.calls)
+    print(f"decode_token            {decode * 1e6:8.2f} us")
+    print(f"verify_token (miss)     {miss * 1e6:8.2f} us")
+    print(f"verify_token (hit)      {hit * 1e6:8.2f} us")
+
+    # Routes are timed in interleaved rounds and the best round kept, since
+    # TestClient timings drift over a long run
+    headers = {"Authorization": f"Bearer {token}"}
+    best = {"open": float("inf"), "cached": float("inf"), "decoded": float("inf")}
+    size = security.TOKEN_CACHE_SIZE
+    with TestClient(make_app()) as client:
+        for _ in range(args.rounds):
+            best["open"] = min(best["open"], per_call(lambda: client.get("/open", headers=headers), args.requests))
+            best["cached"] = min(best["cached"], per_call(lambda: client.get("/private", headers=headers), args.requests))
+            security.TOKEN_CACHE_SIZE = 0  # every request decodes
+            try:
+                clear_token_cache()
+                best["decoded"] = min(
+                    best["decoded"], per_call(lambda: client.get("/private", headers=headers), args.requests)
+                )
+            finally:
+                security.TOKEN_CACHE_SIZE = size
+    print(f"request, no auth        {best['open'] * 1e6:8.1f} us")
+    for name in ("cached", "decoded"):
+        print(f"{'request, ' + name + ' token':<24}{best[name] * 1e6:8.1f} us  ({(best[name] - best['open']) * 1e6:+.1f})")
+
+if __name__ == "__main__":
+    main()
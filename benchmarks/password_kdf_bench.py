@@ -0,0 +1,68 @@
+"""
+Password KDF cost benchmark.
+
+Times one scrypt hash at each cost n (r and p as configured) and picks the
+largest n whose median hash time fits a latency budget, then measures how
+many hashes per second the password pool sustains at that cost:
+
+    python -m benchmarks.password_kdf_bench --budget-ms 100
+
+Set the result as PASSWORD_SCRYPT_N; existing hashes are upgraded to it on
+each account's next login.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from backend import passwords
+
+
+def median_ms(n: int, samples: int) -> float:
+    times = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        passwords.hash_password("correct horse battery staple", n=n)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+async def pool_throughput(count: int) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(passwords.hash_password_async("pw") for _ in range(count)))
+    return count / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="target time for one hash")
+    parser.add_argument("--min-log2n", type=int, default=12)
+    parser.add_argument("--max-log2n", type=int, default=18)
+    parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"scrypt r={passwords.SCRYPT_R} p={passwords.SCRYPT_P}, budget {args.budget_ms:g} ms")
+    chosen = None
+    for log2n in range(args.min_log2n, args.max_log2n + 1):
+        n = 2 ** log2n
+        ms = median_ms(n, args.samples)
+        fits = ms <= args.budget_ms
+        print(f"  n=2**{log2n:<3} {ms:8.1f} ms  {128 * n * passwords.SCRYPT_R / 2 ** 20:6.0f} MiB"
+              + ("" if fits else "  over budget"))
+        if not fits:
+            break
+        chosen = n
+
+    if chosen is None:
+        print(f"no n >= 2**{args.min_log2n} fits the budget")
+        return
+    passwords.SCRYPT_N = chosen
+    count = max(4, 2 * passwords.PASSWORD_WORKERS)
+    rate = asyncio.run(pool_throughput(count))
+    passwords.shutdown()
+    print(f"PASSWORD_SCRYPT_N={chosen}: {rate:.1f} hashes/s with "
+          f"PASSWORD_WORKERS={passwords.PASSWORD_WORKERS}")
+
+
+if __name__ == "__main__":
+    main()
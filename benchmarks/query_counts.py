@@ -0,0 +1,113 @@
+"""
+Query-count check for list routes.
+
+Seeds two databases that differ only in row count, calls every list route
+against each and fails if any route issues more SQL statements on the
+larger one, which is how an N+1 lazy load shows up:
+
+    python -m benchmarks.query_counts
+"""
+import os
+import sys
+import tempfile
+
+# Point the app at a scratch database before backend is imported
+_workdir = tempfile.mkdtemp(prefix="query-counts-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_workdir, 'app.db')}"
+
+from contextlib import contextmanager
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+
+from backend.base import Base, get_db
+from backend.main import app
+from backend.search import ensure_search_index
+from benchmarks.seed import seed
+
+ROUTES = [
+    "/internships/?limit=50",
+    "/internships/1",
+    "/internships/?company_id=1&limit=50",
+    "/applications/",
+    "/applications/?limit=50",
+    "/applications/?sort=match_score&limit=50&status=pending",
+    "/applications/?company_id=1&min_score=0.5",
+    "/applications/student/1",
+    "/applications/1",
+    "/internships/1/applications?status=pending&k=20",
+    "/stats/",
+    "/stats/company/1",
+    "/stats/student/1",
+    "/stats/timeseries?metric=time_to_decision",
+]
+
+SIZES = {"small": 1, "large": 10}
+
+
+@contextmanager
+def count_queries(engine):
+    """Collect the SQL statements engine executes inside the block."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def make_database(name: str, scale: int):
+    from sqlalchemy.orm import sessionmaker
+
+    engine = create_engine(f"sqlite:///{os.path.join(_workdir, name)}.db")
+    Base.metadata.create_all(engine)
+    ensure_search_index(engine)
+    seed(engine, companies=5, students=10 * scale, internships=20 * scale, applications=60 * scale)
+    return engine, sessionmaker(bind=engine, autoflush=False)
+
+
+def measure(client: TestClient, engine) -> dict:
+    counts = {}
+    for route in ROUTES:
+        with count_queries(engine) as statements:
+            response = client.get(route)
+        response.raise_for_status()
+        counts[route] = len(statements)
+    return counts
+
+
+def main() -> int:
+    client = TestClient(app)
+    results = {}
+    for name, scale in SIZES.items():
+        engine, Session = make_database(name, scale)
+
+        def override():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = override
+        results[name] = measure(client, engine)
+    app.dependency_overrides.clear()
+
+    failed = False
+    print(f"{'route':<56}" + "".join(f"{name:>8}" for name in SIZES))
+    for route in ROUTES:
+        counts = [results[name][route] for name in SIZES]
+        # Fewer statements on the larger database is fine (e.g. a short page
+        # that also reads the NULL-score tail)
+        flag = "  <- grows with rows" if counts[-1] > counts[0] else ""
+        failed = failed or bool(flag)
+        print(f"{route:<56}" + "".join(f"{c:>8}" for c in counts) + flag)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+Query-plan regression check.
+
+Migrates a scratch SQLite database to head with Alembic (so the check
+covers the indexes the migrations actually create), seeds it, calls each
+route and runs EXPLAIN QUERY PLAN on every SELECT the route issues. Fails
+if a plan reads a whole table or index where no full scan is expected:
+
+    python -m benchmarks.query_plans [-v]
+
+-v prints every plan. Any SCAN counts as a full scan, including a walk of
+a whole index ("SCAN t USING [COVERING] INDEX ...") and a skip-scan over
+an index's leading column ("ANY(col)"). The scans a route cannot avoid are
+listed per route in ROUTES: the unfiltered admin listing reads every
+application, and the domain filter is a substring match no index can seek
+on; the first-page listing walks applications in id order up to its LIMIT.
+Routes in SEEKS must also show the given index range in some plan, e.g. a
+keyset page seeking straight to its cursor. The re-scoring batch (its
+SELECTs and UPDATEs) is checked the same way.
+"""
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+# Point the app at a scratch database before backend is imported
+_workdir = tempfile.mkdtemp(prefix="query-plans-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_workdir, 'app.db')}"
+
+from alembic import command
+from alembic.config import Config
+
+ROOT = Path(__file__).resolve().parent.parent
+command.upgrade(Config(str(ROOT / "alembic.ini")), "head")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+
+from backend import rescoring
+from backend.base import engine
+from backend.main import app
+from backend.pagination import encode_cursor
+from benchmarks.seed import seed
+
+# route -> tables it may scan in full
+ROUTES = {
+    "/internships/?limit=50": set(),
+    # ilike '%domain%' has no prefix to seek on
+    "/internships/?domain=AI&limit=50": {"internships"},
+    "/internships/?company_id=1&limit=50": set(),
+    f"/internships/?after={encode_cursor(100)}&limit=50": set(),
+    "/internships/1": set(),
+    "/internships/1/applications?status=pending&k=20": set(),
+    f"/internships/1/applications?k=20&after={encode_cursor(0.5, 10000)}": set(),
+    f"/internships/1/applications?status=pending&k=20&after={encode_cursor(0.5, 10000)}": set(),
+    "/internships/facets/skills?skills=python": set(),
+    "/applications/": {"applications"},
+    # Walks in primary-key order and stops at the LIMIT
+    "/applications/?limit=50": {"applications"},
+    "/applications/?status=pending&limit=50": set(),
+    "/applications/?sort=match_score&limit=50": set(),
+    "/applications/?sort=match_score&limit=50&status=pending": set(),
+    f"/applications/?sort=match_score&limit=50&after={encode_cursor(0.5, 10000)}": set(),
+    f"/applications/?sort=match_score&limit=50&status=pending&after={encode_cursor(0.5, 10000)}": set(),
+    "/applications/?internship_id=1": set(),
+    "/applications/?company_id=1&min_score=0.5": set(),
+    "/applications/student/1": set(),
+    "/applications/1": set(),
+    "/students/1": set(),
+    "/students/1/matches/": set(),
+    "/stats/": set(),
+    "/stats/company/1": set(),
+    "/stats/student/1": set(),
+    "/stats/timeseries?metric=applications": set(),
+}
+
+# route -> pattern one of its plans must contain
+SEEKS = {
+    f"/internships/1/applications?k=20&after={encode_cursor(0.5, 10000)}":
+        r"ix_applications_internship_score \(internship_id=\? AND match_score>\? AND match_score<\?\)",
+    f"/internships/1/applications?status=pending&k=20&after={encode_cursor(0.5, 10000)}":
+        r"ix_applications_internship_status_score \(internship_id=\? AND status=\? AND match_score>\? AND match_score<\?\)",
+    f"/applications/?sort=match_score&limit=50&after={encode_cursor(0.5, 10000)}":
+        r"ix_applications_match_score \(match_score>\? AND match_score<\?\)",
+    f"/applications/?sort=match_score&limit=50&status=pending&after={encode_cursor(0.5, 10000)}":
+        r"ix_applications_status_match_score \(status=\? AND match_score>\? AND match_score<\?\)",
+    "rescoring batch": r"ix_applications_score_stale \(score_stale=\?\)",
+}
+
+# Tables small or fixed-size enough that a scan is never a regression
+SMALL_TABLES = {"skills", "change_versions", "alembic_version"}
+
+# "SCAN t [USING [COVERING] INDEX ...]" reads the whole table or index, and so
+# does "SEARCH t USING ... (ANY(col) ...)", a skip-scan over the leading column
+_SCAN = re.compile(r"^SCAN (\w+)")
+_SKIP_SCAN = re.compile(r"^SEARCH (\w+) USING .*\(ANY\(")
+
+
+def capture(statements: list, kinds=("SELECT",)):
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(kinds):
+            statements.append((statement, parameters))
+
+    return record
+
+
+def full_scans(plan_rows) -> set:
+    tables = set()
+    for row in plan_rows:
+        match = _SCAN.match(row[-1]) or _SKIP_SCAN.match(row[-1])
+        if match and match.group(1) not in SMALL_TABLES:
+            tables.add(match.group(1))
+    return tables
+
+
+def _mark_and_rescore():
+    with engine.begin() as conn:
+        rescoring.mark_stale(conn, student_ids=[1, 2, 3])
+    return rescoring.rescore_pending
+
+
+# job -> (setup returning the job, statement kinds, tables it may scan)
+JOBS = {
+    "rescoring batch": (_mark_and_rescore, ("SELECT", "UPDATE"), set()),
+}
+
+
+def check(name: str, run, kinds, allowed: set, width: int, verbose: bool) -> bool:
+    statements = []
+    listener = capture(statements, kinds)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        run()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    scanned, details = set(), []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+            scanned |= full_scans(plan)
+            details += [row[-1] for row in plan]
+            if verbose:
+                print(f"  {' '.join(statement.split())[:100]}")
+                for row in plan:
+                    print(f"      {row[-1]}")
+    unexpected = scanned - allowed
+    problems = ["FULL SCAN " + ", ".join(sorted(unexpected))] if unexpected else []
+    seek = SEEKS.get(name)
+    if seek and not any(re.search(seek, detail) for detail in details):
+        problems.append("NO SEEK " + seek)
+    print(f"{name:<{width}}{'; '.join(problems) or 'ok'}")
+    return not problems
+
+
+def main(verbose: bool = False) -> int:
+    seed(engine, companies=20, students=2000, internships=1000, applications=20000)
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+    client = TestClient(app)
+    width = max(map(len, ROUTES)) + 2
+    ok = True
+    for route, allowed in ROUTES.items():
+        ok &= check(route, lambda: client.get(route).raise_for_status(), ("SELECT",), allowed, width, verbose)
+    for name, (setup, kinds, allowed) in JOBS.items():
+        ok &= check(name, setup(), kinds, allowed, width, verbose)
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main(verbose="-v" in sys.argv[1:]))
@@ -0,0 +1,115 @@
+"""
+Synthetic resume corpus for the parser benchmark.
+
+Generates PDF and DOCX resumes of a few sizes from a fixed seed, so runs
+are comparable across machines and commits. PDFs are written by hand (one
+Helvetica text object per page) to avoid a PDF-writing dependency; PyPDF2
+reads them like any other text PDF.
+"""
+import os
+import random
+from typing import List
+
+from backend.skills import DEFAULT_SKILLS
+
+FIRST_NAMES = ["Abebe", "Hana", "Liya", "Samuel", "Meron", "Dawit", "Sara", "Yonas", "Ruth", "Kidist"]
+LAST_NAMES = ["Tesfaye", "Bekele", "Haile", "Girma", "Alemu", "Tadesse", "Mekonnen", "Wolde"]
+DEGREES = ["Bachelor of Science in Computer Science", "BSc Software Engineering", "Master of Data Science"]
+INTERESTS = ["open source", "robotics", "chess", "hiking", "photography", "volunteer tutoring", "music"]
+FILLER = (
+    "Worked with a cross-functional team to design, build and ship features used by "
+    "thousands of users, improving reliability and reducing response times."
+)
+
+# Number of experience/project paragraphs per size
+SIZES = {"short": 2, "medium": 10, "long": 40}
+
+
+def resume_lines(rng: random.Random, paragraphs: int) -> List[str]:
+    skills = rng.sample(sorted(DEFAULT_SKILLS), 12)
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    start = rng.randint(2019, 2023)
+
+    lines = [
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}@example.com | +251 911 000 000",
+        "",
+        "EDUCATION",
+        rng.choice(DEGREES),
+        f"Addis Ababa University, {start} - {start + 4}",
+        f"CGPA: {rng.uniform(2.5, 4.0):.2f}/4.00",
+        "",
+        "SKILLS",
+        ", ".join(skills),
+        "",
+        "EXPERIENCE",
+    ]
+    for i in range(paragraphs):
+        used = ", ".join(rng.sample(skills, 3))
+        lines.append(f"Project {i + 1}: built a service using {used}.")
+        lines.append(FILLER)
+    lines += ["", "INTERESTS", "I am passionate about " + ", ".join(rng.sample(INTERESTS, 3)) + "."]
+    return lines
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(path: str, lines: List[str], lines_per_page: int = 45):
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    # Object layout: 1 catalog, 2 pages, 3 font, then (page, content) pairs
+    objects = {1: b"<< /Type /Catalog /Pages 2 0 R >>", 3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"}
+    kids = []
+    for n, page in enumerate(pages):
+        page_id, content_id = 4 + 2 * n, 5 + 2 * n
+        kids.append(f"{page_id} 0 R")
+        text = "BT /F1 10 Tf 50 800 Td 14 TL\n" + "".join(
+            f"({_pdf_escape(line)}) Tj T*\n" for line in page
+        ) + "ET"
+        stream = text.encode("latin-1", "replace")
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        ).encode()
+        objects[content_id] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = len(out)
+        out += b"%d 0 obj\n%s\nendobj\n" % (obj_id, objects[obj_id])
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for obj_id in sorted(objects):
+        out += b"%010d 00000 n \n" % offsets[obj_id]
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+    with open(path, "wb") as f:
+        f.write(out)
+
+
+def write_docx(path: str, lines: List[str]):
+    from docx import Document
+
+    doc = Document()
+    for line in lines:
+        doc.add_paragraph(line)
+    doc.save(path)
+
+
+def generate_corpus(directory: str, per_size: int = 5, seed: int = 42) -> List[str]:
+    """Write per_size PDF and DOCX resumes for each size and return their paths."""
+    os.makedirs(directory, exist_ok=True)
+    rng = random.Random(seed)
+    paths = []
+    for size, paragraphs in SIZES.items():
+        for i in range(per_size):
+            lines = resume_lines(rng, paragraphs)
+            for ext, writer in ((".pdf", write_pdf), (".docx", write_docx)):
+                path = os.path.join(directory, f"{size}_{i:03d}{ext}")
+                writer(path, lines)
+                paths.append(path)
+    return paths
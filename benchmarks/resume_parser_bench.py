@@ -0,0 +1,142 @@
+"""
+Resume parser benchmark.
+
+Times each stage of resume processing over a synthetic corpus and reports
+per-stage cost, resumes per second and peak RSS:
+
+    python -m benchmarks.resume_parser_bench --per-size 10
+    python -m benchmarks.resume_parser_bench --profile corpus/long_000.pdf --profile-out parse.prof
+
+Text extraction is timed in-process by default; --sandboxed routes it
+through the extraction worker pool instead, as the API does.
+"""
+import argparse
+import cProfile
+import os
+import pstats
+import resource
+import tempfile
+import time
+from collections import defaultdict
+
+import spacy
+
+from backend import extraction_pool, resume_parser
+from backend.skills import extract_skills
+from backend.text_extraction import extract_text
+from benchmarks.resume_corpus import generate_corpus
+
+STAGES = [
+    "extract_text", "spacy", "name", "degree", "cgpa",
+    "skills", "preferences", "email", "year_of_study",
+]
+
+
+def _load_nlp():
+    if resume_parser.nlp is None:
+        print("Warning: en_core_web_sm not installed; timing with a blank English "
+              "pipeline (no NER/POS), so spaCy stages are underestimated.\n")
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        resume_parser.nlp = nlp
+    return resume_parser.nlp
+
+
+def time_stages(path: str, nlp, sandboxed: bool = False) -> dict:
+    timings = {}
+
+    def timed(stage, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        timings[stage] = time.perf_counter() - start
+        return result
+
+    text = timed("extract_text", extraction_pool.extract_text if sandboxed else extract_text, path)
+    doc = timed("spacy", nlp, text)
+    timed("name", resume_parser.extract_name, doc)
+    timed("degree", resume_parser.extract_degree, doc)
+    timed("cgpa", resume_parser.extract_cgpa, text)
+    timed("skills", extract_skills, nlp, doc)
+    timed("preferences", resume_parser.extract_preferences, text)
+    timed("email", resume_parser.extract_email, text)
+    timed("year_of_study", resume_parser.extract_year_of_study, text)
+    return timings
+
+
+def run_benchmark(paths, sandboxed: bool = False, warmup: int = 1):
+    nlp = _load_nlp()
+    for path in paths[:warmup]:
+        time_stages(path, nlp, sandboxed)
+
+    totals = defaultdict(float)
+    by_kind = defaultdict(lambda: [0, 0.0])
+    for path in paths:
+        timings = time_stages(path, nlp, sandboxed)
+        for stage, seconds in timings.items():
+            totals[stage] += seconds
+        size = os.path.basename(path).split("_")[0]
+        kind = f"{size} {os.path.splitext(path)[1]}"
+        by_kind[kind][0] += 1
+        by_kind[kind][1] += sum(timings.values())
+
+    total = sum(totals.values())
+    n = len(paths)
+    print(f"{'stage':<15}{'total s':>10}{'mean ms':>10}{'share':>8}")
+    for stage in STAGES:
+        share = totals[stage] / total * 100 if total else 0
+        print(f"{stage:<15}{totals[stage]:>10.3f}{totals[stage] / n * 1000:>10.2f}{share:>7.1f}%")
+    print(f"{'all':<15}{total:>10.3f}{total / n * 1000:>10.2f}")
+    print()
+    for kind in sorted(by_kind):
+        count, seconds = by_kind[kind]
+        print(f"{kind:<15}{count:>4} files {seconds / count * 1000:>10.2f} ms/resume")
+    print()
+    print(f"Resumes/sec:   {n / total:.1f}" if total else "Resumes/sec:   n/a")
+    # ru_maxrss is KiB on Linux
+    print(f"Peak RSS:      {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB")
+
+
+def profile_file(path: str, out: str = None, top: int = 25):
+    _load_nlp()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    resume_parser.parse_resume(extract_text(path))
+    profiler.disable()
+
+    if out:
+        profiler.dump_stats(out)
+        print(f"Wrote cProfile stats to {out}")
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(top)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="directory of resumes (generated if missing or empty)")
+    parser.add_argument("--per-size", type=int, default=5, help="resumes per size and format to generate")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--sandboxed", action="store_true", help="extract text through the sandboxed worker pool")
+    parser.add_argument("--profile", metavar="FILE", help="cProfile parsing of a single resume instead")
+    parser.add_argument("--profile-out", metavar="PATH", help="write raw cProfile stats here")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        profile_file(args.profile, args.profile_out)
+        return
+
+    corpus = args.corpus or tempfile.mkdtemp(prefix="resume-corpus-")
+    paths = sorted(
+        os.path.join(corpus, name) for name in os.listdir(corpus)
+        if name.endswith((".pdf", ".docx"))
+    ) if os.path.isdir(corpus) else []
+    if not paths:
+        paths = generate_corpus(corpus, per_size=args.per_size, seed=args.seed)
+        print(f"Generated {len(paths)} resumes in {corpus}\n")
+
+    try:
+        run_benchmark(paths, sandboxed=args.sandboxed)
+    finally:
+        extraction_pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Match scoring benchmark.
+
+Scores random (student, internship) pairs one at a time the way the
+original per-pair TfidfVectorizer code did, and in batches with
+score_pairs, then reports throughput and the largest difference between
+the two:
+
+    python -m benchmarks.scoring_bench --pairs 20000 --batch 500
+"""
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from backend.matching import score_pairs
+from backend.skills import DEFAULT_SKILLS
+from benchmarks.seed import DOMAINS
+
+
+def reference_score(student, internship) -> float:
+    """The per-pair scorer score_pairs replaced, kept here as the reference."""
+    score = 0.0
+    student_skills = " ".join(student.skills) if student.skills else ""
+    internship_skills = " ".join(internship.required_skills) if internship.required_skills else ""
+    if student_skills and internship_skills:
+        try:
+            tfidf = TfidfVectorizer().fit_transform([student_skills, internship_skills])
+            score += cosine_similarity(tfidf[0:1], tfidf[1:2])[0][0] * 0.35
+        except ValueError:
+            pass
+    if student.cgpa and internship.min_cgpa:
+        if student.cgpa >= internship.min_cgpa:
+            score += 0.25
+        elif student.cgpa / internship.min_cgpa >= 0.8:
+            score += student.cgpa / internship.min_cgpa * 0.25
+    if student.year_of_study and internship.min_year:
+        if student.year_of_study >= internship.min_year:
+            score += 0.15
+        else:
+            score += student.year_of_study / internship.min_year * 0.15
+    prefs = " ".join(student.preferences) if student.preferences else ""
+    if prefs and internship.domain and internship.domain.lower() in prefs.lower():
+        score += 0.15
+    if student.resume_url:
+        score += 0.10
+    return min(1.0, score)
+
+
+def make_pairs(count: int, seed: int):
+    rng = random.Random(seed)
+    skills = sorted(DEFAULT_SKILLS)
+    students = [
+        SimpleNamespace(
+            skills=rng.sample(skills, rng.randint(0, 8)), cgpa=round(rng.uniform(2.0, 4.0), 2),
+            year_of_study=rng.randint(1, 5), preferences=rng.sample(DOMAINS, 2),
+            resume_url=rng.choice([None, "resume.pdf"]),
+        )
+        for _ in range(count)
+    ]
+    internships = [
+        SimpleNamespace(
+            required_skills=rng.sample(skills, rng.randint(0, 6)), min_cgpa=round(rng.uniform(2.0, 3.5), 1),
+            min_year=rng.randint(1, 4), domain=rng.choice(DOMAINS),
+        )
+        for _ in range(count)
+    ]
+    return students, internships
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=5000)
+    parser.add_argument("--batch", type=int, default=500, help="pairs per score_pairs call")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    students, internships = make_pairs(args.pairs, args.seed)
+
+    start = time.perf_counter()
+    reference = np.array([reference_score(s, i) for s, i in zip(students, internships)])
+    per_pair = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = np.concatenate([
+        score_pairs(students[k:k + args.batch], internships[k:k + args.batch])
+        for k in range(0, args.pairs, args.batch)
+    ])
+    vectorized = time.perf_counter() - start
+
+    rounded = np.count_nonzero(np.round(reference, 4) != np.round(batched, 4))
+    print(f"per pair     {per_pair:8.3f}s  {args.pairs / per_pair:10.0f} pairs/s")
+    print(f"score_pairs  {vectorized:8.3f}s  {args.pairs / vectorized:10.0f} pairs/s")
+    print(f"max |diff| {np.abs(reference - batched).max():.3g}, "
+          f"{rounded} of {args.pairs} differ after rounding to 4 places")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Synthetic data for benchmarks and query checks.
+
+Writes companies, students, internships (with their internship_skills
+links) and applications through Core executemany inserts, so seeding
+100k rows takes seconds, then rebuilds the dashboard counters and the
+time-series rollups. Timestamps are spread over the previous 90 days.
+"""
+import random
+from datetime import timedelta
+
+from sqlalchemy import insert, select
+
+from backend import counters, rollups
+from backend.base import utcnow
+from backend.models import Application, Company, Internship, InternshipSkill, Skill, Student
+from backend.skills import DEFAULT_SKILLS
+
+DOMAINS = ["AI", "Web", "Mobile", "Data", "Security", "Cloud", "Design", "Embedded"]
+STATUSES = ["pending", "pending", "accepted", "rejected"]
+BATCH = 5000
+HISTORY = timedelta(days=90)
+
+
+def _batched(conn, stmt, rows):
+    for start in range(0, len(rows), BATCH):
+        conn.execute(stmt, rows[start:start + BATCH])
+
+
+def seed(
+    engine,
+    companies: int = 5,
+    students: int = 50,
+    internships: int = 100,
+    applications: int = 200,
+    seed: int = 42,
+):
+    """Insert synthetic rows into engine's (empty) database."""
+    rng = random.Random(seed)
+    now = utcnow()
+
+    def moment():
+        return now - HISTORY * rng.random()
+
+    skill_names = sorted(DEFAULT_SKILLS)
+
+    with engine.begin() as conn:
+        skill_ids = {name: id_ for id_, name in conn.execute(select(Skill.id, Skill.name))}
+        missing = [{"name": n, "category": DEFAULT_SKILLS[n]} for n in skill_names if n not in skill_ids]
+        if missing:
+            conn.execute(insert(Skill), missing)
+            skill_ids = {name: id_ for id_, name in conn.execute(select(Skill.id, Skill.name))}
+
+        _batched(conn, insert(Company), [
+            {"id": i, "email": f"company{i}@example.com", "company_name": f"Company {i}",
+             "industry": "Technology", "description": "", "is_active": True}
+            for i in range(1, companies + 1)
+        ])
+        _batched(conn, insert(Student), [
+            {"id": i, "email": f"student{i}@example.com", "full_name": f"Student {i}",
+             "year_of_study": rng.randint(1, 5), "cgpa": round(rng.uniform(2.0, 4.0), 2),
+             "skills": rng.sample(skill_names, 5), "preferences": rng.sample(DOMAINS, 2),
+             "is_active": True}
+            for i in range(1, students + 1)
+        ])
+
+        internship_rows, links = [], []
+        for i in range(1, internships + 1):
+            required = rng.sample(skill_names, 4)
+            domain = rng.choice(DOMAINS)
+            internship_rows.append({
+                "id": i, "company_id": rng.randint(1, companies),
+                "title": f"{domain} Intern {i}",
+                "description": f"Work on {domain.lower()} projects using {', '.join(required)}.",
+                "required_skills": required, "min_cgpa": round(rng.uniform(2.0, 3.5), 1),
+                "min_year": rng.randint(1, 4), "positions_available": rng.randint(1, 5),
+                "domain": domain, "is_active": rng.random() > 0.1,
+                "created_at": (created := moment()), "updated_at": created,
+            })
+            links += [{"internship_id": i, "skill_id": skill_ids[name]} for name in required]
+        _batched(conn, insert(Internship), internship_rows)
+        _batched(conn, insert(InternshipSkill), links)
+
+        pairs = set()
+        while len(pairs) < min(applications, students * internships):
+            pairs.add((rng.randint(1, students), rng.randint(1, internships)))
+        application_rows = []
+        for s, i in sorted(pairs):
+            status, created = rng.choice(STATUSES), moment()
+            decided = created + (now - created) * rng.random() if status != "pending" else None
+            application_rows.append({
+                "student_id": s, "internship_id": i, "match_score": round(rng.random(), 4),
+                "status": status, "created_at": created, "updated_at": decided or created,
+                "decided_at": decided,
+            })
+        _batched(conn, insert(Application), application_rows)
+        # Core inserts bypass the ORM hooks that maintain the dashboard
+        # counters and rollups
+        counters.rebuild(conn)
+        rollups.rebuild(conn)
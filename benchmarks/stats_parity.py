@@ -0,0 +1,215 @@
+"""
+Parity check for the stats routes.
+
+Seeds several databases (including empty ones and rows with missing scores
+or domains), then writes through the real routes: internship create,
+update, soft-delete and import, applies (including a duplicate), single and
+bulk status changes, and withdrawals. Those keep the counters and rollups
+by their incremental paths. It then computes the dashboard numbers the way
+the routes originally did (one COUNT per figure, averages and domain counts
+in Python), compares them with /stats/, /stats/company/{id} and
+/stats/student/{id}, and checks that reconciling the counters and rollups
+finds no drift:
+
+    python -m benchmarks.stats_parity
+"""
+import os
+import random
+import sys
+import tempfile
+
+# Point the app at a scratch database before backend is imported
+_workdir = tempfile.mkdtemp(prefix="stats-parity-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_workdir, 'app.db')}"
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, update
+
+from backend import counters, rollups
+from backend.base import Base, SessionLocal, get_db
+from backend.main import app
+from backend.models import Application, Company, Internship, Student
+from benchmarks.seed import seed
+
+
+def legacy_stats(db) -> dict:
+    total_applications = db.query(Application).count()
+    apps = db.query(Application).all()
+    avg_score = (
+        round(sum(a.match_score for a in apps if a.match_score) / len(apps) * 100, 1)
+        if apps
+        else 0
+    )
+    domain_counts = {}
+    for i in db.query(Internship).filter(Internship.is_active == True).order_by(Internship.id):
+        if i.domain:
+            domain_counts[i.domain] = domain_counts.get(i.domain, 0) + 1
+    top_domains = sorted(domain_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+    return {
+        "students": db.query(Student).count(),
+        "internships": db.query(Internship).filter(Internship.is_active == True).count(),
+        "companies": db.query(Company).count(),
+        "applications": {
+            "total": total_applications,
+            "pending": db.query(Application).filter(Application.status == "pending").count(),
+            "accepted": db.query(Application).filter(Application.status == "accepted").count(),
+            "rejected": db.query(Application).filter(Application.status == "rejected").count(),
+        },
+        "avgMatchScore": avg_score,
+        "topDomains": [{"domain": d, "count": c} for d, c in top_domains],
+    }
+
+
+def legacy_company_stats(db, company_id: int) -> dict:
+    internships = db.query(Internship).filter(Internship.company_id == company_id).all()
+    ids = [i.id for i in internships]
+    apps = db.query(Application).filter(Application.internship_id.in_(ids)).all()
+    domain_counts = {}
+    for i in sorted(internships, key=lambda i: i.id):
+        if i.is_active and i.domain:
+            domain_counts[i.domain] = domain_counts.get(i.domain, 0) + 1
+    top_domains = sorted(domain_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+    return {
+        "companyId": company_id,
+        "internships": sum(1 for i in internships if i.is_active),
+        "applications": {
+            "total": len(apps),
+            "pending": sum(1 for a in apps if a.status == "pending"),
+            "accepted": sum(1 for a in apps if a.status == "accepted"),
+            "rejected": sum(1 for a in apps if a.status == "rejected"),
+        },
+        "avgMatchScore": (
+            round(sum(a.match_score for a in apps if a.match_score) / len(apps) * 100, 1)
+            if apps
+            else 0
+        ),
+        "topDomains": [{"domain": d, "count": c} for d, c in top_domains],
+    }
+
+
+def legacy_student_stats(db, student_id: int) -> dict:
+    apps = db.query(Application).filter(Application.student_id == student_id).all()
+    scores = [a.match_score for a in apps if a.match_score]
+    return {
+        "totalApplications": len(apps),
+        "pending": sum(1 for a in apps if a.status == "pending"),
+        "accepted": sum(1 for a in apps if a.status == "accepted"),
+        "rejected": sum(1 for a in apps if a.status == "rejected"),
+        "bestMatchScore": round(max(scores) * 100, 1) if scores else 0,
+        "availableInternships": db.query(Internship).filter(Internship.is_active == True).count(),
+    }
+
+
+def _messy(engine):
+    # Unscored and zero-scored applications, blank and missing domains
+    with engine.begin() as conn:
+        conn.execute(update(Application).where(Application.id % 5 == 0).values(match_score=None))
+        conn.execute(update(Application).where(Application.id % 7 == 0).values(match_score=0.0))
+        conn.execute(update(Internship).where(Internship.id % 6 == 0).values(domain=None))
+        conn.execute(update(Internship).where(Internship.id % 11 == 0).values(domain=""))
+        counters.rebuild(conn)
+
+
+def _expect(response, *codes):
+    assert response.status_code in codes, f"{response.request.url}: {response.status_code} {response.text}"
+    return response
+
+
+def exercise(client: TestClient, db, sizes: dict):
+    """Write through the routes that maintain counters and rollups incrementally."""
+    rng = random.Random(7)
+    company_id = 1 if sizes["companies"] else None
+
+    created = _expect(client.post("/internships/", json={
+        "title": "Parity Intern", "description": "d", "domain": "Robotics", "company_id": company_id,
+    }), 201).json()["id"]
+    _expect(client.put(f"/internships/{created}", json={"domain": "AI"}), 200)
+    if sizes["internships"] >= 3:
+        _expect(client.put("/internships/2", json={"domain": "Robotics", "company_id": None}), 200)
+        _expect(client.delete("/internships/3"), 204)
+        _expect(client.put("/internships/3", json={"is_active": True}), 200)
+        _expect(client.delete("/internships/1"), 204)
+    rows = "title,description,domain,company_id\nA,d,AI,{c}\nB,d,Web,{c}\nC,d,,{c}\n"
+    _expect(client.post("/internships/bulk", files={"file": ("rows.csv", rows.format(c=company_id or ""))}), 200)
+
+    if not sizes["students"]:
+        return
+    internships = sizes["internships"] + 4
+    for _ in range(30):
+        body = {"studentId": rng.randint(1, sizes["students"]), "internshipId": rng.randint(1, internships)}
+        _expect(client.post("/applications/", json=body), 201, 409)
+    _expect(client.post("/applications/", json=body), 409)
+
+    ids = sorted(i for (i,) in db.query(Application.id))
+    for status in ("accepted", "rejected", "pending", "rejected"):
+        for application_id in rng.sample(ids, min(10, len(ids))):
+            _expect(client.patch(f"/applications/{application_id}/status", json={"status": status}), 200)
+        _expect(client.patch("/applications/status", json={
+            "ids": rng.sample(ids, min(50, len(ids))), "status": status,
+        }), 200)
+        _expect(client.patch("/applications/status", json={
+            "internshipId": rng.randint(1, internships), "maxScore": 0.5, "status": status,
+        }), 200)
+    for application_id in rng.sample(ids, min(5, len(ids))):
+        _expect(client.delete(f"/applications/{application_id}"), 204)
+
+
+SCENARIOS = {
+    "empty": dict(companies=0, students=0, internships=0, applications=0),
+    "no applications": dict(companies=3, students=10, internships=20, applications=0),
+    "small": dict(companies=5, students=50, internships=100, applications=400),
+    "large": dict(companies=20, students=2000, internships=500, applications=20000),
+    "messy": dict(companies=5, students=200, internships=300, applications=3000),
+}
+
+
+def main() -> int:
+    client = TestClient(app)
+    failures = 0
+    for name, sizes in SCENARIOS.items():
+        engine = create_engine(f"sqlite:///{os.path.join(_workdir, name.replace(' ', '_'))}.db")
+        Base.metadata.create_all(engine)
+        seed(engine, **sizes)
+        if name == "messy":
+            _messy(engine)
+
+        def override():
+            # SessionLocal's sessions carry the counter and rollup hooks
+            db = SessionLocal(bind=engine)
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = override
+        with SessionLocal(bind=engine) as db:
+            exercise(client, db, sizes)
+        checks = [("/stats/", legacy_stats)]
+        checks += [
+            (f"/stats/company/{cid}", lambda db, cid=cid: legacy_company_stats(db, cid))
+            for cid in range(1, min(sizes["companies"], 3) + 1)
+        ]
+        checks += [
+            (f"/stats/student/{sid}", lambda db, sid=sid: legacy_student_stats(db, sid))
+            for sid in (1, 2, 3, 999_999)
+        ]
+        with SessionLocal(bind=engine) as db:
+            for route, legacy in checks:
+                expected, actual = legacy(db), client.get(route).json()
+                ok = expected == actual
+                failures += not ok
+                print(f"{'ok' if ok else 'MISMATCH':<9}{name:<16}{route}")
+                if not ok:
+                    print(f"    expected {expected}\n    actual   {actual}")
+        with engine.begin() as conn:
+            drift = counters.reconcile(conn) + rollups.reconcile(conn)
+        failures += bool(drift)
+        print(f"{'ok' if not drift else 'DRIFT':<9}{name:<16}reconcile")
+        for key, stored, actual in drift:
+            print(f"    {key}: stored {stored}, actual {actual}")
+    app.dependency_overrides.clear()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())